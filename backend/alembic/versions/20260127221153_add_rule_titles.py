@@ -29,7 +29,7 @@ def upgrade() -> None:
         sa.Column("custom_title", sa.String(255), nullable=True),
     )
     
-    # Update existing templates with titles (one at a time for asyncpg)
+    # Update existing templates with titles
     updates = [
         ("Team Size Limit", "%maximum of%members%"),
         ("Team Mergers", "%Team mergers%"),
@@ -48,8 +48,37 @@ def upgrade() -> None:
         ("Team Roster Lock", "%cannot be changed after%"),
         ("Final Submission Selection", "%select%submissions for final%"),
     ]
-    for title, pattern in updates:
-        op.execute(f"UPDATE rule_templates SET title = '{title}' WHERE template_text LIKE '{pattern}'")
+    # Load the patterns into a temporary table and classify every template in
+    # one pass. When several patterns match, the later entry wins, matching
+    # the order of the list above.
+    op.execute(
+        "CREATE TEMPORARY TABLE _rule_titles "
+        "(priority INTEGER, title VARCHAR(255), pattern VARCHAR(255))"
+    )
+    rule_titles = sa.table(
+        "_rule_titles",
+        sa.column("priority", sa.Integer),
+        sa.column("title", sa.String),
+        sa.column("pattern", sa.String),
+    )
+    op.bulk_insert(
+        rule_titles,
+        [
+            {"priority": i, "title": title, "pattern": pattern}
+            for i, (title, pattern) in enumerate(updates)
+        ],
+    )
+    op.execute(
+        "UPDATE rule_templates SET title = ("
+        " SELECT t.title FROM _rule_titles t"
+        " WHERE rule_templates.template_text LIKE t.pattern"
+        " ORDER BY t.priority DESC LIMIT 1"
+        ") WHERE EXISTS ("
+        " SELECT 1 FROM _rule_titles t"
+        " WHERE rule_templates.template_text LIKE t.pattern"
+        ")"
+    )
+    op.execute("DROP TABLE _rule_titles")
 
 
 def downgrade() -> None:
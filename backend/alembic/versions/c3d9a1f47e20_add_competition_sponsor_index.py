@@ -0,0 +1,30 @@
+"""Add competition sponsor index for keyset pagination
+
+Revision ID: c3d9a1f47e20
+Revises: add_rule_titles
+Create Date: 2026-02-02 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d9a1f47e20'
+down_revision: Union[str, None] = 'add_rule_titles'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_competitions_sponsor_id_id',
+        'competitions',
+        ['sponsor_id', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_competitions_sponsor_id_id', table_name='competitions')
@@ -0,0 +1,52 @@
+"""Add notification indexes for unread counts and paginated lists
+
+Revision ID: d5e8f1a2b3c4
+Revises: c3d9a1f47e20
+Create Date: 2026-02-09 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e8f1a2b3c4'
+down_revision: Union[str, None] = 'c3d9a1f47e20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Build concurrently so writes to notifications are not blocked meanwhile
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notifications_user_id_unread',
+            'notifications',
+            ['user_id'],
+            unique=False,
+            postgresql_where=sa.text('NOT is_read'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_notifications_user_id_created_at',
+            'notifications',
+            ['user_id', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_notifications_user_id_created_at',
+            table_name='notifications',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_notifications_user_id_unread',
+            table_name='notifications',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,62 @@
+"""Add composite submission indexes and an enrollment competition index
+
+Revision ID: e7a2c4d6f8b1
+Revises: d5e8f1a2b3c4
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a2c4d6f8b1'
+down_revision: Union[str, None] = 'd5e8f1a2b3c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Build concurrently so writes to submissions and enrollments are not blocked meanwhile
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_submissions_competition_id_user_id_created_at',
+            'submissions',
+            ['competition_id', 'user_id', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_submissions_competition_id_status_public_score',
+            'submissions',
+            ['competition_id', 'status', 'public_score'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_enrollments_competition_id',
+            'enrollments',
+            ['competition_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_enrollments_competition_id',
+            table_name='enrollments',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_submissions_competition_id_status_public_score',
+            table_name='submissions',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_submissions_competition_id_user_id_created_at',
+            table_name='submissions',
+            postgresql_concurrently=True,
+        )
@@ -1,81 +1,283 @@
 """API dependencies for dependency injection."""
 
-from fastapi import Depends, HTTPException, status
+import hashlib
+import os
+import time
+from typing import NamedTuple
+
+from fastapi import Depends, File, HTTPException, Request, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
+from src.common.cache import TTLCache
 from src.common.security import decode_access_token
+from src.config import settings
+from src.domain.models.competition import Competition
 from src.domain.models.user import User, UserRole
+from src.domain.services.competition import CompetitionService
+from src.domain.services.faq import FAQService
 from src.infrastructure.database import get_db
+from src.infrastructure.repositories.competition import CompetitionRepository
 from src.infrastructure.repositories.user import UserRepository
 
 security = HTTPBearer()
 
+# Decoded JWT payloads keyed by a digest of the raw token. Entries never
+# outlive the token's own expiry, so a hit is as trustworthy as a fresh decode.
+_token_cache: TTLCache[bytes, dict] = TTLCache(
+    maxsize=10_000,
+    ttl=settings.access_token_expire_minutes * 60,
+)
+
+
+# HMAC verification takes microseconds, so HS* tokens are decoded inline; a
+# threadpool hop would cost more than it saves. Asymmetric algorithms are slow
+# enough to stall the event loop and are verified in a worker thread instead.
+_DECODE_INLINE = settings.jwt_algorithm.upper().startswith("HS")
+
+
+async def _decode_token(token: str) -> dict | None:
+    """Decode a JWT, skipping signature verification for recently seen tokens."""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    if _DECODE_INLINE:
+        payload = decode_access_token(token)
+    else:
+        payload = await run_in_threadpool(decode_access_token, token)
+    if payload is not None:
+        remaining = payload.get("exp", 0) - time.time()
+        if remaining > 0:
+            _token_cache.set(key, payload, ttl=remaining)
+    return payload
+
+
+# Column snapshots of recently authenticated users, keyed by user ID. The TTL
+# is short so changes made through other workers still apply within seconds.
+_user_cache: TTLCache[int, dict] = TTLCache(maxsize=5_000, ttl=10)
+
+_USER_COLUMNS = tuple(attr.key for attr in inspect(User).column_attrs)
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop a user's cached snapshot after their account has changed."""
+    _user_cache.pop(user_id)
+
+
+async def _load_user(db: AsyncSession, user_id: int) -> User | None:
+    """Load a user, attaching a cached snapshot to the session when possible."""
+    existing = db.identity_map.get(db.identity_key(User, user_id))
+    if existing is not None:
+        return existing
+
+    snapshot = _user_cache.get(user_id)
+    if snapshot is not None:
+        # Rebuild the instance as if it had just been loaded, then attach it
+        # to this request's session without emitting a SELECT.
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return await db.merge(user, load=False)
+
+    user_repo = UserRepository(db)
+    user = await user_repo.get_by_id(user_id)
+    if user is not None:
+        _user_cache.set(user_id, {key: getattr(user, key) for key in _USER_COLUMNS})
+    return user
+
+
+async def resolve_token_user(token: str, db: AsyncSession) -> User | None:
+    """Return the active user a bearer token authenticates, or None if it doesn't."""
+    payload = await _decode_token(token)
+    if payload is None or payload.get("sub") is None:
+        return None
+
+    user = await _load_user(db, int(payload["sub"]))
+    if user is None or not user.is_active:
+        return None
+    return user
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """Get the current authenticated user from the JWT token."""
-    token = credentials.credentials
-    payload = decode_access_token(token)
+    user = await resolve_token_user(credentials.credentials, db)
 
-    if payload is None:
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user_id = payload.get("sub")
-    if user_id is None:
+    return user
+
+
+async def get_current_active_user(
+    current_user: User = Depends(get_current_user),
+) -> User:
+    """Ensure the current user is active."""
+    return current_user
+
+
+async def require_sponsor(current_user: User = Depends(get_current_user)) -> User:
+    """Require the sponsor role (admins are also allowed)."""
+    if current_user.role is not UserRole.SPONSOR and not current_user.is_admin:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload",
-            headers={"WWW-Authenticate": "Bearer"},
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Role 'sponsor' required",
         )
+    return current_user
 
-    user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(int(user_id))
 
-    if user is None:
+async def require_admin(current_user: User = Depends(get_current_user)) -> User:
+    """Require the admin role."""
+    if not current_user.is_admin:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required",
         )
+    return current_user
 
-    if not user.is_active:
+
+async def get_competition_service(db: AsyncSession = Depends(get_db)) -> CompetitionService:
+    """Provide a CompetitionService bound to the request's session."""
+    return CompetitionService(db)
+
+
+async def get_faq_service(db: AsyncSession = Depends(get_db)) -> FAQService:
+    """Provide a FAQService bound to the request's session."""
+    return FAQService(db)
+
+
+class CompetitionRef(NamedTuple):
+    """Identifying fields of a competition, enough to scope and authorize requests."""
+
+    id: int
+    slug: str
+    sponsor_id: int
+    max_team_size: int
+
+
+# Competition references keyed by slug. These fields only change through the
+# update route, which invalidates its entry; other workers catch up within the TTL.
+# Only reads are served from here: a write must not be scoped to a competition
+# that another worker has already deleted.
+_competition_refs: TTLCache[str, CompetitionRef] = TTLCache(maxsize=5_000, ttl=30)
+
+
+def invalidate_competition(slug: str) -> None:
+    """Drop a competition's cached reference after its slug, owner or team size changed."""
+    _competition_refs.pop(slug)
+
+
+def _check_competition_owner(sponsor_id: int, user: User) -> None:
+    """Raise 403 unless the user is the competition's sponsor or an admin."""
+    if sponsor_id != user.id and not user.is_admin:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User account is disabled",
-            headers={"WWW-Authenticate": "Bearer"},
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to manage this competition",
         )
 
-    return user
 
+async def get_competition_by_slug(
+    slug: str,
+    db: AsyncSession = Depends(get_db),
+) -> Competition:
+    """Get the competition named by the `slug` path parameter or raise 404.
 
-async def get_current_active_user(
+    Only the row's columns are loaded. The competition's reference is cached
+    as a side effect, since viewing a competition is usually followed by
+    requests for its sub-resources.
+    """
+    competition = await CompetitionRepository(db).get_by_slug(slug)
+    if competition is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Competition not found",
+        )
+
+    _competition_refs.set(
+        slug,
+        CompetitionRef(
+            competition.id,
+            competition.slug,
+            competition.sponsor_id,
+            competition.max_team_size,
+        ),
+    )
+    return competition
+
+
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+async def get_competition_ref(
+    slug: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> CompetitionRef:
+    """Resolve the `slug` path parameter to a competition reference or raise 404.
+
+    Use this instead of get_competition_by_slug when only the competition's
+    ID is needed, e.g. for routes that operate on its files, FAQs, rules,
+    submissions or teams. Reads may be served from the cache; writes always
+    look the competition up so they never reference a deleted one.
+    """
+    if request.method in _SAFE_METHODS:
+        ref = _competition_refs.get(slug)
+        if ref is not None:
+            return ref
+
+    row = await CompetitionRepository(db).get_ref_by_slug(slug)
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Competition not found",
+        )
+
+    ref = CompetitionRef(*row)
+    _competition_refs.set(slug, ref)
+    return ref
+
+
+async def require_competition_ref_owner(
     current_user: User = Depends(get_current_user),
-) -> User:
-    """Ensure the current user is active."""
-    return current_user
+    competition: CompetitionRef = Depends(get_competition_ref),
+) -> CompetitionRef:
+    """Require the current user to be the competition's sponsor or an admin."""
+    _check_competition_owner(competition.sponsor_id, current_user)
+    return competition
 
 
-def require_role(required_role: UserRole):
-    """Dependency factory that requires a specific role."""
+_IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".webp"})
+_IMAGE_EXTENSIONS_DETAIL = f"File must be an image ({', '.join(sorted(_IMAGE_EXTENSIONS))})"
 
-    async def role_checker(current_user: User = Depends(get_current_user)) -> User:
-        if current_user.role != required_role and current_user.role != UserRole.ADMIN:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Role '{required_role.value}' required",
-            )
-        return current_user
 
-    return role_checker
+async def validate_image_upload(file: UploadFile = File(...)) -> UploadFile:
+    """Reject uploads that are not named as PNG, JPEG, or WebP images.
+
+    The content itself is checked by magic bytes when the image is stored.
+    """
+    if file.filename and os.path.splitext(file.filename)[1].lower() not in _IMAGE_EXTENSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_IMAGE_EXTENSIONS_DETAIL,
+        )
+    return file
 
 
-# Convenience dependencies for common role checks
-require_sponsor = require_role(UserRole.SPONSOR)
-require_admin = require_role(UserRole.ADMIN)
+async def validate_csv_upload(file: UploadFile = File(...)) -> UploadFile:
+    """Reject uploads that are not named as CSV files."""
+    if file.filename and os.path.splitext(file.filename)[1] != ".csv":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be a CSV file",
+        )
+    return file
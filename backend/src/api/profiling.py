@@ -0,0 +1,57 @@
+"""On-demand request profiling for diagnosing slow endpoints."""
+
+from starlette.datastructures import Headers, QueryParams
+from starlette.responses import HTMLResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.dependencies import resolve_token_user
+from src.infrastructure.database import async_session_factory
+
+
+class ProfilingMiddleware:
+    """ASGI middleware that profiles a request when ``?profile=1`` is given.
+
+    Only active admins can trigger a profile; everyone else gets the normal
+    response. The profiled response body is discarded and replaced with the
+    pyinstrument HTML report. Requires the optional ``pyinstrument`` package.
+    """
+
+    def __init__(self, app: ASGIApp, interval: float = 0.001) -> None:
+        self.app = app
+        self.interval = interval
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or QueryParams(scope["query_string"]).get("profile") not in ("1", "true")
+            or not await self._is_admin(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # Imported here so the package is only needed when profiling is enabled
+        from pyinstrument import Profiler
+
+        async def discard(message: Message) -> None:
+            pass
+
+        # A fresh profiler per request; sharing one across concurrent requests
+        # makes them stop each other's sessions.
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, discard)
+        finally:
+            profiler.stop()
+
+        await HTMLResponse(profiler.output_html())(scope, receive, send)
+
+    async def _is_admin(self, scope: Scope) -> bool:
+        """Check whether the request carries a token for an active admin."""
+        scheme, _, token = Headers(scope=scope).get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return False
+
+        async with async_session_factory() as session:
+            user = await resolve_token_user(token, session)
+            return user is not None and user.is_admin
@@ -0,0 +1,27 @@
+"""Response classes shared by the API routes."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+
+
+def dump_json(content: Any) -> bytes:
+    """Encode content with the options every API response uses."""
+    return orjson.dumps(
+        content,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z,
+    )
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """orjson response that renders UTC datetimes the way pydantic does.
+
+    Routes pass it plain ``model_dump()`` output and let orjson encode the
+    datetimes and enums natively, rather than having pydantic stringify
+    every value first. ``OPT_UTC_Z`` keeps UTC timestamps ending in ``Z``, so
+    the JSON is byte-for-byte what ``model_dump(mode="json")`` produced.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
@@ -3,14 +3,15 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_current_user
+from src.api.dependencies import invalidate_user, require_admin
+from src.api.responses import ORJSONResponse
 from src.api.schemas.admin import (
     PlatformStatsResponse,
     UserSummaryResponse,
     UserRoleUpdateRequest,
     AdminActionResponse,
-    AdminCompetitionResponse,
 )
+from src.api.schemas.competition import CompetitionResponse
 from src.domain.models.user import User, UserRole
 from src.domain.models.competition import CompetitionStatus
 from src.domain.services.admin import AdminService
@@ -19,16 +20,6 @@ from src.infrastructure.database import get_db
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
-def require_admin(current_user: User = Depends(get_current_user)) -> User:
-    """Dependency that requires admin role."""
-    if current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required",
-        )
-    return current_user
-
-
 @router.get("/stats", response_model=PlatformStatsResponse)
 async def get_platform_stats(
     admin: User = Depends(require_admin),
@@ -69,21 +60,7 @@ async def list_users(
         is_active=is_active,
     )
 
-    return [
-        UserSummaryResponse(
-            id=u.id,
-            email=u.email,
-            username=u.username,
-            display_name=u.display_name,
-            role=u.role,
-            is_active=u.is_active,
-            created_at=u.created_at,
-            last_login=u.last_login,
-            competition_count=u.competition_count,
-            submission_count=u.submission_count,
-        )
-        for u in users
-    ]
+    return [UserSummaryResponse.model_validate(u) for u in users]
 
 
 @router.get("/users/{user_id}", response_model=UserSummaryResponse)
@@ -102,18 +79,7 @@ async def get_user(
             detail="User not found",
         )
 
-    return UserSummaryResponse(
-        id=user.id,
-        email=user.email,
-        username=user.username,
-        display_name=user.display_name,
-        role=user.role,
-        is_active=user.is_active,
-        created_at=user.created_at,
-        last_login=user.last_login,
-        competition_count=user.competition_count,
-        submission_count=user.submission_count,
-    )
+    return UserSummaryResponse.model_validate(user)
 
 
 @router.post("/users/{user_id}/suspend", response_model=AdminActionResponse)
@@ -126,6 +92,7 @@ async def suspend_user(
     service = AdminService(db)
     try:
         await service.suspend_user(user_id, admin)
+        invalidate_user(user_id)
         return AdminActionResponse(message="User suspended successfully")
     except ValueError as e:
         raise HTTPException(
@@ -144,6 +111,7 @@ async def reactivate_user(
     service = AdminService(db)
     try:
         await service.reactivate_user(user_id, admin)
+        invalidate_user(user_id)
         return AdminActionResponse(message="User reactivated successfully")
     except ValueError as e:
         raise HTTPException(
@@ -163,6 +131,7 @@ async def change_user_role(
     service = AdminService(db)
     try:
         await service.change_user_role(user_id, data.role, admin)
+        invalidate_user(user_id)
         return AdminActionResponse(message=f"User role changed to {data.role.value}")
     except ValueError as e:
         raise HTTPException(
@@ -171,7 +140,7 @@ async def change_user_role(
         )
 
 
-@router.get("/competitions", response_model=list[AdminCompetitionResponse])
+@router.get("/competitions", response_model=list[CompetitionResponse])
 async def list_all_competitions(
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=50, ge=1, le=100),
@@ -187,26 +156,12 @@ async def list_all_competitions(
         status=status,
     )
 
-    return [
-        AdminCompetitionResponse(
-            id=c.id,
-            title=c.title,
-            slug=c.slug,
-            description=c.description,
-            short_description=c.short_description,
-            status=c.status,
-            sponsor_id=c.sponsor_id,
-            start_date=c.start_date,
-            end_date=c.end_date,
-            is_public=c.is_public,
-            max_team_size=c.max_team_size,
-            daily_submission_limit=c.daily_submission_limit,
-            evaluation_metric=c.evaluation_metric,
-            created_at=c.created_at,
-            updated_at=c.updated_at,
-        )
-        for c in competitions
-    ]
+    return ORJSONResponse(
+        [
+            CompetitionResponse.from_competition(c).model_dump()
+            for c in competitions
+        ]
+    )
 
 
 @router.post("/threads/{thread_id}/lock", response_model=AdminActionResponse)
@@ -1,14 +1,38 @@
 """Competition routes."""
 
-import io
-import zipfile
-
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
-from fastapi.responses import StreamingResponse
+import hashlib
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import RedirectResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_current_user, require_sponsor
+from src.api.dependencies import (
+    CompetitionRef,
+    get_competition_by_slug,
+    get_competition_ref,
+    get_competition_service,
+    get_current_user,
+    get_faq_service,
+    invalidate_competition,
+    require_competition_ref_owner,
+    require_sponsor,
+    validate_csv_upload,
+    validate_image_upload,
+)
+from src.api.responses import ORJSONResponse, dump_json
 from src.api.schemas.competition import (
+    COMPETITION_LIST_ADAPTER,
     CompetitionCreate,
     CompetitionListResponse,
     CompetitionResponse,
@@ -17,8 +41,12 @@ from src.api.schemas.competition import (
 from src.api.schemas.competition_file import (
     CompetitionFileResponse,
     CompetitionFileUpdate,
+    CompetitionFileUploadCommit,
+    CompetitionFileUploadRequest,
+    CompetitionFileUploadTicket,
 )
 from src.api.schemas.data_dictionary import (
+    DATA_DICTIONARY_ENTRIES_ADAPTER,
     ColumnInfoResponse,
     DataDictionaryBulkUpdate,
     DataDictionaryEntryResponse,
@@ -26,6 +54,7 @@ from src.api.schemas.data_dictionary import (
 )
 from src.api.schemas.faq import FAQCreate, FAQResponse, FAQUpdate, FAQReorderRequest
 from src.api.schemas.rules import (
+    COMPETITION_RULES_ADAPTER,
     CompetitionRuleCreate,
     CompetitionRuleResponse,
     RuleBulkUpdate,
@@ -33,7 +62,9 @@ from src.api.schemas.rules import (
     RulesDisplayResponse,
     RuleTemplateResponse,
 )
-from src.domain.models.user import User, UserRole
+from src.common.cache import TTLCache
+from src.domain.models.competition import Competition
+from src.domain.models.user import User
 from src.domain.services.competition import CompetitionService
 from src.domain.services.competition_file import CompetitionFileService
 from src.domain.services.data_dictionary import DataDictionaryService
@@ -43,11 +74,66 @@ from src.infrastructure.database import get_db
 
 router = APIRouter(prefix="/competitions", tags=["Competitions"])
 
+# Encoded CSV previews keyed by (file_path, max_rows). Every upload is stored
+# under a fresh storage key and file content is never rewritten in place, so
+# an entry can't go stale; deleted files 404 before the cache is consulted.
+_preview_cache: TTLCache[tuple[str, int], bytes] = TTLCache(maxsize=256, ttl=3600)
+
+_LIST_CACHE_CONTROL = "public, max-age=30, stale-while-revalidate=300"
+
+
+def _check_page_params(skip: int, before: int | None) -> None:
+    """Reject requests that mix offset and keyset pagination."""
+    if skip and before is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either skip or before, not both",
+        )
+
+
+def _page_headers(
+    request: Request, competitions: list[Competition], skip: int, limit: int
+) -> dict[str, str]:
+    """Build the Link header for the next page of a newest-first listing.
+
+    Offset paging (skip) still works but is deprecated, since deep offsets
+    make the database scan and discard every skipped row.
+    """
+    headers = {}
+    if skip:
+        headers["Deprecation"] = "true"
+    if len(competitions) == limit:
+        next_url = request.url.remove_query_params("skip").include_query_params(
+            before=competitions[-1].id, limit=limit
+        )
+        headers["Link"] = f'<{next_url}>; rel="next"'
+    return headers
+
+
+def _list_response(competitions: list[Competition], headers: dict[str, str]) -> Response:
+    """Serialize a competition listing straight to JSON bytes."""
+    items = [CompetitionListResponse.from_competition(c) for c in competitions]
+    return Response(
+        COMPETITION_LIST_ADAPTER.dump_json(items),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def _competition_response(
+    competition: Competition, status_code: int = status.HTTP_200_OK
+) -> ORJSONResponse:
+    """Serialize a single competition without re-validating the ORM row."""
+    return ORJSONResponse(
+        CompetitionResponse.from_competition(competition).model_dump(),
+        status_code=status_code,
+    )
+
 
 @router.post("/", response_model=CompetitionResponse, status_code=status.HTTP_201_CREATED)
 async def create_competition(
     data: CompetitionCreate,
-    db: AsyncSession = Depends(get_db),
+    service: CompetitionService = Depends(get_competition_service),
     current_user: User = Depends(require_sponsor),
 ):
     """Create a new competition. Requires sponsor or admin role."""
@@ -57,78 +143,78 @@ async def create_competition(
             detail="End date must be after start date",
         )
 
-    service = CompetitionService(db)
     competition = await service.create(data, current_user)
-    return CompetitionResponse.from_orm_with_extras(competition)
+    return _competition_response(competition, status.HTTP_201_CREATED)
 
 
 @router.get("/", response_model=list[CompetitionListResponse])
 async def list_competitions(
-    skip: int = Query(default=0, ge=0),
+    request: Request,
+    skip: int = Query(default=0, ge=0, description="Deprecated; use before"),
     limit: int = Query(default=20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    before: int | None = Query(default=None, ge=1),
+    if_none_match: str | None = Header(default=None),
+    service: CompetitionService = Depends(get_competition_service),
 ):
-    """List active public competitions."""
-    service = CompetitionService(db)
-    competitions = await service.list_active(skip=skip, limit=limit)
-    return [CompetitionListResponse.from_orm_with_thumbnail(c) for c in competitions]
+    """List active public competitions, newest first.
+
+    Pages are chained by passing the last ID seen as ``before``; the URL of
+    the next page is returned in the Link header.
+
+    The listing is the same for every caller, so it is marked cacheable and
+    tagged with an ETag derived from the active competitions' last update.
+    """
+    _check_page_params(skip, before)
+
+    count, last_updated = await service.active_listing_version()
+    version = f"{count}:{last_updated}:{skip}:{limit}:{before}"
+    etag = f'"{hashlib.blake2b(version.encode(), digest_size=8).hexdigest()}"'
+    headers = {"Cache-Control": _LIST_CACHE_CONTROL, "ETag": etag}
+
+    if if_none_match is not None and etag in if_none_match:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    competitions = await service.list_active(skip=skip, limit=limit, before=before)
+    headers.update(_page_headers(request, competitions, skip, limit))
+    return _list_response(competitions, headers)
 
 
 @router.get("/mine", response_model=list[CompetitionListResponse])
 async def list_my_competitions(
-    skip: int = Query(default=0, ge=0),
+    request: Request,
+    skip: int = Query(default=0, ge=0, description="Deprecated; use before"),
     limit: int = Query(default=20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    before: int | None = Query(default=None, ge=1),
+    service: CompetitionService = Depends(get_competition_service),
     current_user: User = Depends(get_current_user),
 ):
-    """List competitions created by the current user."""
-    service = CompetitionService(db)
-    competitions = await service.list_by_sponsor(current_user.id, skip=skip, limit=limit)
-    return [CompetitionListResponse.from_orm_with_thumbnail(c) for c in competitions]
+    """List competitions created by the current user, newest first.
+
+    Pages are chained the same way as the public listing.
+    """
+    _check_page_params(skip, before)
+
+    competitions = await service.list_by_sponsor(
+        current_user.id, skip=skip, limit=limit, before=before
+    )
+    return _list_response(competitions, _page_headers(request, competitions, skip, limit))
 
 
 @router.get("/{slug}", response_model=CompetitionResponse)
 async def get_competition(
-    slug: str,
-    db: AsyncSession = Depends(get_db),
+    competition: Competition = Depends(get_competition_by_slug),
 ):
     """Get a competition by slug."""
-    service = CompetitionService(db)
-    competition = await service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
-    return CompetitionResponse.from_orm_with_extras(competition)
+    return _competition_response(competition)
 
 
 @router.patch("/{slug}", response_model=CompetitionResponse)
 async def update_competition(
-    slug: str,
     data: CompetitionUpdate,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    service: CompetitionService = Depends(get_competition_service),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
 ):
     """Update a competition. Only the sponsor or admin can update."""
-    service = CompetitionService(db)
-    competition = await service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
-    # Check permissions
-    if competition.sponsor_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to update this competition",
-        )
-
     # Validate dates if both are being updated
     if data.start_date and data.end_date and data.end_date <= data.start_date:
         raise HTTPException(
@@ -136,129 +222,86 @@ async def update_competition(
             detail="End date must be after start date",
         )
 
-    competition = await service.update(competition, data)
-    return CompetitionResponse.from_orm_with_extras(competition)
+    updated = await service.update(competition.id, competition.slug, data)
+    invalidate_competition(competition.slug)
+    if updated is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Competition not found",
+        )
+
+    return _competition_response(updated)
 
 
 @router.delete("/{slug}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_competition(
-    slug: str,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    service: CompetitionService = Depends(get_competition_service),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
 ):
     """Delete a competition. Only the sponsor or admin can delete."""
-    service = CompetitionService(db)
-    competition = await service.get_by_slug(slug)
-
-    if competition is None:
+    deleted = await service.delete(competition.id)
+    invalidate_competition(competition.slug)
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Competition not found",
         )
 
-    # Check permissions
-    if competition.sponsor_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to delete this competition",
-        )
-
-    await service.delete(competition)
-
 
 @router.post("/{slug}/truth-set", response_model=CompetitionResponse)
 async def upload_truth_set(
-    slug: str,
-    file: UploadFile = File(...),
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    file: UploadFile = Depends(validate_csv_upload),
+    service: CompetitionService = Depends(get_competition_service),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
 ):
     """Upload a truth set CSV for scoring submissions.
 
     Only the sponsor or admin can upload a truth set.
     The CSV must have 'id' and 'target' columns.
     """
-    service = CompetitionService(db)
-    competition = await service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
-    # Check permissions
-    if competition.sponsor_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to upload a truth set for this competition",
-        )
-
-    # Validate file type
-    if file.filename and not file.filename.endswith(".csv"):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File must be a CSV file",
-        )
-
     try:
-        competition = await service.upload_truth_set(competition, file)
+        updated = await service.upload_truth_set(competition.id, file)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
 
-    return CompetitionResponse.from_orm_with_extras(competition)
+    if updated is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Competition not found",
+        )
+
+    return _competition_response(updated)
 
 
 @router.post("/{slug}/thumbnail", response_model=CompetitionResponse)
 async def upload_thumbnail(
-    slug: str,
-    file: UploadFile = File(...),
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    file: UploadFile = Depends(validate_image_upload),
+    service: CompetitionService = Depends(get_competition_service),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
 ):
     """Upload a thumbnail image for the competition.
 
     Only the sponsor or admin can upload a thumbnail.
     Accepts PNG, JPG, JPEG, and WebP images (max 5MB).
     """
-    service = CompetitionService(db)
-    competition = await service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
-    # Check permissions
-    if competition.sponsor_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to upload a thumbnail for this competition",
-        )
-
-    # Validate file type
-    allowed_extensions = {".png", ".jpg", ".jpeg", ".webp"}
-    if file.filename:
-        ext = "." + file.filename.rsplit(".", 1)[-1].lower() if "." in file.filename else ""
-        if ext not in allowed_extensions:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"File must be an image ({', '.join(allowed_extensions)})",
-            )
-
     try:
-        competition = await service.upload_thumbnail(competition, file)
+        updated = await service.upload_thumbnail(competition.id, file)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
 
-    return CompetitionResponse.from_orm_with_extras(competition)
+    if updated is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Competition not found",
+        )
+
+    return _competition_response(updated)
 
 
 # ============================================================================
@@ -268,149 +311,63 @@ async def upload_thumbnail(
 
 @router.get("/{slug}/faqs", response_model=list[FAQResponse])
 async def list_faqs(
-    slug: str,
-    db: AsyncSession = Depends(get_db),
+    competition: CompetitionRef = Depends(get_competition_ref),
+    faq_service: FAQService = Depends(get_faq_service),
 ):
     """List all FAQs for a competition."""
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
-    faq_service = FAQService(db)
     return await faq_service.list_by_competition(competition.id)
 
 
 @router.post("/{slug}/faqs", response_model=FAQResponse, status_code=status.HTTP_201_CREATED)
 async def create_faq(
-    slug: str,
     data: FAQCreate,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    faq_service: FAQService = Depends(get_faq_service),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
 ):
     """Create a new FAQ entry. Only the sponsor or admin can create FAQs."""
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
-    # Check permissions
-    if competition.sponsor_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to manage FAQs for this competition",
-        )
-
-    faq_service = FAQService(db)
     return await faq_service.create(competition.id, data)
 
 
 @router.patch("/{slug}/faqs/{faq_id}", response_model=FAQResponse)
 async def update_faq(
-    slug: str,
     faq_id: int,
     data: FAQUpdate,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    faq_service: FAQService = Depends(get_faq_service),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
 ):
     """Update a FAQ entry. Only the sponsor or admin can update FAQs."""
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
-    # Check permissions
-    if competition.sponsor_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to manage FAQs for this competition",
-        )
-
-    faq_service = FAQService(db)
-    faq = await faq_service.get_by_id(faq_id)
+    faq = await faq_service.update(competition.id, faq_id, data)
 
-    if faq is None or faq.competition_id != competition.id:
+    if faq is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="FAQ not found",
         )
 
-    return await faq_service.update(faq, data)
+    return faq
 
 
 @router.delete("/{slug}/faqs/{faq_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_faq(
-    slug: str,
     faq_id: int,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    faq_service: FAQService = Depends(get_faq_service),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
 ):
     """Delete a FAQ entry. Only the sponsor or admin can delete FAQs."""
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
-    # Check permissions
-    if competition.sponsor_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to manage FAQs for this competition",
-        )
-
-    faq_service = FAQService(db)
-    faq = await faq_service.get_by_id(faq_id)
-
-    if faq is None or faq.competition_id != competition.id:
+    if not await faq_service.delete(competition.id, faq_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="FAQ not found",
         )
 
-    await faq_service.delete(faq)
-
 
 @router.post("/{slug}/faqs/reorder", response_model=list[FAQResponse])
 async def reorder_faqs(
-    slug: str,
     data: FAQReorderRequest,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    faq_service: FAQService = Depends(get_faq_service),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
 ):
     """Reorder FAQ entries. Only the sponsor or admin can reorder FAQs."""
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
-    # Check permissions
-    if competition.sponsor_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to manage FAQs for this competition",
-        )
-
-    faq_service = FAQService(db)
     return await faq_service.reorder(competition.id, data.faq_ids)
 
 
@@ -421,19 +378,10 @@ async def reorder_faqs(
 
 @router.get("/{slug}/files", response_model=list[CompetitionFileResponse])
 async def list_files(
-    slug: str,
+    competition: CompetitionRef = Depends(get_competition_ref),
     db: AsyncSession = Depends(get_db),
 ):
     """List all files for a competition."""
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
     file_service = CompetitionFileService(db)
     return await file_service.list_by_competition(competition.id)
 
@@ -444,12 +392,11 @@ async def list_files(
     status_code=status.HTTP_201_CREATED,
 )
 async def upload_file(
-    slug: str,
     file: UploadFile = File(...),
     display_name: str | None = None,
     purpose: str | None = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
 ):
     """Upload a file for a competition.
 
@@ -457,30 +404,75 @@ async def upload_file(
     Allowed file types: csv, json, txt, md, pdf, zip, gz, tar, parquet, pkl, npy, npz
     Maximum file size: 100MB
     """
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
+    file_service = CompetitionFileService(db)
 
-    if competition is None:
+    try:
+        return await file_service.upload(
+            competition_id=competition.id,
+            file=file,
+            display_name=display_name,
+            purpose=purpose,
+        )
+    except ValueError as e:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.post("/{slug}/files/init", response_model=CompetitionFileUploadTicket)
+async def init_file_upload(
+    data: CompetitionFileUploadRequest,
+    db: AsyncSession = Depends(get_db),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
+):
+    """Start a direct upload of a competition file to S3.
+
+    Only the sponsor or admin can upload files. Returns a pre-signed form
+    the client posts the file to, bypassing the API. Once the upload is
+    done, record it with POST /{slug}/files/commit.
+    Requires S3 storage with S3_PRESIGNED_UPLOADS enabled.
+    """
+    file_service = CompetitionFileService(db)
+
+    try:
+        ticket = await file_service.create_direct_upload(competition.id, data.filename)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
 
-    # Check permissions
-    if competition.sponsor_id != current_user.id and current_user.role != UserRole.ADMIN:
+    if ticket is None:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to upload files for this competition",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Direct uploads are not enabled",
         )
+    return ticket
+
+
+@router.post(
+    "/{slug}/files/commit",
+    response_model=CompetitionFileResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def commit_file_upload(
+    data: CompetitionFileUploadCommit,
+    db: AsyncSession = Depends(get_db),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
+):
+    """Record a competition file uploaded directly to S3.
 
+    Only the sponsor or admin can upload files.
+    """
     file_service = CompetitionFileService(db)
 
     try:
-        return await file_service.upload(
-            competition=competition,
-            file=file,
-            display_name=display_name,
-            purpose=purpose,
+        return await file_service.commit_direct_upload(
+            competition_id=competition.id,
+            storage_key=data.storage_key,
+            display_name=data.display_name,
+            purpose=data.purpose,
         )
     except ValueError as e:
         raise HTTPException(
@@ -491,21 +483,12 @@ async def upload_file(
 
 @router.get("/{slug}/files/download-all")
 async def download_all_files(
-    slug: str,
+    competition: CompetitionRef = Depends(get_competition_ref),
     db: AsyncSession = Depends(get_db),
 ):
     """Download all competition files as a zip archive."""
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
     file_service = CompetitionFileService(db)
-    files = await file_service.list_by_competition(competition.id)
+    files = await file_service.list_archive_members(competition.id)
 
     if not files:
         raise HTTPException(
@@ -513,22 +496,10 @@ async def download_all_files(
             detail="No files available for this competition",
         )
 
-    # Create zip archive in memory
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        for competition_file in files:
-            try:
-                content = await file_service.get_download_content(competition_file)
-                zip_file.writestr(competition_file.filename, content)
-            except FileNotFoundError:
-                # Skip files that don't exist in storage
-                continue
-
-    zip_buffer.seek(0)
     zip_filename = f"{competition.slug}-data.zip"
 
     return StreamingResponse(
-        zip_buffer,
+        file_service.stream_archive(files),
         media_type="application/zip",
         headers={
             "Content-Disposition": f'attachment; filename="{zip_filename}"',
@@ -538,76 +509,65 @@ async def download_all_files(
 
 @router.get("/{slug}/files/{file_id}")
 async def download_file(
-    slug: str,
     file_id: int,
+    competition: CompetitionRef = Depends(get_competition_ref),
     db: AsyncSession = Depends(get_db),
 ):
     """Download a competition file."""
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
+    file_service = CompetitionFileService(db)
+    competition_file = await file_service.get_by_id(competition.id, file_id)
 
-    if competition is None:
+    if competition_file is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
+            detail="File not found",
         )
 
-    file_service = CompetitionFileService(db)
-    competition_file = await file_service.get_by_id(file_id)
+    media_type = competition_file.file_type or "application/octet-stream"
+    content_disposition = f'attachment; filename="{competition_file.filename}"'
 
-    if competition_file is None or competition_file.competition_id != competition.id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="File not found",
+    # Let nginx or S3 send the bytes when the deployment supports it
+    internal_path = file_service.get_internal_redirect(competition_file)
+    if internal_path is not None:
+        return Response(
+            media_type=media_type,
+            headers={
+                "X-Accel-Redirect": internal_path,
+                "Content-Disposition": content_disposition,
+            },
         )
 
+    presigned_url = await file_service.get_presigned_download_url(competition_file)
+    if presigned_url is not None:
+        return RedirectResponse(presigned_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+
     try:
-        content = await file_service.get_download_content(competition_file)
+        chunks = await file_service.open_download_stream(competition_file)
     except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="File not found in storage",
         )
 
-    return StreamingResponse(
-        io.BytesIO(content),
-        media_type=competition_file.file_type or "application/octet-stream",
-        headers={
-            "Content-Disposition": f'attachment; filename="{competition_file.filename}"',
-            "Content-Length": str(len(content)),
-        },
-    )
+    headers = {"Content-Disposition": content_disposition}
+    if competition_file.file_size is not None:
+        headers["Content-Length"] = str(competition_file.file_size)
+
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
 
 
 @router.patch("/{slug}/files/{file_id}", response_model=CompetitionFileResponse)
 async def update_file(
-    slug: str,
     file_id: int,
     data: CompetitionFileUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
 ):
     """Update a file's metadata. Only the sponsor or admin can update files."""
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
-    # Check permissions
-    if competition.sponsor_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to manage files for this competition",
-        )
-
     file_service = CompetitionFileService(db)
-    competition_file = await file_service.get_by_id(file_id)
+    competition_file = await file_service.get_by_id(competition.id, file_id)
 
-    if competition_file is None or competition_file.competition_id != competition.id:
+    if competition_file is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="File not found",
@@ -618,32 +578,15 @@ async def update_file(
 
 @router.delete("/{slug}/files/{file_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_file(
-    slug: str,
     file_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
 ):
     """Delete a competition file. Only the sponsor or admin can delete files."""
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
-    # Check permissions
-    if competition.sponsor_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to manage files for this competition",
-        )
-
     file_service = CompetitionFileService(db)
-    competition_file = await file_service.get_by_id(file_id)
+    competition_file = await file_service.get_by_id(competition.id, file_id)
 
-    if competition_file is None or competition_file.competition_id != competition.id:
+    if competition_file is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="File not found",
@@ -659,40 +602,40 @@ async def delete_file(
 
 @router.get("/{slug}/files/{file_id}/preview", response_model=PreviewResponse)
 async def get_file_preview(
-    slug: str,
     file_id: int,
     max_rows: int = Query(default=20, ge=1, le=100),
+    competition: CompetitionRef = Depends(get_competition_ref),
     db: AsyncSession = Depends(get_db),
 ):
     """Get a preview of a CSV file (first N rows)."""
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
     file_service = CompetitionFileService(db)
-    competition_file = await file_service.get_by_id(file_id)
+    competition_file = await file_service.get_by_id(competition.id, file_id)
 
-    if competition_file is None or competition_file.competition_id != competition.id:
+    if competition_file is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="File not found",
         )
 
+    cache_key = (competition_file.file_path, max_rows)
+    content = _preview_cache.get(cache_key)
+    if content is not None:
+        return Response(content, media_type="application/json")
+
     dict_service = DataDictionaryService(db)
 
     try:
         result = await dict_service.get_csv_preview(competition_file, max_rows)
-        return PreviewResponse(
+        # Every value comes straight from the CSV reader, so skip validation
+        response = PreviewResponse.model_construct(
             columns=result.columns,
-            rows=result.rows,
+            data=result.data,
             total_rows=result.total_rows,
             truncated=result.truncated,
         )
+        content = dump_json(response.model_dump())
+        _preview_cache.set(cache_key, content)
+        return Response(content, media_type="application/json")
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -707,24 +650,15 @@ async def get_file_preview(
 
 @router.get("/{slug}/files/{file_id}/columns", response_model=list[ColumnInfoResponse])
 async def detect_file_columns(
-    slug: str,
     file_id: int,
+    competition: CompetitionRef = Depends(get_competition_ref),
     db: AsyncSession = Depends(get_db),
 ):
     """Auto-detect columns from a CSV file."""
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
     file_service = CompetitionFileService(db)
-    competition_file = await file_service.get_by_id(file_id)
+    competition_file = await file_service.get_by_id(competition.id, file_id)
 
-    if competition_file is None or competition_file.competition_id != competition.id:
+    if competition_file is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="File not found",
@@ -764,24 +698,15 @@ async def detect_file_columns(
     response_model=list[DataDictionaryEntryResponse],
 )
 async def get_file_dictionary(
-    slug: str,
     file_id: int,
+    competition: CompetitionRef = Depends(get_competition_ref),
     db: AsyncSession = Depends(get_db),
 ):
     """Get data dictionary entries for a file."""
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
     file_service = CompetitionFileService(db)
-    competition_file = await file_service.get_by_id(file_id)
+    competition_file = await file_service.get_by_id(competition.id, file_id)
 
-    if competition_file is None or competition_file.competition_id != competition.id:
+    if competition_file is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="File not found",
@@ -796,37 +721,20 @@ async def get_file_dictionary(
     response_model=list[DataDictionaryEntryResponse],
 )
 async def update_file_dictionary(
-    slug: str,
     file_id: int,
     data: DataDictionaryBulkUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
 ):
     """Bulk update data dictionary entries for a file.
 
     Replaces all existing entries with the provided entries.
     Only the sponsor or admin can update the dictionary.
     """
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
-    # Check permissions
-    if competition.sponsor_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to update the data dictionary",
-        )
-
     file_service = CompetitionFileService(db)
-    competition_file = await file_service.get_by_id(file_id)
+    competition_file = await file_service.get_by_id(competition.id, file_id)
 
-    if competition_file is None or competition_file.competition_id != competition.id:
+    if competition_file is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="File not found",
@@ -835,7 +743,7 @@ async def update_file_dictionary(
     dict_service = DataDictionaryService(db)
     entries = await dict_service.bulk_update(
         file_id,
-        [entry.model_dump() for entry in data.entries],
+        DATA_DICTIONARY_ENTRIES_ADAPTER.dump_python(data.entries),
     )
     return entries
 
@@ -861,45 +769,34 @@ async def list_rule_templates(
     return templates
 
 
+def _rules_response(rules) -> ORJSONResponse:
+    """Serialize competition rules without re-validating the ORM rows."""
+    return ORJSONResponse(
+        [CompetitionRuleResponse.from_rule(r).model_dump() for r in rules]
+    )
+
+
 @router.get("/{slug}/rules", response_model=list[CompetitionRuleResponse])
 async def list_competition_rules(
-    slug: str,
     enabled_only: bool = Query(default=True),
+    competition: CompetitionRef = Depends(get_competition_ref),
     db: AsyncSession = Depends(get_db),
 ):
     """List all rules for a competition."""
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
     rule_service = RuleService(db)
     rules = await rule_service.list_competition_rules(competition.id, enabled_only)
-    return [CompetitionRuleResponse.from_rule(r) for r in rules]
+    return _rules_response(rules)
 
 
 @router.get("/{slug}/rules/display", response_model=list[RulesDisplayResponse])
 async def get_rules_for_display(
-    slug: str,
+    competition: CompetitionRef = Depends(get_competition_ref),
     db: AsyncSession = Depends(get_db),
 ):
     """Get rules formatted for display to participants.
 
     Returns rules grouped by category with rendered text.
     """
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
     rule_service = RuleService(db)
     rules = await rule_service.list_competition_rules(competition.id, enabled_only=True)
 
@@ -932,31 +829,14 @@ async def get_rules_for_display(
     status_code=status.HTTP_201_CREATED,
 )
 async def create_competition_rule(
-    slug: str,
     data: CompetitionRuleCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
 ):
     """Create a new rule for a competition.
 
     Only the sponsor or admin can create rules.
     """
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
-    # Check permissions
-    if competition.sponsor_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to manage rules for this competition",
-        )
-
     rule_service = RuleService(db)
 
     # Validate template exists if provided
@@ -975,37 +855,23 @@ async def create_competition_rule(
         custom_text=data.custom_text,
         display_order=data.display_order,
     )
-    return CompetitionRuleResponse.from_rule(rule)
+    return ORJSONResponse(
+        CompetitionRuleResponse.from_rule(rule).model_dump(),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.put("/{slug}/rules", response_model=list[CompetitionRuleResponse])
 async def bulk_update_rules(
-    slug: str,
     data: RuleBulkUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
 ):
     """Bulk update rules for a competition.
 
     Replaces all existing rules with the provided rules.
     Only the sponsor or admin can update rules.
     """
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
-    # Check permissions
-    if competition.sponsor_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to manage rules for this competition",
-        )
-
     rule_service = RuleService(db)
 
     # Validate all templates exist
@@ -1020,42 +886,25 @@ async def bulk_update_rules(
 
     rules = await rule_service.bulk_update_rules(
         competition_id=competition.id,
-        rules_data=[r.model_dump() for r in data.rules],
+        rules_data=COMPETITION_RULES_ADAPTER.dump_python(data.rules),
     )
-    return [CompetitionRuleResponse.from_rule(r) for r in rules]
+    return _rules_response(rules)
 
 
 @router.delete("/{slug}/rules/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_competition_rule(
-    slug: str,
     rule_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    competition: CompetitionRef = Depends(require_competition_ref_owner),
 ):
     """Delete a competition rule.
 
     Only the sponsor or admin can delete rules.
     """
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
-    # Check permissions
-    if competition.sponsor_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to manage rules for this competition",
-        )
-
     rule_service = RuleService(db)
-    rule = await rule_service.get_rule(rule_id)
+    rule = await rule_service.get_rule(competition.id, rule_id)
 
-    if rule is None or rule.competition_id != competition.id:
+    if rule is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Rule not found",
@@ -3,7 +3,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_current_user
+from src.api.dependencies import CompetitionRef, get_competition_ref, get_current_user
+from src.api.responses import ORJSONResponse
 from src.api.schemas.discussion import (
     ThreadCreate,
     ThreadDetailResponse,
@@ -13,25 +14,20 @@ from src.api.schemas.discussion import (
     ReplyResponse,
     AuthorInfo,
 )
-from src.domain.models.user import User, UserRole
+from src.domain.models.user import User
 from src.domain.services.discussion import DiscussionService
 from src.domain.services.enrollment import EnrollmentService
 from src.infrastructure.database import get_db
-from src.infrastructure.repositories.competition import CompetitionRepository
 
 router = APIRouter(tags=["discussions"])
 
 
-async def _get_competition_or_404(slug: str, db: AsyncSession):
-    """Helper to get competition by slug or raise 404."""
-    repo = CompetitionRepository(db)
-    competition = await repo.get_by_slug(slug)
-    if not competition:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-    return competition
+def _author_info(user: User, authors: dict[int, AuthorInfo]) -> AuthorInfo:
+    """Return the response's shared AuthorInfo for a user, building it once."""
+    author = authors.get(user.id)
+    if author is None:
+        author = authors[user.id] = AuthorInfo.from_user(user)
+    return author
 
 
 async def _check_can_post(
@@ -39,13 +35,18 @@ async def _check_can_post(
     sponsor_id: int,
     user: User,
     db: AsyncSession,
+    is_enrolled: bool | None = None,
 ) -> None:
-    """Check if user can post (enrolled or sponsor)."""
-    if user.id == sponsor_id or user.role == UserRole.ADMIN:
+    """Check if user can post (enrolled or sponsor).
+
+    Pass is_enrolled when it was already fetched to skip the enrollment query.
+    """
+    if user.id == sponsor_id or user.is_admin:
         return  # Sponsor and admins can always post
 
-    enrollment_service = EnrollmentService(db)
-    is_enrolled = await enrollment_service.is_enrolled(user.id, competition_id)
+    if is_enrolled is None:
+        enrollment_service = EnrollmentService(db)
+        is_enrolled = await enrollment_service.is_enrolled(user.id, competition_id)
     if not is_enrolled:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -58,46 +59,40 @@ async def _check_can_post(
     response_model=ThreadsListResponse,
 )
 async def list_threads(
-    slug: str,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
+    competition: CompetitionRef = Depends(get_competition_ref),
     db: AsyncSession = Depends(get_db),
-) -> ThreadsListResponse:
+) -> ORJSONResponse:
     """List discussion threads for a competition."""
-    competition = await _get_competition_or_404(slug, db)
-
     service = DiscussionService(db)
-    threads = await service.get_threads(competition.id, skip=skip, limit=limit)
-    total = await service.get_thread_count(competition.id)
-
-    # Build response with reply counts
-    thread_responses = []
-    for thread in threads:
-        reply_count = await service.get_reply_count(thread.id)
-        thread_responses.append(
-            ThreadListResponse(
-                id=thread.id,
-                title=thread.title,
-                content=thread.content,
-                author=AuthorInfo(
-                    id=thread.author.id,
-                    username=thread.author.username,
-                    display_name=thread.author.display_name,
-                ),
-                is_pinned=thread.is_pinned,
-                is_locked=thread.is_locked,
-                reply_count=reply_count,
-                created_at=thread.created_at,
-                updated_at=thread.updated_at,
-            )
+    rows, total = await service.get_threads_with_reply_counts(
+        competition.id, skip=skip, limit=limit
+    )
+
+    authors: dict[int, AuthorInfo] = {}
+    thread_responses = [
+        ThreadListResponse(
+            id=thread.id,
+            title=thread.title,
+            content=thread.content,
+            author=_author_info(thread.author, authors),
+            is_pinned=thread.is_pinned,
+            is_locked=thread.is_locked,
+            reply_count=reply_count,
+            created_at=thread.created_at,
+            updated_at=thread.updated_at,
         )
+        for thread, reply_count in rows
+    ]
 
-    return ThreadsListResponse(
+    response = ThreadsListResponse(
         threads=thread_responses,
         total=total,
         skip=skip,
         limit=limit,
     )
+    return ORJSONResponse(response.model_dump())
 
 
 @router.post(
@@ -106,13 +101,12 @@ async def list_threads(
     status_code=status.HTTP_201_CREATED,
 )
 async def create_thread(
-    slug: str,
     data: ThreadCreate,
     current_user: User = Depends(get_current_user),
+    competition: CompetitionRef = Depends(get_competition_ref),
     db: AsyncSession = Depends(get_db),
 ) -> ThreadDetailResponse:
     """Create a new discussion thread."""
-    competition = await _get_competition_or_404(slug, db)
     await _check_can_post(competition.id, competition.sponsor_id, current_user, db)
 
     service = DiscussionService(db)
@@ -146,32 +140,31 @@ async def create_thread(
     response_model=ThreadDetailResponse,
 )
 async def get_thread(
-    slug: str,
     thread_id: int,
+    competition: CompetitionRef = Depends(get_competition_ref),
     db: AsyncSession = Depends(get_db),
-) -> ThreadDetailResponse:
-    """Get a discussion thread with its replies."""
-    competition = await _get_competition_or_404(slug, db)
+) -> ORJSONResponse:
+    """Get a discussion thread with its replies.
 
+    Replies by the same user share one AuthorInfo, so a long thread builds
+    one per participant rather than one per reply.
+    """
     service = DiscussionService(db)
-    thread = await service.get_thread(thread_id)
+    thread = await service.get_thread(competition.id, thread_id)
 
-    if not thread or thread.competition_id != competition.id:
+    if not thread:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Thread not found",
         )
 
-    return ThreadDetailResponse(
+    authors: dict[int, AuthorInfo] = {}
+    response = ThreadDetailResponse(
         id=thread.id,
         competition_id=thread.competition_id,
         title=thread.title,
         content=thread.content,
-        author=AuthorInfo(
-            id=thread.author.id,
-            username=thread.author.username,
-            display_name=thread.author.display_name,
-        ),
+        author=_author_info(thread.author, authors),
         is_pinned=thread.is_pinned,
         is_locked=thread.is_locked,
         replies=[
@@ -179,11 +172,7 @@ async def get_thread(
                 id=reply.id,
                 thread_id=reply.thread_id,
                 content=reply.content,
-                author=AuthorInfo(
-                    id=reply.author.id,
-                    username=reply.author.username,
-                    display_name=reply.author.display_name,
-                ),
+                author=_author_info(reply.author, authors),
                 created_at=reply.created_at,
             )
             for reply in thread.replies
@@ -191,6 +180,8 @@ async def get_thread(
         created_at=thread.created_at,
         updated_at=thread.updated_at,
     )
+    # Returned directly so FastAPI does not re-validate every reply's author
+    return ORJSONResponse(response.model_dump())
 
 
 @router.post(
@@ -199,21 +190,26 @@ async def get_thread(
     status_code=status.HTTP_201_CREATED,
 )
 async def create_reply(
-    slug: str,
     thread_id: int,
     data: ReplyCreate,
     current_user: User = Depends(get_current_user),
+    competition: CompetitionRef = Depends(get_competition_ref),
     db: AsyncSession = Depends(get_db),
 ) -> ReplyResponse:
     """Add a reply to a discussion thread."""
-    competition = await _get_competition_or_404(slug, db)
-    await _check_can_post(competition.id, competition.sponsor_id, current_user, db)
-
     service = DiscussionService(db)
 
+    # Load the thread together with the poster's enrollment
+    found = await service.get_competition_thread_with_enrollment(
+        competition.id, thread_id, current_user.id
+    )
+    is_enrolled = found[1] if found else None
+    await _check_can_post(
+        competition.id, competition.sponsor_id, current_user, db, is_enrolled
+    )
+
     # Verify thread exists and belongs to this competition
-    thread = await service.get_thread(thread_id)
-    if not thread or thread.competition_id != competition.id:
+    if not found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Thread not found",
@@ -6,11 +6,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_current_user
+from src.api.dependencies import CompetitionRef, get_competition_ref, get_current_user
 from src.infrastructure.database import get_db
 from src.domain.models.user import User
 from src.domain.services.enrollment import EnrollmentService
-from src.infrastructure.repositories.competition import CompetitionRepository
 
 router = APIRouter(tags=["enrollments"])
 
@@ -37,20 +36,11 @@ class EnrollmentActionResponse(BaseModel):
     status_code=status.HTTP_201_CREATED,
 )
 async def enroll_in_competition(
-    slug: str,
     current_user: User = Depends(get_current_user),
+    competition: CompetitionRef = Depends(get_competition_ref),
     db: AsyncSession = Depends(get_db),
 ) -> EnrollmentActionResponse:
     """Enroll the current user in a competition."""
-    # Get competition by slug
-    competition_repo = CompetitionRepository(db)
-    competition = await competition_repo.get_by_slug(slug)
-    if not competition:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
     # Enroll user
     enrollment_service = EnrollmentService(db)
     try:
@@ -71,20 +61,11 @@ async def enroll_in_competition(
     response_model=EnrollmentActionResponse,
 )
 async def unenroll_from_competition(
-    slug: str,
     current_user: User = Depends(get_current_user),
+    competition: CompetitionRef = Depends(get_competition_ref),
     db: AsyncSession = Depends(get_db),
 ) -> EnrollmentActionResponse:
     """Remove the current user's enrollment from a competition."""
-    # Get competition by slug
-    competition_repo = CompetitionRepository(db)
-    competition = await competition_repo.get_by_slug(slug)
-    if not competition:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
     # Unenroll user
     enrollment_service = EnrollmentService(db)
     try:
@@ -105,20 +86,11 @@ async def unenroll_from_competition(
     response_model=EnrollmentResponse,
 )
 async def get_enrollment_status(
-    slug: str,
     current_user: User = Depends(get_current_user),
+    competition: CompetitionRef = Depends(get_competition_ref),
     db: AsyncSession = Depends(get_db),
 ) -> EnrollmentResponse:
     """Get the current user's enrollment status for a competition."""
-    # Get competition by slug
-    competition_repo = CompetitionRepository(db)
-    competition = await competition_repo.get_by_slug(slug)
-    if not competition:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
     # Check enrollment
     enrollment_service = EnrollmentService(db)
     enrollment = await enrollment_service.get_enrollment(
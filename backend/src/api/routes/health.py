@@ -4,10 +4,14 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.common.cache import TTLCache
 from src.infrastructure.database import get_db
 
 router = APIRouter()
 
+# Last healthy readiness result, so frequent probes do not each hit the pool
+_readiness_cache: TTLCache[str, dict] = TTLCache(maxsize=1, ttl=1.0)
+
 
 @router.get("/health/live")
 async def liveness():
@@ -19,10 +23,18 @@ async def liveness():
 async def readiness(db: AsyncSession = Depends(get_db)):
     """Readiness probe - is the service ready to accept traffic?
 
-    Checks database connectivity.
+    Checks database connectivity. A healthy result is reused for a second;
+    failures are not cached, so recovery is seen on the next probe.
     """
+    cached = _readiness_cache.get("ready")
+    if cached is not None:
+        return cached
+
     try:
         await db.execute(text("SELECT 1"))
-        return {"status": "ok", "database": "connected"}
     except Exception as e:
         return {"status": "degraded", "database": "disconnected", "error": str(e)}
+
+    result = {"status": "ok", "database": "connected"}
+    _readiness_cache.set("ready", result)
+    return result
@@ -4,8 +4,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.dependencies import get_current_user
+from src.api.responses import ORJSONResponse
 from src.api.schemas.notification import (
-    NotificationResponse,
+    NOTIFICATIONS_ADAPTER,
     NotificationListResponse,
     UnreadCountResponse,
     MarkReadResponse,
@@ -28,20 +29,22 @@ async def list_notifications(
     """Get current user's notifications."""
     service = NotificationService(db)
 
-    notifications = await service.get_user_notifications(
+    notifications, unread_count = await service.get_user_notifications_with_unread_count(
         user_id=current_user.id,
         unread_only=unread_only,
         skip=skip,
         limit=min(limit, 100),  # Cap at 100
     )
-    unread_count = await service.get_unread_count(current_user.id)
 
-    return NotificationListResponse(
-        notifications=[
-            NotificationResponse.model_validate(n) for n in notifications
-        ],
+    # Dump to JSON-ready data here and return the response directly so
+    # FastAPI does not dump and re-validate the model a second time.
+    response = NotificationListResponse.model_construct(
+        notifications=NOTIFICATIONS_ADAPTER.validate_python(
+            notifications, from_attributes=True
+        ),
         unread_count=unread_count,
     )
+    return ORJSONResponse(response.model_dump())
 
 
 @router.get("/unread-count", response_model=UnreadCountResponse)
@@ -3,7 +3,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_current_user
+from src.api.dependencies import get_current_user, invalidate_user
+from src.api.responses import ORJSONResponse
 from src.api.schemas.auth import UserResponse
 from src.api.schemas.profile import (
     UserProfileResponse,
@@ -11,7 +12,6 @@ from src.api.schemas.profile import (
     ProfileStatsResponse,
     ProfileUpdate,
 )
-from src.domain.models.competition import CompetitionStatus
 from src.domain.models.user import User
 from src.domain.services.profile import ProfileService
 from src.infrastructure.database import get_db
@@ -34,6 +34,7 @@ async def update_my_profile(
         user=current_user,
         display_name=data.display_name,
     )
+    invalidate_user(current_user.id)
     return updated_user
 
 
@@ -56,7 +57,7 @@ async def get_user_profile(
             detail="User not found",
         )
 
-    return UserProfileResponse(
+    response = UserProfileResponse(
         id=profile.id,
         username=profile.username,
         display_name=profile.display_name,
@@ -79,6 +80,7 @@ async def get_user_profile(
             for p in profile.participations
         ],
     )
+    return ORJSONResponse(response.model_dump())
 
 
 @router.get("/{username}/stats", response_model=ProfileStatsResponse)
@@ -91,22 +93,17 @@ async def get_user_stats(
     A lighter endpoint that returns just the stats without full participation details.
     """
     service = ProfileService(db)
-    profile = await service.get_profile(username)
+    stats = await service.get_stats(username)
 
-    if not profile:
+    if not stats:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    active_competitions = sum(
-        1 for p in profile.participations
-        if p.status == CompetitionStatus.ACTIVE
-    )
-
     return ProfileStatsResponse(
-        competitions_entered=profile.competitions_entered,
-        total_submissions=profile.total_submissions,
-        best_rank=profile.best_rank,
-        active_competitions=active_competitions,
+        competitions_entered=stats.competitions_entered,
+        total_submissions=stats.total_submissions,
+        best_rank=stats.best_rank,
+        active_competitions=stats.active_competitions,
     )
@@ -1,16 +1,25 @@
 """Submission routes."""
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_current_user
+from src.api.dependencies import (
+    CompetitionRef,
+    get_competition_by_slug,
+    get_competition_ref,
+    get_current_user,
+)
+from src.api.responses import ORJSONResponse, dump_json
 from src.api.schemas.submission import (
     LeaderboardResponse,
     SubmissionListResponse,
     SubmissionResponse,
 )
+from src.domain.models.competition import Competition
 from src.domain.models.user import User
-from src.domain.services.competition import CompetitionService
 from src.domain.services.enrollment import EnrollmentService
 from src.domain.services.submission import SubmissionService
 from src.infrastructure.database import get_db
@@ -20,22 +29,12 @@ router = APIRouter(prefix="/competitions/{slug}/submissions", tags=["Submissions
 
 @router.post("/", response_model=SubmissionResponse, status_code=status.HTTP_201_CREATED)
 async def create_submission(
-    slug: str,
     file: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    competition: Competition = Depends(get_competition_by_slug),
 ):
     """Upload a submission for a competition."""
-    # Get competition
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
     # Check enrollment
     enrollment_service = EnrollmentService(db)
     if not await enrollment_service.is_enrolled(current_user.id, competition.id):
@@ -65,28 +64,23 @@ async def create_submission(
 
 @router.get("/", response_model=list[SubmissionListResponse])
 async def list_my_submissions(
-    slug: str,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-):
+    competition: CompetitionRef = Depends(get_competition_ref),
+) -> ORJSONResponse:
     """List current user's submissions for a competition."""
-    # Get competition
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
-
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
     sub_service = SubmissionService(db)
     submissions = await sub_service.list_user_submissions(
         current_user.id, competition.id, skip=skip, limit=limit
     )
-    return submissions
+    return ORJSONResponse(
+        [
+            SubmissionListResponse.from_submission(submission).model_dump()
+            for submission in submissions
+        ]
+    )
 
 
 @router.get("/{submission_id}", response_model=SubmissionResponse)
@@ -119,32 +113,45 @@ async def get_submission(
 # Leaderboard route (separate router to avoid nested path issues)
 leaderboard_router = APIRouter(tags=["Leaderboard"])
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def _ndjson_entries(entries: list[dict]) -> AsyncIterator[bytes]:
+    """Serialize leaderboard entries one JSON line at a time."""
+    for entry in entries:
+        yield dump_json(entry) + b"\n"
+
 
 @leaderboard_router.get(
     "/competitions/{slug}/leaderboard", response_model=LeaderboardResponse
 )
 async def get_leaderboard(
-    slug: str,
     limit: int = Query(default=100, ge=1, le=500),
+    accept: str | None = Header(default=None),
     db: AsyncSession = Depends(get_db),
-):
-    """Get competition leaderboard."""
-    comp_service = CompetitionService(db)
-    competition = await comp_service.get_by_slug(slug)
+    competition: Competition = Depends(get_competition_by_slug),
+) -> ORJSONResponse | StreamingResponse:
+    """Get competition leaderboard.
 
-    if competition is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
+    Clients accepting application/x-ndjson get just the entries, one per
+    line, so large leaderboards can be consumed as they arrive.
+    """
+    sub_service = SubmissionService(db)
+    leaderboard = await sub_service.get_leaderboard(competition, limit=limit)
+
+    if accept is not None and NDJSON_MEDIA_TYPE in accept:
+        return StreamingResponse(
+            _ndjson_entries(leaderboard.entries), media_type=NDJSON_MEDIA_TYPE
         )
 
-    sub_service = SubmissionService(db)
-    entries, is_team_competition = await sub_service.get_leaderboard(competition, limit=limit)
-
-    return LeaderboardResponse(
-        competition_id=competition.id,
-        competition_title=competition.title,
-        entries=entries,
-        total_participants=len(entries),
-        is_team_competition=is_team_competition,
+    # The service builds entries in LeaderboardEntry's shape, so they are
+    # encoded as they are rather than through one model per entry
+    return ORJSONResponse(
+        {
+            "competition_id": competition.id,
+            "competition_title": competition.title,
+            "entries": leaderboard.entries,
+            "total_participants": leaderboard.total_participants,
+            "is_team_competition": leaderboard.is_team_competition,
+        }
     )
@@ -3,7 +3,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_current_user
+from src.api.dependencies import CompetitionRef, get_competition_ref, get_current_user
+from src.api.responses import ORJSONResponse
 from src.api.schemas.team import (
     TeamCreate,
     TeamResponse,
@@ -15,46 +16,53 @@ from src.api.schemas.team import (
     TeamActionResponse,
 )
 from src.domain.models.user import User
-from src.domain.services.team import TeamService
+from src.domain.services.team import TeamInfo, TeamService
 from src.infrastructure.database import get_db
-from src.infrastructure.repositories.competition import CompetitionRepository
 
 router = APIRouter(tags=["teams"])
 
 
+def _team_detail_response(team_info: TeamInfo) -> ORJSONResponse:
+    """Serialize a team and its members without re-validating them."""
+    response = TeamDetailResponse(
+        id=team_info.id,
+        name=team_info.name,
+        competition_id=team_info.competition_id,
+        member_count=team_info.member_count,
+        max_size=team_info.max_size,
+        members=[TeamMemberResponse.from_member(m) for m in team_info.members],
+        created_at=team_info.created_at,
+    )
+    return ORJSONResponse(response.model_dump())
+
+
 @router.get(
     "/competitions/{slug}/teams",
     response_model=list[TeamResponse],
 )
 async def list_teams(
-    slug: str,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
-):
+    competition: CompetitionRef = Depends(get_competition_ref),
+) -> ORJSONResponse:
     """List all teams in a competition."""
-    comp_repo = CompetitionRepository(db)
-    competition = await comp_repo.get_by_slug(slug)
-    if not competition:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
     service = TeamService(db)
     teams = await service.list_teams(competition.id, skip=skip, limit=limit)
 
-    return [
-        TeamResponse(
-            id=team.id,
-            name=team.name,
-            competition_id=team.competition_id,
-            member_count=len(team.members),
-            max_size=competition.max_team_size,
-            created_at=team.created_at,
-        )
-        for team in teams
-    ]
+    return ORJSONResponse(
+        [
+            TeamResponse.model_construct(
+                id=team.id,
+                name=team.name,
+                competition_id=team.competition_id,
+                member_count=team.member_count,
+                max_size=competition.max_team_size,
+                created_at=team.created_at,
+            ).model_dump()
+            for team in teams
+        ]
+    )
 
 
 @router.post(
@@ -63,20 +71,12 @@ async def list_teams(
     status_code=status.HTTP_201_CREATED,
 )
 async def create_team(
-    slug: str,
     data: TeamCreate,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    competition: CompetitionRef = Depends(get_competition_ref),
 ):
     """Create a new team in a competition."""
-    comp_repo = CompetitionRepository(db)
-    competition = await comp_repo.get_by_slug(slug)
-    if not competition:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
     service = TeamService(db)
     try:
         team = await service.create_team(data.name, competition.id, current_user)
@@ -100,19 +100,11 @@ async def create_team(
     response_model=TeamDetailResponse,
 )
 async def get_team(
-    slug: str,
     team_id: int,
     db: AsyncSession = Depends(get_db),
+    competition: CompetitionRef = Depends(get_competition_ref),
 ):
     """Get team details including members."""
-    comp_repo = CompetitionRepository(db)
-    competition = await comp_repo.get_by_slug(slug)
-    if not competition:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
     service = TeamService(db)
     team_info = await service.get_team_info(team_id)
 
@@ -122,24 +114,7 @@ async def get_team(
             detail="Team not found",
         )
 
-    return TeamDetailResponse(
-        id=team_info.id,
-        name=team_info.name,
-        competition_id=team_info.competition_id,
-        member_count=team_info.member_count,
-        max_size=team_info.max_size,
-        members=[
-            TeamMemberResponse(
-                user_id=m.user_id,
-                username=m.username,
-                display_name=m.display_name,
-                role=m.role,
-                joined_at=m.joined_at,
-            )
-            for m in team_info.members
-        ],
-        created_at=team_info.created_at,
-    )
+    return _team_detail_response(team_info)
 
 
 @router.get(
@@ -147,44 +122,18 @@ async def get_team(
     response_model=TeamDetailResponse | None,
 )
 async def get_my_team(
-    slug: str,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    competition: CompetitionRef = Depends(get_competition_ref),
 ):
     """Get the current user's team in a competition."""
-    comp_repo = CompetitionRepository(db)
-    competition = await comp_repo.get_by_slug(slug)
-    if not competition:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Competition not found",
-        )
-
     service = TeamService(db)
-    team = await service.get_user_team(current_user.id, competition.id)
+    team_info = await service.get_user_team_info(current_user.id, competition.id)
 
-    if not team:
+    if not team_info:
         return None
 
-    team_info = await service.get_team_info(team.id)
-    return TeamDetailResponse(
-        id=team_info.id,
-        name=team_info.name,
-        competition_id=team_info.competition_id,
-        member_count=team_info.member_count,
-        max_size=team_info.max_size,
-        members=[
-            TeamMemberResponse(
-                user_id=m.user_id,
-                username=m.username,
-                display_name=m.display_name,
-                role=m.role,
-                joined_at=m.joined_at,
-            )
-            for m in team_info.members
-        ],
-        created_at=team_info.created_at,
-    )
+    return _team_detail_response(team_info)
 
 
 @router.post(
@@ -219,29 +168,8 @@ async def get_my_invitations(
 ):
     """Get all pending invitations for the current user."""
     service = TeamService(db)
-    invitations = await service.get_pending_invitations(current_user)
-
-    result = []
-    for inv in invitations:
-        team = await service.get_team(inv.team_id)
-        if team:
-            from src.infrastructure.repositories.user import UserRepository
-            user_repo = UserRepository(db)
-            inviter = await user_repo.get_by_id(inv.inviter_id)
-            result.append(
-                TeamInvitationResponse(
-                    id=inv.id,
-                    team_id=inv.team_id,
-                    team_name=team.name,
-                    competition_id=team.competition_id,
-                    inviter_username=inviter.username if inviter else "Unknown",
-                    status=inv.status,
-                    expires_at=inv.expires_at,
-                    created_at=inv.created_at,
-                )
-            )
-
-    return result
+    invitations = await service.get_pending_invitations_with_details(current_user)
+    return [TeamInvitationResponse.model_validate(inv) for inv in invitations]
 
 
 @router.post(
@@ -1,57 +1,89 @@
 """Upload serving routes."""
 
 import os
-from pathlib import Path
+import stat
+from functools import lru_cache
+from urllib.parse import quote
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Header, HTTPException, Response, status
 from fastapi.responses import FileResponse
 
 from src.config import settings
 
 router = APIRouter(prefix="/uploads", tags=["Uploads"])
 
+MEDIA_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+    ".csv": "text/csv",
+}
+
+# Each chunk read is a worker-thread hop; Starlette's default is 64 KiB
+SEND_CHUNK_SIZE = 1024 * 1024
+
+# Uploads such as thumbnails are replaced in place, so clients revalidate
+# with the ETag on each use instead of caching for a fixed time
+_UPLOAD_CACHE_CONTROL = "public, no-cache"
+
+
+@lru_cache(maxsize=4)
+def _upload_root(upload_dir: str) -> str:
+    """Resolve the uploads directory once rather than on every request."""
+    return os.path.realpath(upload_dir)
+
 
 @router.get("/{path:path}")
-async def serve_upload(path: str):
+async def serve_upload(path: str, if_none_match: str | None = Header(default=None)):
     """Serve uploaded files.
 
     This endpoint serves files from the uploads directory.
     """
-    # Construct full path
-    full_path = Path(settings.upload_dir) / path
-
-    # Security: ensure path doesn't escape uploads directory
-    try:
-        full_path = full_path.resolve()
-        upload_dir = Path(settings.upload_dir).resolve()
-        if not str(full_path).startswith(str(upload_dir)):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied",
-            )
-    except Exception:
+    # Security: ensure path doesn't escape uploads directory. Only the app
+    # writes there, so a lexical check is enough and avoids a realpath per hit.
+    root = _upload_root(settings.upload_dir)
+    full_path = os.path.normpath(os.path.join(root, path))
+    if not full_path.startswith(root + os.sep):
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid path",
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied",
+        )
+
+    media_type = MEDIA_TYPES.get(
+        os.path.splitext(full_path)[1].lower(), "application/octet-stream"
+    )
+
+    # Let nginx send the bytes when the deployment supports it
+    prefix = settings.x_accel_redirect_prefix
+    if prefix is not None:
+        relative_path = full_path[len(root) + 1:]
+        return Response(
+            media_type=media_type,
+            headers={"X-Accel-Redirect": f"{prefix.rstrip('/')}/{quote(relative_path)}"},
         )
 
     # Check file exists
-    if not full_path.exists() or not full_path.is_file():
+    try:
+        stat_result = os.stat(full_path)
+    except (FileNotFoundError, NotADirectoryError):
+        stat_result = None
+    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="File not found",
         )
 
-    # Determine media type
-    ext = full_path.suffix.lower()
-    media_types = {
-        ".png": "image/png",
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".webp": "image/webp",
-        ".gif": "image/gif",
-        ".csv": "text/csv",
-    }
-    media_type = media_types.get(ext, "application/octet-stream")
-
-    return FileResponse(full_path, media_type=media_type)
+    etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": _UPLOAD_CACHE_CONTROL}
+    if if_none_match is not None and etag in if_none_match:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # Pass the stat along so the response doesn't repeat it. Servers offering
+    # the ASGI pathsend extension send the file themselves.
+    response = FileResponse(
+        full_path, media_type=media_type, headers=headers, stat_result=stat_result
+    )
+    response.chunk_size = SEND_CHUNK_SIZE
+    return response
@@ -0,0 +1,15 @@
+"""Shared base classes for API schemas."""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ResponseBase(BaseModel):
+    """Base for response schemas that are read from ORM objects.
+
+    Core schemas are built on first use rather than at import time, so
+    importing the schema package stays cheap.
+    """
+
+    __slots__ = ()
+
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -4,13 +4,15 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict
 
+from src.api.schemas._base import ResponseBase
 from src.domain.models.user import UserRole
-from src.domain.models.competition import CompetitionStatus
 
 
 class PlatformStatsResponse(BaseModel):
     """Response schema for platform statistics."""
 
+    model_config = ConfigDict(defer_build=True)
+
     total_users: int
     active_users_last_30_days: int
     total_competitions: int
@@ -20,11 +22,9 @@ class PlatformStatsResponse(BaseModel):
     total_enrollments: int
 
 
-class UserSummaryResponse(BaseModel):
+class UserSummaryResponse(ResponseBase):
     """Response schema for user summary (admin view)."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     email: str
     username: str
@@ -40,33 +40,16 @@ class UserSummaryResponse(BaseModel):
 class UserRoleUpdateRequest(BaseModel):
     """Request schema for updating user role."""
 
+    model_config = ConfigDict(defer_build=True)
+
     role: UserRole
 
 
 class AdminActionResponse(BaseModel):
     """Generic response for admin actions."""
 
+    model_config = ConfigDict(defer_build=True)
+
     message: str
     success: bool = True
 
-
-class AdminCompetitionResponse(BaseModel):
-    """Response schema for competition (admin view with all fields)."""
-
-    model_config = ConfigDict(from_attributes=True)
-
-    id: int
-    title: str
-    slug: str
-    description: str
-    short_description: str
-    status: CompetitionStatus
-    sponsor_id: int
-    start_date: datetime
-    end_date: datetime
-    is_public: bool
-    max_team_size: int
-    daily_submission_limit: int
-    evaluation_metric: str
-    created_at: datetime
-    updated_at: datetime
@@ -1,13 +1,16 @@
 """Authentication schemas."""
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
+from src.api.schemas._base import ResponseBase
 from src.domain.models.user import UserRole
 
 
 class RegisterRequest(BaseModel):
     """Request schema for user registration."""
 
+    model_config = ConfigDict(defer_build=True)
+
     email: EmailStr
     username: str = Field(min_length=3, max_length=100, pattern=r"^[a-zA-Z0-9_-]+$")
     password: str = Field(min_length=8, max_length=100)
@@ -17,6 +20,8 @@ class RegisterRequest(BaseModel):
 class LoginRequest(BaseModel):
     """Request schema for user login."""
 
+    model_config = ConfigDict(defer_build=True)
+
     email: EmailStr
     password: str
 
@@ -24,11 +29,13 @@ class LoginRequest(BaseModel):
 class TokenResponse(BaseModel):
     """Response schema for authentication tokens."""
 
+    model_config = ConfigDict(defer_build=True)
+
     access_token: str
     token_type: str = "bearer"
 
 
-class UserResponse(BaseModel):
+class UserResponse(ResponseBase):
     """Response schema for user data."""
 
     id: int
@@ -37,6 +44,3 @@ class UserResponse(BaseModel):
     display_name: str
     role: UserRole
     is_active: bool
-
-    class Config:
-        from_attributes = True
@@ -1,13 +1,21 @@
 """Competition schemas."""
 
 from datetime import datetime
+from functools import lru_cache
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
+from src.api.schemas._base import ResponseBase
 from src.config import settings
 from src.domain.models.competition import CompetitionStatus, Difficulty
 
 
+@lru_cache(maxsize=4)
+def _upload_prefix(upload_dir: str) -> str:
+    """Normalize the uploads directory once rather than per converted path."""
+    return upload_dir.rstrip("/") + "/"
+
+
 def _path_to_url(path: str | None) -> str | None:
     """Convert a filesystem path to an API URL.
 
@@ -17,16 +25,17 @@ def _path_to_url(path: str | None) -> str | None:
     if not path:
         return None
     # Remove the upload_dir prefix to get the relative path
-    upload_dir = settings.upload_dir.rstrip("/")
-    if path.startswith(upload_dir):
-        relative_path = path[len(upload_dir):]
-        return f"/api/uploads{relative_path}"
+    prefix = _upload_prefix(settings.upload_dir)
+    if path.startswith(prefix):
+        return f"/api/uploads/{path[len(prefix):]}"
     return None
 
 
 class CompetitionCreate(BaseModel):
     """Schema for creating a competition."""
 
+    model_config = ConfigDict(defer_build=True)
+
     title: str = Field(min_length=3, max_length=255)
     description: str = Field(min_length=10)
     short_description: str = Field(min_length=10, max_length=500)
@@ -43,6 +52,8 @@ class CompetitionCreate(BaseModel):
 class CompetitionUpdate(BaseModel):
     """Schema for updating a competition."""
 
+    model_config = ConfigDict(defer_build=True)
+
     title: str | None = Field(default=None, min_length=3, max_length=255)
     description: str | None = Field(default=None, min_length=10)
     short_description: str | None = Field(default=None, min_length=10, max_length=500)
@@ -57,8 +68,13 @@ class CompetitionUpdate(BaseModel):
     status: CompetitionStatus | None = None
 
 
-class CompetitionResponse(BaseModel):
-    """Schema for competition response."""
+class CompetitionResponse(ResponseBase):
+    """Schema for competition response.
+
+    Validated straight from a Competition, or built from one with
+    from_competition; has_truth_set and thumbnail_url are derived from the
+    model's solution_path and thumbnail_path.
+    """
 
     id: int
     title: str
@@ -75,43 +91,61 @@ class CompetitionResponse(BaseModel):
     evaluation_metric: str
     evaluation_description: str | None = None
     is_public: bool
-    has_truth_set: bool = False
-    thumbnail_url: str | None = None
+    has_truth_set: bool = Field(default=False, validation_alias="solution_path")
+    thumbnail_url: str | None = Field(default=None, validation_alias="thumbnail_path")
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    @field_validator("has_truth_set", mode="before")
+    @classmethod
+    def _has_solution(cls, solution_path: str | None) -> bool:
+        return solution_path is not None
+
+    @field_validator("thumbnail_url", mode="before")
+    @classmethod
+    def _thumbnail_url(cls, thumbnail_path: str | None) -> str | None:
+        return _path_to_url(thumbnail_path)
 
     @classmethod
-    def from_orm_with_extras(cls, obj) -> "CompetitionResponse":
-        """Create response with computed fields."""
-        data = {
-            "id": obj.id,
-            "title": obj.title,
-            "slug": obj.slug,
-            "description": obj.description,
-            "short_description": obj.short_description,
-            "sponsor_id": obj.sponsor_id,
-            "status": obj.status,
-            "start_date": obj.start_date,
-            "end_date": obj.end_date,
-            "difficulty": obj.difficulty,
-            "max_team_size": obj.max_team_size,
-            "daily_submission_limit": obj.daily_submission_limit,
-            "evaluation_metric": obj.evaluation_metric,
-            "evaluation_description": obj.evaluation_description,
-            "is_public": obj.is_public,
-            "has_truth_set": obj.solution_path is not None,
-            "thumbnail_url": _path_to_url(obj.thumbnail_path),
-            "created_at": obj.created_at,
-            "updated_at": obj.updated_at,
-        }
-        return cls(**data)
-
-
-class CompetitionListResponse(BaseModel):
-    """Schema for competition list item (lighter weight)."""
+    def from_competition(cls, competition) -> "CompetitionResponse":
+        """Build a response from a Competition without re-validating it.
+
+        The row has already been validated on its way into the database, so
+        the fields are copied across and only the derived ones are computed.
+        """
+        return cls.model_construct(
+            id=competition.id,
+            title=competition.title,
+            slug=competition.slug,
+            description=competition.description,
+            short_description=competition.short_description,
+            sponsor_id=competition.sponsor_id,
+            status=competition.status,
+            start_date=competition.start_date,
+            end_date=competition.end_date,
+            difficulty=competition.difficulty,
+            max_team_size=competition.max_team_size,
+            daily_submission_limit=competition.daily_submission_limit,
+            evaluation_metric=competition.evaluation_metric,
+            evaluation_description=competition.evaluation_description,
+            is_public=competition.is_public,
+            has_truth_set=competition.solution_path is not None,
+            thumbnail_url=_path_to_url(competition.thumbnail_path),
+            created_at=competition.created_at,
+            updated_at=competition.updated_at,
+        )
+
+
+class CompetitionListResponse(ResponseBase):
+    """Schema for competition list item (lighter weight).
+
+    Validated straight from a Competition, or built from one with
+    from_competition; thumbnail_url is derived from the model's
+    thumbnail_path.
+    """
+
+    __slots__ = ()
+    model_config = ConfigDict(frozen=True)
 
     id: int
     title: str
@@ -122,23 +156,30 @@ class CompetitionListResponse(BaseModel):
     end_date: datetime
     difficulty: Difficulty
     is_public: bool
-    thumbnail_url: str | None = None
+    thumbnail_url: str | None = Field(default=None, validation_alias="thumbnail_path")
 
-    class Config:
-        from_attributes = True
+    @field_validator("thumbnail_url", mode="before")
+    @classmethod
+    def _thumbnail_url(cls, thumbnail_path: str | None) -> str | None:
+        return _path_to_url(thumbnail_path)
 
     @classmethod
-    def from_orm_with_thumbnail(cls, obj) -> "CompetitionListResponse":
-        """Create response with thumbnail_url from thumbnail_path."""
-        return cls(
-            id=obj.id,
-            title=obj.title,
-            slug=obj.slug,
-            short_description=obj.short_description,
-            status=obj.status,
-            start_date=obj.start_date,
-            end_date=obj.end_date,
-            difficulty=obj.difficulty,
-            is_public=obj.is_public,
-            thumbnail_url=_path_to_url(obj.thumbnail_path),
+    def from_competition(cls, competition) -> "CompetitionListResponse":
+        """Build a list item from a Competition without re-validating it."""
+        return cls.model_construct(
+            id=competition.id,
+            title=competition.title,
+            slug=competition.slug,
+            short_description=competition.short_description,
+            status=competition.status,
+            start_date=competition.start_date,
+            end_date=competition.end_date,
+            difficulty=competition.difficulty,
+            is_public=competition.is_public,
+            thumbnail_url=_path_to_url(competition.thumbnail_path),
         )
+
+
+# Listings are built from Competition rows and dumped to JSON bytes in one
+# pass through pydantic-core, skipping FastAPI's response serialization.
+COMPETITION_LIST_ADAPTER = TypeAdapter(list[CompetitionListResponse])
@@ -2,24 +2,59 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.api.schemas._base import ResponseBase
 
 
 class CompetitionFileCreate(BaseModel):
     """Schema for creating a competition file metadata entry."""
 
+    model_config = ConfigDict(defer_build=True)
+
     display_name: str | None = Field(default=None, max_length=255)
-    purpose: str | None = Field(default=None, description="Description of file purpose")
+    purpose: str | None = None  # Description of file purpose
 
 
 class CompetitionFileUpdate(BaseModel):
     """Schema for updating a competition file."""
 
+    model_config = ConfigDict(defer_build=True)
+
     display_name: str | None = Field(default=None, max_length=255)
     purpose: str | None = None
 
 
-class CompetitionFileResponse(BaseModel):
+class CompetitionFileUploadRequest(BaseModel):
+    """Schema for requesting a direct-to-storage upload."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    filename: str = Field(..., min_length=1, max_length=255)
+
+
+class CompetitionFileUploadTicket(BaseModel):
+    """Schema for a pre-signed upload form the client posts the file to."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    upload_url: str
+    upload_fields: dict[str, str]
+    storage_key: str
+    expires_at: datetime
+
+
+class CompetitionFileUploadCommit(BaseModel):
+    """Schema for recording a file uploaded directly to storage."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    storage_key: str
+    display_name: str | None = Field(default=None, max_length=255)
+    purpose: str | None = Field(default=None, description="Description of file purpose")
+
+
+class CompetitionFileResponse(ResponseBase):
     """Schema for competition file response."""
 
     id: int
@@ -32,6 +67,3 @@ class CompetitionFileResponse(BaseModel):
     file_type: str | None
     created_at: datetime
     updated_at: datetime
-
-    class Config:
-        from_attributes = True
@@ -2,17 +2,16 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import ConfigDict
 
+from src.api.schemas._base import ResponseBase
 from src.domain.models.competition import CompetitionStatus
 from src.domain.models.submission import SubmissionStatus
 
 
-class EnrolledCompetitionResponse(BaseModel):
+class EnrolledCompetitionResponse(ResponseBase):
     """Response schema for an enrolled competition."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     title: str
     slug: str
@@ -25,11 +24,9 @@ class EnrolledCompetitionResponse(BaseModel):
     total_participants: int
 
 
-class RecentSubmissionResponse(BaseModel):
+class RecentSubmissionResponse(ResponseBase):
     """Response schema for a recent submission."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     competition_id: int
     competition_title: str
@@ -39,10 +36,11 @@ class RecentSubmissionResponse(BaseModel):
     submitted_at: datetime
 
 
-class DashboardNotificationResponse(BaseModel):
+class DashboardNotificationResponse(ResponseBase):
     """Response schema for a dashboard notification."""
 
-    model_config = ConfigDict(from_attributes=True)
+    __slots__ = ()
+    model_config = ConfigDict(frozen=True)
 
     id: int
     type: str
@@ -53,7 +51,7 @@ class DashboardNotificationResponse(BaseModel):
     created_at: datetime
 
 
-class DashboardStatsResponse(BaseModel):
+class DashboardStatsResponse(ResponseBase):
     """Response schema for dashboard stats."""
 
     total_competitions: int
@@ -62,11 +60,9 @@ class DashboardStatsResponse(BaseModel):
     unread_notifications: int
 
 
-class DashboardResponse(BaseModel):
+class DashboardResponse(ResponseBase):
     """Response schema for the full dashboard."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     user_id: int
     username: str
     display_name: str
@@ -74,3 +70,29 @@ class DashboardResponse(BaseModel):
     recent_submissions: list[RecentSubmissionResponse]
     notifications: list[DashboardNotificationResponse]
     stats: DashboardStatsResponse
+
+    @classmethod
+    def from_data(cls, dashboard) -> "DashboardResponse":
+        """Build the response from DashboardData without re-validating it.
+
+        The service's dataclasses mirror these schemas field for field, so
+        each section is constructed directly from the dataclass fields.
+        """
+        return cls.model_construct(
+            user_id=dashboard.user_id,
+            username=dashboard.username,
+            display_name=dashboard.display_name,
+            active_competitions=[
+                EnrolledCompetitionResponse.model_construct(**vars(c))
+                for c in dashboard.active_competitions
+            ],
+            recent_submissions=[
+                RecentSubmissionResponse.model_construct(**vars(s))
+                for s in dashboard.recent_submissions
+            ],
+            notifications=[
+                DashboardNotificationResponse.model_construct(**vars(n))
+                for n in dashboard.notifications
+            ],
+            stats=DashboardStatsResponse.model_construct(**vars(dashboard.stats)),
+        )
@@ -2,12 +2,16 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from src.api.schemas._base import ResponseBase
 
 
 class DataDictionaryEntryCreate(BaseModel):
     """Schema for creating a data dictionary entry."""
 
+    model_config = ConfigDict(defer_build=True)
+
     column_name: str = Field(max_length=255)
     definition: str | None = None
     encoding: str | None = None
@@ -17,13 +21,15 @@ class DataDictionaryEntryCreate(BaseModel):
 class DataDictionaryEntryUpdate(BaseModel):
     """Schema for updating a data dictionary entry."""
 
+    model_config = ConfigDict(defer_build=True)
+
     column_name: str | None = Field(default=None, max_length=255)
     definition: str | None = None
     encoding: str | None = None
     display_order: int | None = Field(default=None, ge=0)
 
 
-class DataDictionaryEntryResponse(BaseModel):
+class DataDictionaryEntryResponse(ResponseBase):
     """Schema for data dictionary entry response."""
 
     id: int
@@ -35,19 +41,24 @@ class DataDictionaryEntryResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class DataDictionaryBulkUpdate(BaseModel):
     """Schema for bulk updating data dictionary entries."""
 
+    model_config = ConfigDict(defer_build=True)
+
     entries: list[DataDictionaryEntryCreate]
 
 
+# Dumps a validated bulk update to the service's dicts in one pydantic-core call
+DATA_DICTIONARY_ENTRIES_ADAPTER = TypeAdapter(list[DataDictionaryEntryCreate])
+
+
 class ColumnInfoResponse(BaseModel):
     """Schema for column info from auto-detection."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     dtype: str
     sample_values: list[str]
@@ -59,9 +70,14 @@ class ColumnInfoResponse(BaseModel):
 
 
 class PreviewResponse(BaseModel):
-    """Schema for CSV file preview."""
+    """Schema for CSV file preview.
+
+    Values are grouped by column: ``data[column][i]`` is row ``i``'s value.
+    """
+
+    model_config = ConfigDict(defer_build=True)
 
     columns: list[str]
-    rows: list[dict[str, str]]
+    data: dict[str, list[str]]
     total_rows: int
     truncated: bool
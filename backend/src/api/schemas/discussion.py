@@ -2,23 +2,31 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from src.api.schemas._base import ResponseBase
 
-class AuthorInfo(BaseModel):
+
+class AuthorInfo(ResponseBase):
     """Basic author information."""
 
     id: int
     username: str
     display_name: str
 
-    class Config:
-        from_attributes = True
+    @classmethod
+    def from_user(cls, user) -> "AuthorInfo":
+        """Build author info from a User without re-validating it."""
+        return cls.model_construct(
+            id=user.id, username=user.username, display_name=user.display_name
+        )
 
 
 class ThreadCreate(BaseModel):
     """Schema for creating a discussion thread."""
 
+    model_config = ConfigDict(defer_build=True)
+
     title: str = Field(..., min_length=3, max_length=200)
     content: str = Field(..., min_length=10)
 
@@ -26,10 +34,12 @@ class ThreadCreate(BaseModel):
 class ReplyCreate(BaseModel):
     """Schema for creating a reply."""
 
+    model_config = ConfigDict(defer_build=True)
+
     content: str = Field(..., min_length=1)
 
 
-class ReplyResponse(BaseModel):
+class ReplyResponse(ResponseBase):
     """Schema for a reply response."""
 
     id: int
@@ -38,11 +48,8 @@ class ReplyResponse(BaseModel):
     author: AuthorInfo
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
-class ThreadListResponse(BaseModel):
+class ThreadListResponse(ResponseBase):
     """Schema for thread in list view (without replies)."""
 
     id: int
@@ -55,11 +62,8 @@ class ThreadListResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
 
-
-class ThreadDetailResponse(BaseModel):
+class ThreadDetailResponse(ResponseBase):
     """Schema for thread with replies."""
 
     id: int
@@ -73,13 +77,12 @@ class ThreadDetailResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class ThreadsListResponse(BaseModel):
     """Schema for paginated threads list."""
 
+    model_config = ConfigDict(defer_build=True)
+
     threads: list[ThreadListResponse]
     total: int
     skip: int
@@ -2,12 +2,16 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.api.schemas._base import ResponseBase
 
 
 class FAQCreate(BaseModel):
     """Schema for creating a FAQ entry."""
 
+    model_config = ConfigDict(defer_build=True)
+
     question: str = Field(min_length=5, max_length=500)
     answer: str = Field(min_length=5)
     display_order: int = Field(default=0, ge=0)
@@ -16,12 +20,14 @@ class FAQCreate(BaseModel):
 class FAQUpdate(BaseModel):
     """Schema for updating a FAQ entry."""
 
+    model_config = ConfigDict(defer_build=True)
+
     question: str | None = Field(default=None, min_length=5, max_length=500)
     answer: str | None = Field(default=None, min_length=5)
     display_order: int | None = Field(default=None, ge=0)
 
 
-class FAQResponse(BaseModel):
+class FAQResponse(ResponseBase):
     """Schema for FAQ response."""
 
     id: int
@@ -32,11 +38,10 @@ class FAQResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class FAQReorderRequest(BaseModel):
     """Schema for reordering FAQ entries."""
 
+    model_config = ConfigDict(defer_build=True)
+
     faq_ids: list[int] = Field(min_length=1, description="Ordered list of FAQ IDs")
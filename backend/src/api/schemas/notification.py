@@ -2,16 +2,15 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
+from src.api.schemas._base import ResponseBase
 from src.domain.models.notification import NotificationType
 
 
-class NotificationResponse(BaseModel):
+class NotificationResponse(ResponseBase):
     """Response schema for a notification."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     type: NotificationType
     title: str
@@ -25,18 +24,29 @@ class NotificationResponse(BaseModel):
 class NotificationListResponse(BaseModel):
     """Response schema for notification list."""
 
+    model_config = ConfigDict(defer_build=True)
+
     notifications: list[NotificationResponse]
     unread_count: int
 
 
+# Notification rows are validated in a single pydantic-core call rather than
+# one model_validate per row.
+NOTIFICATIONS_ADAPTER = TypeAdapter(list[NotificationResponse])
+
+
 class UnreadCountResponse(BaseModel):
     """Response schema for unread count."""
 
+    model_config = ConfigDict(defer_build=True)
+
     unread_count: int
 
 
 class MarkReadResponse(BaseModel):
     """Response schema for mark-as-read operations."""
 
+    model_config = ConfigDict(defer_build=True)
+
     success: bool
     marked_count: int
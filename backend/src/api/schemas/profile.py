@@ -4,20 +4,21 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from src.api.schemas._base import ResponseBase
 from src.domain.models.competition import CompetitionStatus
 
 
 class ProfileUpdate(BaseModel):
     """Schema for updating user profile."""
 
+    model_config = ConfigDict(defer_build=True)
+
     display_name: str | None = Field(default=None, min_length=1, max_length=255)
 
 
-class CompetitionParticipationResponse(BaseModel):
+class CompetitionParticipationResponse(ResponseBase):
     """Response schema for a competition participation."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     competition_id: int
     competition_title: str
     competition_slug: str
@@ -29,11 +30,9 @@ class CompetitionParticipationResponse(BaseModel):
     total_participants: int
 
 
-class UserProfileResponse(BaseModel):
+class UserProfileResponse(ResponseBase):
     """Response schema for user profile."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     username: str
     display_name: str
@@ -47,6 +46,8 @@ class UserProfileResponse(BaseModel):
 class ProfileStatsResponse(BaseModel):
     """Response schema for profile stats summary."""
 
+    model_config = ConfigDict(defer_build=True)
+
     competitions_entered: int
     total_submissions: int
     best_rank: int | None
@@ -2,10 +2,12 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
+from src.api.schemas._base import ResponseBase
 
-class RuleTemplateResponse(BaseModel):
+
+class RuleTemplateResponse(ResponseBase):
     """Schema for rule template response."""
 
     id: int
@@ -17,13 +19,26 @@ class RuleTemplateResponse(BaseModel):
     parameter_label: str | None
     display_order: int
 
-    class Config:
-        from_attributes = True
+    @classmethod
+    def from_template(cls, template) -> "RuleTemplateResponse":
+        """Create response from RuleTemplate model without re-validating it."""
+        return cls.model_construct(
+            id=template.id,
+            category=template.category,
+            title=template.title,
+            template_text=template.template_text,
+            has_parameter=template.has_parameter,
+            parameter_type=template.parameter_type,
+            parameter_label=template.parameter_label,
+            display_order=template.display_order,
+        )
 
 
 class CompetitionRuleCreate(BaseModel):
     """Schema for creating a competition rule."""
 
+    model_config = ConfigDict(defer_build=True)
+
     rule_template_id: int | None = None
     parameter_value: str | None = None
     custom_title: str | None = None
@@ -34,13 +49,15 @@ class CompetitionRuleCreate(BaseModel):
 class CompetitionRuleUpdate(BaseModel):
     """Schema for updating a competition rule."""
 
+    model_config = ConfigDict(defer_build=True)
+
     is_enabled: bool | None = None
     parameter_value: str | None = None
     custom_text: str | None = None
     display_order: int | None = Field(default=None, ge=0)
 
 
-class CompetitionRuleResponse(BaseModel):
+class CompetitionRuleResponse(ResponseBase):
     """Schema for competition rule response."""
 
     id: int
@@ -57,13 +74,11 @@ class CompetitionRuleResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
     @classmethod
     def from_rule(cls, rule) -> "CompetitionRuleResponse":
-        """Create response from CompetitionRule model."""
-        return cls(
+        """Create response from CompetitionRule model without re-validating it."""
+        template = rule.template
+        return cls.model_construct(
             id=rule.id,
             competition_id=rule.competition_id,
             rule_template_id=rule.rule_template_id,
@@ -74,7 +89,7 @@ class CompetitionRuleResponse(BaseModel):
             display_order=rule.display_order,
             title=rule.get_title(),
             rendered_text=rule.get_rendered_text(),
-            template=RuleTemplateResponse.model_validate(rule.template) if rule.template else None,
+            template=RuleTemplateResponse.from_template(template) if template else None,
             created_at=rule.created_at,
             updated_at=rule.updated_at,
         )
@@ -83,12 +98,20 @@ class CompetitionRuleResponse(BaseModel):
 class RuleBulkUpdate(BaseModel):
     """Schema for bulk updating competition rules."""
 
+    model_config = ConfigDict(defer_build=True)
+
     rules: list[CompetitionRuleCreate]
 
 
+# Dumps a validated bulk update to the service's dicts in one pydantic-core call
+COMPETITION_RULES_ADAPTER = TypeAdapter(list[CompetitionRuleCreate])
+
+
 class RuleDisplayItem(BaseModel):
     """A single rule with title and description."""
 
+    model_config = ConfigDict(defer_build=True)
+
     title: str
     description: str
 
@@ -96,5 +119,7 @@ class RuleDisplayItem(BaseModel):
 class RulesDisplayResponse(BaseModel):
     """Schema for displaying rules to participants (grouped by category)."""
 
+    model_config = ConfigDict(defer_build=True)
+
     category: str
     rules: list[RuleDisplayItem]
@@ -2,12 +2,13 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
+from src.api.schemas._base import ResponseBase
 from src.domain.models.submission import SubmissionStatus
 
 
-class SubmissionResponse(BaseModel):
+class SubmissionResponse(ResponseBase):
     """Schema for submission response."""
 
     id: int
@@ -20,26 +21,37 @@ class SubmissionResponse(BaseModel):
     error_message: str | None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
 
-
-class SubmissionListResponse(BaseModel):
+class SubmissionListResponse(ResponseBase):
     """Schema for submission list item."""
 
+    __slots__ = ()
+    model_config = ConfigDict(frozen=True)
+
     id: int
     file_name: str
     status: SubmissionStatus
     public_score: float | None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    @classmethod
+    def from_submission(cls, submission) -> "SubmissionListResponse":
+        """Build a list item from a Submission without re-validating it."""
+        return cls.model_construct(
+            id=submission.id,
+            file_name=submission.file_name,
+            status=submission.status,
+            public_score=submission.public_score,
+            created_at=submission.created_at,
+        )
 
 
 class LeaderboardEntry(BaseModel):
     """Schema for leaderboard entry."""
 
+    __slots__ = ()
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     rank: int
     user_id: int | None  # None for team entries
     username: str | None  # None for team entries
@@ -54,6 +66,8 @@ class LeaderboardEntry(BaseModel):
 class LeaderboardResponse(BaseModel):
     """Schema for leaderboard response."""
 
+    model_config = ConfigDict(defer_build=True)
+
     competition_id: int
     competition_title: str
     entries: list[LeaderboardEntry]
@@ -4,19 +4,23 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from src.api.schemas._base import ResponseBase
 from src.domain.models.team import TeamRole, InvitationStatus
 
 
 class TeamCreate(BaseModel):
     """Schema for creating a team."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str = Field(min_length=2, max_length=100)
 
 
-class TeamMemberResponse(BaseModel):
+class TeamMemberResponse(ResponseBase):
     """Response schema for a team member."""
 
-    model_config = ConfigDict(from_attributes=True)
+    __slots__ = ()
+    model_config = ConfigDict(frozen=True)
 
     user_id: int
     username: str
@@ -24,11 +28,20 @@ class TeamMemberResponse(BaseModel):
     role: TeamRole
     joined_at: datetime
 
+    @classmethod
+    def from_member(cls, member) -> "TeamMemberResponse":
+        """Build a member item from a TeamMemberInfo without re-validating it."""
+        return cls.model_construct(
+            user_id=member.user_id,
+            username=member.username,
+            display_name=member.display_name,
+            role=member.role,
+            joined_at=member.joined_at,
+        )
 
-class TeamResponse(BaseModel):
-    """Response schema for a team."""
 
-    model_config = ConfigDict(from_attributes=True)
+class TeamResponse(ResponseBase):
+    """Response schema for a team."""
 
     id: int
     name: str
@@ -38,11 +51,9 @@ class TeamResponse(BaseModel):
     created_at: datetime
 
 
-class TeamDetailResponse(BaseModel):
+class TeamDetailResponse(ResponseBase):
     """Response schema for team with members."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     name: str
     competition_id: int
@@ -55,14 +66,14 @@ class TeamDetailResponse(BaseModel):
 class TeamInviteRequest(BaseModel):
     """Request schema for inviting a member."""
 
+    model_config = ConfigDict(defer_build=True)
+
     username: str = Field(min_length=1, max_length=100)
 
 
-class TeamInvitationResponse(BaseModel):
+class TeamInvitationResponse(ResponseBase):
     """Response schema for a team invitation."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     team_id: int
     team_name: str
@@ -76,11 +87,15 @@ class TeamInvitationResponse(BaseModel):
 class TeamLeadershipTransferRequest(BaseModel):
     """Request schema for transferring leadership."""
 
+    model_config = ConfigDict(defer_build=True)
+
     new_leader_id: int
 
 
 class TeamActionResponse(BaseModel):
     """Generic response for team actions."""
 
+    model_config = ConfigDict(defer_build=True)
+
     message: str
     success: bool = True
@@ -0,0 +1,62 @@
+"""In-process caching utilities."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded in-memory cache whose entries expire after a time-to-live.
+
+    Expired entries are evicted lazily on access, and the oldest entry is
+    dropped once the cache is full. The cache is local to the worker process,
+    so it must only hold data that is safe to serve slightly stale.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept at once
+            ttl: Default time-to-live for entries, in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """Get a cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store a value, optionally overriding the default time-to-live."""
+        if key in self._data:
+            del self._data[key]
+        elif len(self._data) >= self.maxsize:
+            self._data.popitem(last=False)
+
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+
+    def pop(self, key: K) -> None:
+        """Remove a key from the cache if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
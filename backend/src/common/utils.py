@@ -1,8 +1,30 @@
 """Common utility functions."""
 
+import io
 import re
+import string
 import unicodedata
 
+from fastapi import UploadFile
+
+
+def _slug_table() -> dict[int, str | None]:
+    """Map every ASCII character to its lowercase slug form in one lookup."""
+    table: dict[int, str | None] = {}
+    for code in range(128):
+        char = chr(code).lower()
+        if char in string.ascii_lowercase or char in string.digits or char == "-":
+            table[code] = char
+        elif char.isspace() or char == "_":
+            table[code] = "-"
+        else:
+            table[code] = None
+    return table
+
+
+_SLUG_TABLE = _slug_table()
+_HYPHEN_RUN_RE = re.compile(r"-+")
+
 
 def slugify(text: str) -> str:
     """Convert text to URL-friendly slug.
@@ -11,23 +33,26 @@ def slugify(text: str) -> str:
         "My Competition Name" -> "my-competition-name"
         "Test #1: Special Characters!" -> "test-1-special-characters"
     """
-    # Normalize unicode characters
-    text = unicodedata.normalize("NFKD", text)
-    text = text.encode("ascii", "ignore").decode("ascii")
-
-    # Convert to lowercase
-    text = text.lower()
+    # Normalize unicode characters; plain ASCII titles have nothing to fold
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = text.encode("ascii", "ignore").decode("ascii")
 
-    # Replace spaces and underscores with hyphens
-    text = re.sub(r"[\s_]+", "-", text)
+    # Lowercase, turn spaces and underscores into hyphens and drop anything
+    # else that is not alphanumeric in a single pass
+    text = text.translate(_SLUG_TABLE)
 
-    # Remove non-alphanumeric characters (except hyphens)
-    text = re.sub(r"[^a-z0-9-]", "", text)
+    # Collapse hyphen runs and strip them from the ends
+    return _HYPHEN_RUN_RE.sub("-", text).strip("-")
 
-    # Remove multiple consecutive hyphens
-    text = re.sub(r"-+", "-", text)
 
-    # Strip leading/trailing hyphens
-    text = text.strip("-")
+def get_upload_size(file: UploadFile) -> int:
+    """Return the size of an upload without reading its content."""
+    if file.size is not None:
+        return file.size
 
-    return text
+    # Seeking the spooled file is cheap whether it is in memory or on disk
+    position = file.file.tell()
+    size = file.file.seek(0, io.SEEK_END)
+    file.file.seek(position)
+    return size
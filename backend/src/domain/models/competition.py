@@ -8,6 +8,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -77,37 +78,43 @@ class Competition(Base, TimestampMixin):
     # Media
     thumbnail_path: Mapped[str | None] = mapped_column(String(500))
 
-    # Relationships
+    # Relationships are never loaded implicitly; queries that need one opt in
+    # with selectinload(), so loading a competition costs a single SELECT.
     submissions: Mapped[list["Submission"]] = relationship(  # noqa: F821
         back_populates="competition",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     teams: Mapped[list["Team"]] = relationship(  # noqa: F821
         back_populates="competition",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     enrollments: Mapped[list["Enrollment"]] = relationship(  # noqa: F821
         back_populates="competition",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     discussion_threads: Mapped[list["DiscussionThread"]] = relationship(  # noqa: F821
         back_populates="competition",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     faqs: Mapped[list["CompetitionFAQ"]] = relationship(  # noqa: F821
         back_populates="competition",
-        lazy="selectin",
+        lazy="raise_on_sql",
         order_by="CompetitionFAQ.display_order",
     )
     files: Mapped[list["CompetitionFile"]] = relationship(  # noqa: F821
         back_populates="competition",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     rules: Mapped[list["CompetitionRule"]] = relationship(  # noqa: F821
         back_populates="competition",
-        lazy="selectin",
+        lazy="raise_on_sql",
         order_by="CompetitionRule.display_order",
     )
 
+    # Keyset pagination of a sponsor's competitions, newest first
+    __table_args__ = (
+        Index("ix_competitions_sponsor_id_id", "sponsor_id", "id"),
+    )
+
     def __repr__(self) -> str:
         return f"<Competition(id={self.id}, title={self.title})>"
@@ -32,7 +32,8 @@ class CompetitionFile(Base, TimestampMixin):
     )
     dictionary_entries: Mapped[list["DataDictionaryEntry"]] = relationship(  # noqa: F821
         back_populates="file",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
         order_by="DataDictionaryEntry.display_order",
     )
 
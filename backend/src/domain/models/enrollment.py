@@ -13,7 +13,8 @@ class Enrollment(Base, TimestampMixin):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
-    competition_id: Mapped[int] = mapped_column(ForeignKey("competitions.id"))
+    # The unique constraint leads with user_id, so it can't serve lookups by competition
+    competition_id: Mapped[int] = mapped_column(ForeignKey("competitions.id"), index=True)
 
     # Relationships
     user: Mapped["User"] = relationship(back_populates="enrollments")  # noqa: F821
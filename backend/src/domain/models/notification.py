@@ -3,7 +3,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.domain.models.base import Base, TimestampMixin
@@ -51,5 +51,17 @@ class Notification(Base, TimestampMixin):
         back_populates="notifications",
     )
 
+    __table_args__ = (
+        # Unread counts only touch the user's unread rows
+        Index(
+            "ix_notifications_user_id_unread",
+            "user_id",
+            postgresql_where=text("NOT is_read"),
+            sqlite_where=text("NOT is_read"),
+        ),
+        # A user's notifications, newest first
+        Index("ix_notifications_user_id_created_at", "user_id", text("created_at DESC")),
+    )
+
     def __repr__(self) -> str:
         return f"<Notification(id={self.id}, type={self.type.value}, read={self.is_read})>"
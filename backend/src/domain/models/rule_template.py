@@ -32,7 +32,7 @@ class RuleTemplate(Base, TimestampMixin):
     competition_rules: Mapped[list["CompetitionRule"]] = relationship(
         "CompetitionRule",
         back_populates="template",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     def __repr__(self) -> str:
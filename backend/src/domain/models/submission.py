@@ -3,7 +3,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, Float, ForeignKey, String, Text
+from sqlalchemy import DateTime, Enum, Float, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.domain.models.base import Base, TimestampMixin
@@ -53,5 +53,22 @@ class Submission(Base, TimestampMixin):
         back_populates="submissions",
     )
 
+    __table_args__ = (
+        # A user's submissions to a competition, newest first, and daily limits
+        Index(
+            "ix_submissions_competition_id_user_id_created_at",
+            "competition_id",
+            "user_id",
+            "created_at",
+        ),
+        # Scored submissions of a competition ranked by public score
+        Index(
+            "ix_submissions_competition_id_status_public_score",
+            "competition_id",
+            "status",
+            "public_score",
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Submission(id={self.id}, status={self.status.value})>"
@@ -45,7 +45,7 @@ class Team(Base, TimestampMixin):
     )
     submissions: Mapped[list["Submission"]] = relationship(  # noqa: F821
         back_populates="team",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     invitations: Mapped[list["TeamInvitation"]] = relationship(
         back_populates="team",
@@ -2,8 +2,9 @@
 
 import enum
 from datetime import datetime
+from functools import cached_property
 
-from sqlalchemy import Boolean, DateTime, Enum, String, func
+from sqlalchemy import Boolean, DateTime, Enum, String, event, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.domain.models.base import Base, TimestampMixin
@@ -34,45 +35,66 @@ class User(Base, TimestampMixin):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     last_login: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
-    # Relationships
+    # Relationships are never loaded implicitly; a user is read on every
+    # authenticated request and only its columns are needed there.
     submissions: Mapped[list["Submission"]] = relationship(  # noqa: F821
         back_populates="user",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     team_memberships: Mapped[list["TeamMember"]] = relationship(  # noqa: F821
         back_populates="user",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     sponsored_competitions: Mapped[list["Competition"]] = relationship(  # noqa: F821
         back_populates="sponsor",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     enrollments: Mapped[list["Enrollment"]] = relationship(  # noqa: F821
         back_populates="user",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     discussion_threads: Mapped[list["DiscussionThread"]] = relationship(  # noqa: F821
         back_populates="author",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     discussion_replies: Mapped[list["DiscussionReply"]] = relationship(  # noqa: F821
         back_populates="author",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     notifications: Mapped[list["Notification"]] = relationship(  # noqa: F821
         back_populates="user",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     sent_invitations: Mapped[list["TeamInvitation"]] = relationship(  # noqa: F821
         back_populates="inviter",
         foreign_keys="TeamInvitation.inviter_id",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     received_invitations: Mapped[list["TeamInvitation"]] = relationship(  # noqa: F821
         back_populates="invitee",
         foreign_keys="TeamInvitation.invitee_id",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
+    @cached_property
+    def is_admin(self) -> bool:
+        """Whether the user has the admin role."""
+        return self.role is UserRole.ADMIN
+
     def __repr__(self) -> str:
         return f"<User(id={self.id}, username={self.username})>"
+
+
+@event.listens_for(User.role, "set")
+def _reset_is_admin_on_set(target: User, value, oldvalue, initiator) -> None:
+    target.__dict__.pop("is_admin", None)
+
+
+@event.listens_for(User, "expire")
+def _reset_is_admin_on_expire(target: User, attrs) -> None:
+    target.__dict__.pop("is_admin", None)
+
+
+@event.listens_for(User, "refresh")
+def _reset_is_admin_on_refresh(target: User, context, attrs) -> None:
+    target.__dict__.pop("is_admin", None)
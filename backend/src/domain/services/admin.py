@@ -214,7 +214,7 @@ class AdminService:
         Raises:
             ValueError: If validation fails
         """
-        if admin.role != UserRole.ADMIN:
+        if not admin.is_admin:
             raise ValueError("Only admins can suspend users")
 
         user = await self.user_repo.get_by_id(user_id)
@@ -224,7 +224,7 @@ class AdminService:
         if user.id == admin.id:
             raise ValueError("Cannot suspend yourself")
 
-        if user.role == UserRole.ADMIN:
+        if user.is_admin:
             raise ValueError("Cannot suspend other admins")
 
         user.is_active = False
@@ -245,7 +245,7 @@ class AdminService:
         Raises:
             ValueError: If validation fails
         """
-        if admin.role != UserRole.ADMIN:
+        if not admin.is_admin:
             raise ValueError("Only admins can reactivate users")
 
         user = await self.user_repo.get_by_id(user_id)
@@ -273,7 +273,7 @@ class AdminService:
         Raises:
             ValueError: If validation fails
         """
-        if admin.role != UserRole.ADMIN:
+        if not admin.is_admin:
             raise ValueError("Only admins can change user roles")
 
         user = await self.user_repo.get_by_id(user_id)
@@ -318,7 +318,7 @@ class AdminService:
         Raises:
             ValueError: If validation fails
         """
-        if admin.role != UserRole.ADMIN:
+        if not admin.is_admin:
             raise ValueError("Only admins can lock threads")
 
         stmt = select(DiscussionThread).where(DiscussionThread.id == thread_id)
@@ -346,7 +346,7 @@ class AdminService:
         Raises:
             ValueError: If validation fails
         """
-        if admin.role != UserRole.ADMIN:
+        if not admin.is_admin:
             raise ValueError("Only admins can unlock threads")
 
         stmt = select(DiscussionThread).where(DiscussionThread.id == thread_id)
@@ -374,7 +374,7 @@ class AdminService:
         Raises:
             ValueError: If validation fails
         """
-        if admin.role != UserRole.ADMIN:
+        if not admin.is_admin:
             raise ValueError("Only admins can pin threads")
 
         stmt = select(DiscussionThread).where(DiscussionThread.id == thread_id)
@@ -402,7 +402,7 @@ class AdminService:
         Raises:
             ValueError: If validation fails
         """
-        if admin.role != UserRole.ADMIN:
+        if not admin.is_admin:
             raise ValueError("Only admins can unpin threads")
 
         stmt = select(DiscussionThread).where(DiscussionThread.id == thread_id)
@@ -2,17 +2,65 @@
 
 import csv
 import io
+import os
+from datetime import datetime
+from typing import BinaryIO
 
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.schemas.competition import CompetitionCreate, CompetitionUpdate
-from src.common.utils import slugify
+from src.common.utils import get_upload_size, slugify
 from src.domain.models.competition import Competition
 from src.domain.models.user import User
 from src.infrastructure.repositories.competition import CompetitionRepository
 from src.infrastructure.storage.factory import get_storage_backend
 
+# Largest accepted thumbnail upload, in bytes
+MAX_THUMBNAIL_SIZE = 5 * 1024 * 1024
+
+
+def _is_supported_image(header: bytes) -> bool:
+    """Check leading magic bytes for a PNG, JPEG, or WebP image."""
+    return (
+        header.startswith(b"\x89PNG\r\n\x1a\n")
+        or header.startswith(b"\xff\xd8\xff")
+        or (header[:4] == b"RIFF" and header[8:12] == b"WEBP")
+    )
+
+
+def _validate_truth_set(fileobj: BinaryIO) -> int:
+    """Validate a truth set CSV and return its number of data rows.
+
+    The file is parsed incrementally, so memory use stays bounded by the
+    reader's buffer rather than the size of the upload.
+
+    Raises:
+        ValueError: If the CSV is not UTF-8, lacks required columns, or has no rows
+    """
+    text = io.TextIOWrapper(fileobj, encoding="utf-8", newline="")
+    try:
+        reader = csv.reader(text)
+        fieldnames = next(reader, [])
+
+        if "id" not in fieldnames or "target" not in fieldnames:
+            raise ValueError(
+                "CSV must have 'id' and 'target' columns. "
+                f"Found columns: {', '.join(fieldnames)}"
+            )
+
+        row_count = sum(1 for row in reader if row)
+        if row_count == 0:
+            raise ValueError("CSV file is empty (no data rows)")
+
+        return row_count
+    except UnicodeDecodeError as e:
+        raise ValueError(f"File must be a valid UTF-8 encoded CSV: {e}")
+    finally:
+        # Leave the underlying upload open for the caller
+        text.detach()
+
 
 class CompetitionService:
     """Service for competition operations."""
@@ -21,6 +69,14 @@ class CompetitionService:
         self.session = session
         self.repo = CompetitionRepository(session)
 
+    async def _release_connection(self) -> None:
+        """End the current transaction so slow file work holds no pooled connection.
+
+        Loaded objects stay usable since sessions do not expire on commit; the
+        next query checks out a fresh connection.
+        """
+        await self.session.commit()
+
     async def create(self, data: CompetitionCreate, sponsor: User) -> Competition:
         """Create a new competition."""
         # Generate slug from title
@@ -57,125 +113,125 @@ class CompetitionService:
         """Get competition by slug."""
         return await self.repo.get_by_slug(slug)
 
-    async def list_active(self, skip: int = 0, limit: int = 20) -> list[Competition]:
-        """List active public competitions."""
-        return await self.repo.get_active(skip=skip, limit=limit)
+    async def list_active(
+        self, skip: int = 0, limit: int = 20, before: int | None = None
+    ) -> list[Competition]:
+        """List active public competitions, newest first."""
+        return await self.repo.get_active(skip=skip, limit=limit, before=before)
+
+    async def active_listing_version(self) -> tuple[int, datetime | None]:
+        """Get a value that changes whenever the active competition list changes."""
+        return await self.repo.get_active_version()
 
     async def list_by_sponsor(
-        self, sponsor_id: int, skip: int = 0, limit: int = 20
+        self, sponsor_id: int, skip: int = 0, limit: int = 20, before: int | None = None
     ) -> list[Competition]:
-        """List competitions by sponsor."""
-        return await self.repo.get_by_sponsor(sponsor_id, skip=skip, limit=limit)
+        """List competitions by sponsor, newest first."""
+        return await self.repo.get_by_sponsor(
+            sponsor_id, skip=skip, limit=limit, before=before
+        )
 
     async def update(
-        self, competition: Competition, data: CompetitionUpdate
-    ) -> Competition:
-        """Update a competition."""
+        self, competition_id: int, current_slug: str, data: CompetitionUpdate
+    ) -> Competition | None:
+        """Update a competition.
+
+        Args:
+            competition_id: ID of the competition to update
+            current_slug: The competition's slug before the update
+            data: Fields to change
+
+        Returns:
+            The updated competition, or None if it no longer exists
+        """
         update_data = data.model_dump(exclude_unset=True)
+        if not update_data:
+            return await self.repo.get_by_id(competition_id)
 
         # If title is being updated, regenerate slug
         if "title" in update_data:
             base_slug = slugify(update_data["title"])
             slug = base_slug
             counter = 1
-            while await self.repo.slug_exists(slug) and slug != competition.slug:
+            while await self.repo.slug_exists(slug) and slug != current_slug:
                 slug = f"{base_slug}-{counter}"
                 counter += 1
-            competition.slug = slug
+            update_data["slug"] = slug
 
-        for field, value in update_data.items():
-            if field != "title":  # title handled above with slug
-                setattr(competition, field, value)
-            else:
-                competition.title = value
+        return await self.repo.update_by_id(competition_id, update_data)
 
-        return await self.repo.update(competition)
+    async def delete(self, competition_id: int) -> bool:
+        """Delete a competition.
 
-    async def delete(self, competition: Competition) -> None:
-        """Delete a competition."""
-        await self.repo.delete(competition)
+        Returns:
+            True if the competition existed and was deleted
+        """
+        return await self.repo.delete_by_id(competition_id)
 
     async def upload_truth_set(
-        self, competition: Competition, file: UploadFile
-    ) -> Competition:
+        self, competition_id: int, file: UploadFile
+    ) -> Competition | None:
         """Upload a truth set CSV for scoring submissions.
 
         Args:
-            competition: The competition to upload the truth set for
+            competition_id: ID of the competition to upload the truth set for
             file: The uploaded CSV file
 
         Returns:
-            Updated competition with solution_path set
+            Updated competition with solution_path set, or None if it no longer exists
 
         Raises:
             ValueError: If CSV format is invalid (missing required columns)
         """
-        # Read and validate file content
-        content = await file.read()
-        await file.seek(0)  # Reset for potential re-read
-
-        # Validate CSV has required columns
-        try:
-            text_content = content.decode("utf-8")
-            reader = csv.DictReader(io.StringIO(text_content))
-            fieldnames = reader.fieldnames or []
-
-            if "id" not in fieldnames or "target" not in fieldnames:
-                raise ValueError(
-                    "CSV must have 'id' and 'target' columns. "
-                    f"Found columns: {', '.join(fieldnames)}"
-                )
-
-            # Verify we can read at least one row
-            rows = list(reader)
-            if not rows:
-                raise ValueError("CSV file is empty (no data rows)")
-
-        except UnicodeDecodeError as e:
-            raise ValueError(f"File must be a valid UTF-8 encoded CSV: {e}")
-
-        # Save file using storage backend
+        await self._release_connection()
+
+        # Validate the spooled upload in a worker thread without loading it
+        await file.seek(0)
+        await run_in_threadpool(_validate_truth_set, file.file)
+
+        # Stream the file into storage
+        await file.seek(0)
         storage = get_storage_backend()
-        storage_key = f"truth_sets/{competition.id}/solution.csv"
-        solution_path = await storage.save(storage_key, content)
+        storage_key = f"truth_sets/{competition_id}/solution.csv"
+        solution_path = await storage.save_file(storage_key, file.file)
 
         # Update competition
-        competition.solution_path = solution_path
-        return await self.repo.update(competition)
+        return await self.repo.update_by_id(competition_id, {"solution_path": solution_path})
 
     async def upload_thumbnail(
-        self, competition: Competition, file: UploadFile
-    ) -> Competition:
+        self, competition_id: int, file: UploadFile
+    ) -> Competition | None:
         """Upload a thumbnail image for the competition.
 
         Args:
-            competition: The competition to upload the thumbnail for
+            competition_id: ID of the competition to upload the thumbnail for
             file: The uploaded image file (PNG, JPG, JPEG, WebP)
 
         Returns:
-            Updated competition with thumbnail_path set
+            Updated competition with thumbnail_path set, or None if it no longer exists
 
         Raises:
             ValueError: If file format is invalid
         """
-        # Read file content
-        content = await file.read()
-        await file.seek(0)
-
-        # Validate file size (max 5MB)
-        max_size = 5 * 1024 * 1024  # 5MB
-        if len(content) > max_size:
+        # Reject oversized uploads before reading any of their content
+        if get_upload_size(file) > MAX_THUMBNAIL_SIZE:
             raise ValueError("Image file size cannot exceed 5MB")
 
+        await self._release_connection()
+
+        # Sniff the header only; the image itself is never decoded
+        await file.seek(0)
+        if not _is_supported_image(await file.read(12)):
+            raise ValueError("File content is not a PNG, JPEG, or WebP image")
+
         # Determine file extension from filename
-        filename = file.filename or "image.png"
-        ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else "png"
+        ext = os.path.splitext(file.filename or "")[1].lower().lstrip(".") or "png"
 
-        # Save file using storage backend
+        # Stream the file into storage
+        await file.seek(0)
         storage = get_storage_backend()
-        storage_key = f"thumbnails/{competition.id}/thumbnail.{ext}"
-        thumbnail_path = await storage.save(storage_key, content)
+        storage_key = f"thumbnails/{competition_id}/thumbnail.{ext}"
+        thumbnail_path = await storage.save_file(storage_key, file.file)
 
         # Update competition
-        competition.thumbnail_path = thumbnail_path
-        return await self.repo.update(competition)
+        return await self.repo.update_by_id(competition_id, {"thumbnail_path": thumbnail_path})
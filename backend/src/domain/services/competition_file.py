@@ -1,17 +1,67 @@
 """Competition file service."""
 
+import asyncio
 import mimetypes
 import uuid
+import zipfile
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
+from typing import Any, NamedTuple
+from urllib.parse import quote
 
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.schemas.competition_file import CompetitionFileUpdate
-from src.domain.models.competition import Competition
+from src.common.utils import get_upload_size
+from src.config import settings
 from src.domain.models.competition_file import CompetitionFile
 from src.infrastructure.storage.factory import get_storage_backend
 
+# Formats that are already compressed; deflating them again costs CPU for
+# next to no size reduction, so they are stored as-is in archives.
+_PRECOMPRESSED_EXTENSIONS = frozenset({".zip", ".gz", ".parquet", ".npz", ".pdf"})
+
+# Fast deflate for the remaining (mostly text) members; ratios on CSV data
+# are close to the default level at a fraction of the CPU time.
+ARCHIVE_DEFLATE_LEVEL = 1
+
+
+class ArchiveMember(NamedTuple):
+    """The columns of a competition file needed to add it to an archive."""
+
+    filename: str
+    file_path: str
+    created_at: datetime
+
+
+class _ZipSink:
+    """Write-only, unseekable buffer that a ZipFile streams its output into.
+
+    ZipFile falls back to data descriptors for unseekable files, so each
+    member can be written without knowing its size up front.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        """Return and clear everything written since the last drain."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
 
 class CompetitionFileService:
     """Service for competition file operations."""
@@ -35,6 +85,12 @@ class CompetitionFileService:
         ".npz",
     }
 
+    # Lifetime of pre-signed direct upload forms, in seconds
+    DIRECT_UPLOAD_EXPIRY = 3600
+
+    # Members opened ahead of the one being written when streaming an archive
+    ARCHIVE_PREFETCH = 4
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
         self.storage = get_storage_backend()
@@ -48,16 +104,36 @@ class CompetitionFileService:
         )
         return list(result.scalars().all())
 
-    async def get_by_id(self, file_id: int) -> CompetitionFile | None:
-        """Get a competition file by ID."""
+    async def list_archive_members(self, competition_id: int) -> list[ArchiveMember]:
+        """List a competition's files as plain rows for building an archive.
+
+        Only the columns the archive needs are selected, and no ORM objects
+        are built for them.
+        """
+        result = await self.session.execute(
+            select(
+                CompetitionFile.filename,
+                CompetitionFile.file_path,
+                CompetitionFile.created_at,
+            )
+            .where(CompetitionFile.competition_id == competition_id)
+            .order_by(CompetitionFile.created_at)
+        )
+        return [ArchiveMember(*row) for row in result]
+
+    async def get_by_id(self, competition_id: int, file_id: int) -> CompetitionFile | None:
+        """Get a file by ID, or None if it does not belong to the competition."""
         result = await self.session.execute(
-            select(CompetitionFile).where(CompetitionFile.id == file_id)
+            select(CompetitionFile).where(
+                CompetitionFile.id == file_id,
+                CompetitionFile.competition_id == competition_id,
+            )
         )
         return result.scalar_one_or_none()
 
     async def upload(
         self,
-        competition: Competition,
+        competition_id: int,
         file: UploadFile,
         display_name: str | None = None,
         purpose: str | None = None,
@@ -65,7 +141,7 @@ class CompetitionFileService:
         """Upload a file for a competition.
 
         Args:
-            competition: The competition to upload the file for
+            competition_id: ID of the competition to upload the file for
             file: The uploaded file
             display_name: Optional display name (defaults to filename)
             purpose: Optional description of file purpose
@@ -77,41 +153,132 @@ class CompetitionFileService:
             ValueError: If file validation fails
         """
         filename = file.filename or "unnamed_file"
+        self._validate_extension(filename)
 
-        # Validate file extension
-        ext = self._get_extension(filename).lower()
-        if ext not in self.ALLOWED_EXTENSIONS:
-            allowed = ", ".join(sorted(self.ALLOWED_EXTENSIONS))
-            raise ValueError(
-                f"File type '{ext}' not allowed. Allowed types: {allowed}"
-            )
+        # Reject oversized uploads before reading any of their content
+        file_size = get_upload_size(file)
+        if file_size > self.MAX_FILE_SIZE:
+            raise ValueError(self._size_error())
 
-        # Read file content
-        content = await file.read()
+        storage_key = self._new_storage_key(competition_id, filename)
 
-        # Validate file size
-        if len(content) > self.MAX_FILE_SIZE:
-            max_mb = self.MAX_FILE_SIZE // (1024 * 1024)
-            raise ValueError(f"File size exceeds maximum allowed ({max_mb}MB)")
+        # Stream the spooled upload into storage
+        await file.seek(0)
+        file_path = await self.storage.save_file(storage_key, file.file)
 
-        # Generate unique storage key
-        unique_id = uuid.uuid4().hex[:8]
-        storage_key = f"competition_files/{competition.id}/{unique_id}_{filename}"
+        return await self._create_record(
+            competition_id, filename, file_path, file_size, display_name, purpose
+        )
+
+    async def create_direct_upload(
+        self, competition_id: int, filename: str
+    ) -> dict[str, Any] | None:
+        """Get a pre-signed form for uploading a file straight to S3.
+
+        The client posts the file to storage itself and then calls
+        commit_direct_upload with the returned storage key.
+
+        Args:
+            competition_id: ID of the competition to upload the file for
+            filename: Name of the file to be uploaded
+
+        Returns:
+            Upload URL, form fields, storage key and expiry, or None if
+            direct uploads are not enabled
+
+        Raises:
+            ValueError: If the file type is not allowed
+        """
+        if not settings.s3_presigned_uploads or settings.storage_backend.lower() != "s3":
+            return None
 
-        # Save to storage
-        file_path = await self.storage.save(storage_key, content)
+        self._validate_extension(filename)
+        storage_key = self._new_storage_key(competition_id, filename)
+        expires_at = datetime.now(timezone.utc) + timedelta(
+            seconds=self.DIRECT_UPLOAD_EXPIRY
+        )
+        presigned = await self.storage.get_presigned_post(
+            storage_key, self.MAX_FILE_SIZE, self.DIRECT_UPLOAD_EXPIRY
+        )
+        if presigned is None:
+            return None
+        return {
+            "upload_url": presigned["url"],
+            "upload_fields": presigned["fields"],
+            "storage_key": storage_key,
+            "expires_at": expires_at,
+        }
+
+    async def commit_direct_upload(
+        self,
+        competition_id: int,
+        storage_key: str,
+        display_name: str | None = None,
+        purpose: str | None = None,
+    ) -> CompetitionFile:
+        """Record a file the client uploaded directly to storage.
+
+        Args:
+            competition_id: ID of the competition the file was uploaded for
+            storage_key: Key returned by create_direct_upload
+            display_name: Optional display name (defaults to filename)
+            purpose: Optional description of file purpose
 
-        # Detect file type
+        Returns:
+            Created CompetitionFile record
+
+        Raises:
+            ValueError: If the key is not an upload for this competition, the
+                object is missing, or it exceeds the size limit
+        """
+        if not settings.s3_presigned_uploads or settings.storage_backend.lower() != "s3":
+            raise ValueError("Direct uploads are not enabled")
+
+        # Keys look like competition_files/<competition_id>/<8 hex>_<filename>
+        prefix = f"competition_files/{competition_id}/"
+        name = storage_key.removeprefix(prefix)
+        if name == storage_key or len(name) < 10 or name[8] != "_":
+            raise ValueError("Invalid storage key")
+        filename = name[9:]
+        self._validate_extension(filename)
+
+        try:
+            file_size = await self.storage.get_size(storage_key)
+        except FileNotFoundError:
+            raise ValueError("Uploaded file not found in storage")
+
+        if file_size > self.MAX_FILE_SIZE:
+            await self.storage.delete(storage_key)
+            raise ValueError(self._size_error())
+
+        return await self._create_record(
+            competition_id,
+            filename,
+            self.storage.get_url(storage_key),
+            file_size,
+            display_name,
+            purpose,
+        )
+
+    async def _create_record(
+        self,
+        competition_id: int,
+        filename: str,
+        file_path: str,
+        file_size: int,
+        display_name: str | None,
+        purpose: str | None,
+    ) -> CompetitionFile:
+        """Create the database record for a stored file."""
         file_type, _ = mimetypes.guess_type(filename)
 
-        # Create database record
         competition_file = CompetitionFile(
-            competition_id=competition.id,
+            competition_id=competition_id,
             filename=filename,
             display_name=display_name or filename,
             purpose=purpose,
             file_path=file_path,
-            file_size=len(content),
+            file_size=file_size,
             file_type=file_type,
         )
 
@@ -145,17 +312,148 @@ class CompetitionFileService:
         await self.session.delete(competition_file)
         await self.session.commit()
 
-    async def get_download_content(self, competition_file: CompetitionFile) -> bytes:
-        """Get file content for download.
+    async def open_download_stream(
+        self,
+        competition_file: CompetitionFile | ArchiveMember,
+        chunk_size: int = 1024 * 1024,
+    ) -> AsyncGenerator[bytes, None]:
+        """Open file content for a chunked download.
 
         Args:
             competition_file: The file to download
+            chunk_size: Maximum size of each chunk in bytes
 
         Returns:
-            File content as bytes
+            An async generator over the file's content; aclose() it if it is
+            not read to the end
+
+        Raises:
+            FileNotFoundError: If the file is missing from storage
         """
         storage_key = self._extract_storage_key(competition_file.file_path)
-        return await self.storage.load(storage_key)
+        return await self.storage.open_stream(storage_key, chunk_size)
+
+    async def stream_archive(
+        self, files: list[ArchiveMember]
+    ) -> AsyncIterator[bytes]:
+        """Stream a zip archive of the given files.
+
+        Members are read from storage and compressed chunk by chunk, so memory
+        use stays bounded by the chunk size. The next few members are opened
+        while the current one is being archived, so storage round trips
+        overlap instead of adding up. Files missing from storage are left out
+        of the archive.
+        """
+        remaining = iter(files)
+        opening: deque[
+            tuple[ArchiveMember, asyncio.Future[AsyncGenerator[bytes, None]]]
+        ] = deque()
+
+        def prefetch() -> None:
+            while len(opening) < self.ARCHIVE_PREFETCH:
+                competition_file = next(remaining, None)
+                if competition_file is None:
+                    return
+                stream = asyncio.ensure_future(self.open_download_stream(competition_file))
+                opening.append((competition_file, stream))
+
+        sink = _ZipSink()
+        try:
+            with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as archive:
+                prefetch()
+                while opening:
+                    competition_file, stream = opening.popleft()
+                    prefetch()
+                    try:
+                        chunks = await stream
+                    except FileNotFoundError:
+                        continue
+
+                    # Close the member before the archive if the client goes away
+                    async with aclosing(chunks), aclosing(
+                        self._archive_member(archive, sink, competition_file, chunks)
+                    ) as member_data:
+                        async for data in member_data:
+                            yield data
+
+            # Central directory, written when the archive is closed
+            if data := sink.drain():
+                yield data
+        finally:
+            # Stop opening members if the client went away mid-download
+            for _, stream in opening:
+                stream.cancel()
+            await asyncio.gather(*(stream for _, stream in opening), return_exceptions=True)
+            # Members that finished opening hold a file or connection until closed
+            for _, stream in opening:
+                if not stream.cancelled() and stream.exception() is None:
+                    await stream.result().aclose()
+
+    async def _archive_member(
+        self,
+        archive: zipfile.ZipFile,
+        sink: "_ZipSink",
+        competition_file: ArchiveMember,
+        chunks: AsyncGenerator[bytes, None],
+    ) -> AsyncGenerator[bytes, None]:
+        """Write one file into the archive, yielding the archive bytes produced."""
+
+        info = zipfile.ZipInfo(
+            competition_file.filename,
+            date_time=competition_file.created_at.timetuple()[:6],
+        )
+        if self._get_extension(competition_file.filename).lower() in _PRECOMPRESSED_EXTENSIONS:
+            info.compress_type = zipfile.ZIP_STORED
+        else:
+            info.compress_type = zipfile.ZIP_DEFLATED
+            # Settable as _compresslevel on every supported Python version
+            info._compresslevel = ARCHIVE_DEFLATE_LEVEL
+        with archive.open(info, "w") as member:
+            async for chunk in chunks:
+                # Compression is CPU-bound; keep it off the event loop
+                await run_in_threadpool(member.write, chunk)
+                if data := sink.drain():
+                    yield data
+        if data := sink.drain():
+            yield data
+
+    def get_internal_redirect(self, competition_file: CompetitionFile) -> str | None:
+        """Get the nginx-internal path serving a file, if X-Accel-Redirect is enabled."""
+        prefix = settings.x_accel_redirect_prefix
+        if prefix is None or settings.storage_backend.lower() != "local":
+            return None
+
+        storage_key = self._extract_storage_key(competition_file.file_path)
+        return f"{prefix.rstrip('/')}/{quote(storage_key)}"
+
+    async def get_presigned_download_url(
+        self, competition_file: CompetitionFile
+    ) -> str | None:
+        """Get a pre-signed URL for a file, if downloads are redirected to S3."""
+        if not settings.s3_presigned_downloads or settings.storage_backend.lower() != "s3":
+            return None
+
+        storage_key = self._extract_storage_key(competition_file.file_path)
+        return await self.storage.get_presigned_url(storage_key)
+
+    def _validate_extension(self, filename: str) -> None:
+        """Raise ValueError if the file type is not allowed."""
+        ext = self._get_extension(filename).lower()
+        if ext not in self.ALLOWED_EXTENSIONS:
+            allowed = ", ".join(sorted(self.ALLOWED_EXTENSIONS))
+            raise ValueError(
+                f"File type '{ext}' not allowed. Allowed types: {allowed}"
+            )
+
+    def _size_error(self) -> str:
+        """Message for uploads over the size limit."""
+        max_mb = self.MAX_FILE_SIZE // (1024 * 1024)
+        return f"File size exceeds maximum allowed ({max_mb}MB)"
+
+    def _new_storage_key(self, competition_id: int, filename: str) -> str:
+        """Generate a unique storage key for a new file."""
+        unique_id = uuid.uuid4().hex[:8]
+        return f"competition_files/{competition_id}/{unique_id}_{filename}"
 
     def _get_extension(self, filename: str) -> str:
         """Extract file extension from filename."""
@@ -1,17 +1,22 @@
 """User dashboard service."""
 
-from dataclasses import dataclass
-from datetime import datetime
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Any, TypeVar
 
-from sqlalchemy import func, select
+from sqlalchemy import case, event, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session, selectinload
 
+from src.common.cache import TTLCache
 from src.domain.models.competition import Competition, CompetitionStatus
 from src.domain.models.enrollment import Enrollment
 from src.domain.models.notification import Notification
 from src.domain.models.submission import Submission, SubmissionStatus
 from src.domain.models.user import User
+from src.infrastructure.database import async_session_factory
 
 
 @dataclass
@@ -79,6 +84,34 @@ class DashboardStats:
     unread_notifications: int
 
 
+T = TypeVar("T")
+
+# Dashboards are polled, so results are reused briefly. Changes made through
+# this process invalidate a user's entries; anything else (other workers,
+# scoring tasks, competition edits) shows up within the TTL.
+_dashboard_cache: TTLCache[int, DashboardData] = TTLCache(maxsize=5_000, ttl=15)
+_stats_cache: TTLCache[int, DashboardStats] = TTLCache(maxsize=5_000, ttl=5)
+
+
+def invalidate_dashboard(user_id: int, session: AsyncSession) -> None:
+    """Drop a user's cached dashboard after a write to their data.
+
+    Call it once the write has been flushed. The entry is dropped again when
+    the session commits, since a dashboard read before then still saw the
+    old rows and may have been cached.
+    """
+    _dashboard_cache.pop(user_id)
+    _stats_cache.pop(user_id)
+    session.info.setdefault("dashboard_user_ids", set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_dashboards(session: Session) -> None:
+    for user_id in session.info.pop("dashboard_user_ids", ()):
+        _dashboard_cache.pop(user_id)
+        _stats_cache.pop(user_id)
+
+
 class DashboardService:
     """Service for user dashboard data aggregation."""
 
@@ -94,13 +127,27 @@ class DashboardService:
         Returns:
             DashboardData with competitions, submissions, and notifications
         """
-        # Fetch all data in parallel-ish (still sequential but organized)
-        active_competitions = await self._get_enrolled_competitions(user.id)
-        recent_submissions = await self._get_recent_submissions(user.id, limit=10)
-        notifications = await self._get_notifications(user.id, limit=10)
-        stats = await self._get_stats(user.id)
+        cached = _dashboard_cache.get(user.id)
+        if cached is not None:
+            # The user's own fields come from the current request
+            return replace(
+                cached, username=user.username, display_name=user.display_name
+            )
+
+        # The sections are independent, so fetch them concurrently. Each runs
+        # on its own session; end this session's transaction first so it
+        # holds no connection while they do.
+        await self.session.commit()
+        active_competitions, recent_submissions, notifications, stats = (
+            await asyncio.gather(
+                self._in_own_session(DashboardService._get_enrolled_competitions, user.id),
+                self._in_own_session(DashboardService._get_recent_submissions, user.id, 10),
+                self._in_own_session(DashboardService._get_notifications, user.id, 10),
+                self._in_own_session(DashboardService._get_stats, user.id),
+            )
+        )
 
-        return DashboardData(
+        dashboard = DashboardData(
             user_id=user.id,
             username=user.username,
             display_name=user.display_name,
@@ -109,19 +156,44 @@ class DashboardService:
             notifications=notifications,
             stats=stats,
         )
+        _dashboard_cache.set(user.id, dashboard)
+        return dashboard
+
+    async def get_stats(self, user_id: int) -> DashboardStats:
+        """Get quick stats for a user's dashboard.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            DashboardStats with enrollment, submission and notification counts
+        """
+        stats = _stats_cache.get(user_id)
+        if stats is None:
+            stats = await self._get_stats(user_id)
+            _stats_cache.set(user_id, stats)
+        return stats
+
+    async def _in_own_session(
+        self,
+        query: Callable[..., Awaitable[T]],
+        *args: Any,
+    ) -> T:
+        """Run a read-only query method on a fresh session.
+
+        A session cannot run statements concurrently, so each query that is
+        gathered gets its own session and connection.
+        """
+        async with async_session_factory() as session:
+            return await query(DashboardService(session), *args)
 
     async def _get_enrolled_competitions(
         self, user_id: int
     ) -> list[EnrolledCompetition]:
         """Get competitions the user is enrolled in, prioritizing active ones."""
-        from datetime import timezone
-
         now = datetime.now(timezone.utc)
 
-        # Get enrollments with competitions
         # Use CASE to prioritize active competitions first
-        from sqlalchemy import case
-
         status_priority = case(
             (Competition.status == CompetitionStatus.ACTIVE, 0),
             (Competition.status == CompetitionStatus.EVALUATION, 1),
@@ -131,9 +203,17 @@ class DashboardService:
             else_=5,
         )
 
+        # Only the columns the summary uses; neither entity is needed
         stmt = (
-            select(Enrollment, Competition)
-            .join(Competition, Enrollment.competition_id == Competition.id)
+            select(
+                Competition.id,
+                Competition.title,
+                Competition.slug,
+                Competition.status,
+                Competition.end_date,
+                Competition.evaluation_metric,
+            )
+            .join(Enrollment, Enrollment.competition_id == Competition.id)
             .where(Enrollment.user_id == user_id)
             .order_by(
                 # Active competitions first, then by end date
@@ -143,13 +223,12 @@ class DashboardService:
             .limit(10)
         )
         result = await self.session.execute(stmt)
-        enrollments = result.all()
 
         competitions = []
-        for enrollment, competition in enrollments:
+        for competition in result.all():
             # Calculate days remaining for active competitions
             days_remaining = None
-            if competition.status == CompetitionStatus.ACTIVE:
+            if competition.status is CompetitionStatus.ACTIVE:
                 end_date = competition.end_date
                 if end_date.tzinfo is None:
                     end_date = end_date.replace(tzinfo=timezone.utc)
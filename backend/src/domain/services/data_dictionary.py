@@ -30,10 +30,10 @@ class ColumnInfo:
 
 @dataclass
 class PreviewResult:
-    """Result of a CSV file preview."""
+    """Result of a CSV file preview, stored column by column."""
 
     columns: list[str]
-    rows: list[dict[str, str]]
+    data: dict[str, list[str]]
     total_rows: int
     truncated: bool
 
@@ -145,7 +145,7 @@ class DataDictionaryService:
             max_rows: Maximum number of rows to return
 
         Returns:
-            PreviewResult with columns, rows, and metadata
+            PreviewResult with columns, per-column values, and metadata
 
         Raises:
             ValueError: If file is not a CSV or cannot be parsed
@@ -167,21 +167,26 @@ class DataDictionaryService:
             except UnicodeDecodeError:
                 raise ValueError("File encoding not supported")
 
-        # Parse CSV
+        # Parse CSV into one list of values per column
         try:
-            reader = csv.DictReader(io.StringIO(text_content))
-            columns = reader.fieldnames or []
+            reader = csv.reader(io.StringIO(text_content))
+            columns = next(reader, [])
+            values: list[list[str]] = [[] for _ in columns]
 
-            rows = []
             total_rows = 0
             for row in reader:
+                if not row:
+                    continue
                 total_rows += 1
-                if len(rows) < max_rows:
-                    rows.append(row)
+                if total_rows <= max_rows:
+                    # Short rows are padded; extra fields have no column
+                    row.extend([""] * (len(columns) - len(row)))
+                    for column_values, value in zip(values, row):
+                        column_values.append(value)
 
             return PreviewResult(
                 columns=columns,
-                rows=rows,
+                data=dict(zip(columns, values)),
                 total_rows=total_rows,
                 truncated=total_rows > max_rows,
             )
@@ -51,9 +51,30 @@ class DiscussionService:
             competition_id, skip=skip, limit=limit
         )
 
-    async def get_thread(self, thread_id: int) -> DiscussionThread | None:
-        """Get a thread by ID with its replies."""
-        return await self.thread_repo.get_with_replies(thread_id)
+    async def get_threads_with_reply_counts(
+        self,
+        competition_id: int,
+        skip: int = 0,
+        limit: int = 50,
+    ) -> tuple[list[tuple[DiscussionThread, int]], int]:
+        """Get a page of threads with reply counts, plus the total thread count."""
+        return await self.thread_repo.get_by_competition_with_reply_counts(
+            competition_id, skip=skip, limit=limit
+        )
+
+    async def get_thread(
+        self, competition_id: int, thread_id: int
+    ) -> DiscussionThread | None:
+        """Get a thread in a competition with its replies."""
+        return await self.thread_repo.get_with_replies(competition_id, thread_id)
+
+    async def get_competition_thread_with_enrollment(
+        self, competition_id: int, thread_id: int, user_id: int
+    ) -> tuple[DiscussionThread, bool] | None:
+        """Get a thread in a competition plus whether the user is enrolled."""
+        return await self.thread_repo.get_in_competition_with_enrollment(
+            competition_id, thread_id, user_id
+        )
 
     async def get_thread_count(self, competition_id: int) -> int:
         """Get the number of threads in a competition."""
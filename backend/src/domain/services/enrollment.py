@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.models.competition import Competition, CompetitionStatus
 from src.domain.models.enrollment import Enrollment
+from src.domain.services.dashboard import invalidate_dashboard
 from src.infrastructure.repositories.competition import CompetitionRepository
 from src.infrastructure.repositories.enrollment import EnrollmentRepository
 
@@ -26,7 +27,7 @@ class EnrollmentService:
             raise ValueError("Competition not found")
 
         # Check if competition is active
-        if competition.status != CompetitionStatus.ACTIVE:
+        if competition.status is not CompetitionStatus.ACTIVE:
             raise ValueError("Competition is not accepting enrollments")
 
         # Check enrollment dates
@@ -55,7 +56,9 @@ class EnrollmentService:
             user_id=user_id,
             competition_id=competition_id,
         )
-        return await self.enrollment_repo.create(enrollment)
+        enrollment = await self.enrollment_repo.create(enrollment)
+        invalidate_dashboard(user_id, self.session)
+        return enrollment
 
     async def unenroll(self, user_id: int, competition_id: int) -> bool:
         """Remove a user's enrollment from a competition."""
@@ -63,9 +66,11 @@ class EnrollmentService:
         if not await self.enrollment_repo.is_enrolled(user_id, competition_id):
             raise ValueError("Not enrolled in this competition")
 
-        return await self.enrollment_repo.delete_by_user_and_competition(
+        deleted = await self.enrollment_repo.delete_by_user_and_competition(
             user_id, competition_id
         )
+        invalidate_dashboard(user_id, self.session)
+        return deleted
 
     async def is_enrolled(self, user_id: int, competition_id: int) -> bool:
         """Check if a user is enrolled in a competition."""
@@ -1,6 +1,6 @@
 """FAQ service."""
 
-from sqlalchemy import select
+from sqlalchemy import case, delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.schemas.faq import FAQCreate, FAQUpdate
@@ -42,32 +42,69 @@ class FAQService:
         await self.db.refresh(faq)
         return faq
 
-    async def update(self, faq: CompetitionFAQ, data: FAQUpdate) -> CompetitionFAQ:
-        """Update a FAQ entry."""
+    async def update(
+        self, competition_id: int, faq_id: int, data: FAQUpdate
+    ) -> CompetitionFAQ | None:
+        """Update a competition's FAQ entry in a single statement.
+
+        Returns:
+            The updated FAQ, or None if the competition has no such FAQ
+        """
         update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(faq, field, value)
+        if not update_data:
+            faq = await self.get_by_id(faq_id)
+            return faq if faq is not None and faq.competition_id == competition_id else None
+
+        stmt = (
+            update(CompetitionFAQ)
+            .where(
+                CompetitionFAQ.id == faq_id,
+                CompetitionFAQ.competition_id == competition_id,
+            )
+            .values(**update_data)
+            .returning(CompetitionFAQ)
+        )
+        result = await self.db.execute(
+            select(CompetitionFAQ)
+            .from_statement(stmt)
+            .execution_options(populate_existing=True)
+        )
+        faq = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(faq)
         return faq
 
-    async def delete(self, faq: CompetitionFAQ) -> None:
-        """Delete a FAQ entry."""
-        await self.db.delete(faq)
+    async def delete(self, competition_id: int, faq_id: int) -> bool:
+        """Delete a competition's FAQ entry in a single statement.
+
+        Returns:
+            True if the FAQ existed and was deleted
+        """
+        result = await self.db.execute(
+            delete(CompetitionFAQ)
+            .where(
+                CompetitionFAQ.id == faq_id,
+                CompetitionFAQ.competition_id == competition_id,
+            )
+            .returning(CompetitionFAQ.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
         await self.db.commit()
+        return deleted
 
     async def reorder(self, competition_id: int, faq_ids: list[int]) -> list[CompetitionFAQ]:
         """Reorder FAQ entries by setting their display_order based on the order in faq_ids."""
-        for order, faq_id in enumerate(faq_ids):
-            result = await self.db.execute(
-                select(CompetitionFAQ).where(
-                    CompetitionFAQ.id == faq_id,
+        if faq_ids:
+            # Later positions win for repeated IDs, as with sequential updates
+            orders = {faq_id: order for order, faq_id in enumerate(faq_ids)}
+            await self.db.execute(
+                update(CompetitionFAQ)
+                .where(
                     CompetitionFAQ.competition_id == competition_id,
+                    CompetitionFAQ.id.in_(orders),
                 )
+                .values(display_order=case(orders, value=CompetitionFAQ.id))
+                .execution_options(synchronize_session="fetch")
             )
-            faq = result.scalar_one_or_none()
-            if faq:
-                faq.display_order = order
 
         await self.db.commit()
         return await self.list_by_competition(competition_id)
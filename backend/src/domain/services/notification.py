@@ -4,6 +4,7 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.models.notification import Notification, NotificationType
+from src.domain.services.dashboard import invalidate_dashboard
 from src.infrastructure.repositories.notification import NotificationRepository
 
 logger = logging.getLogger(__name__)
@@ -43,7 +44,9 @@ class NotificationService:
             message=message,
             link=link,
         )
-        return await self.repo.create(notification)
+        notification = await self.repo.create(notification)
+        invalidate_dashboard(user_id, self.session)
+        return notification
 
     async def get_user_notifications(
         self,
@@ -67,6 +70,28 @@ class NotificationService:
             user_id, unread_only=unread_only, skip=skip, limit=limit
         )
 
+    async def get_user_notifications_with_unread_count(
+        self,
+        user_id: int,
+        unread_only: bool = False,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> tuple[list[Notification], int]:
+        """Get a page of notifications for a user plus their unread count.
+
+        Args:
+            user_id: User ID
+            unread_only: If True, only return unread notifications
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (notifications, unread count)
+        """
+        return await self.repo.get_by_user_with_unread_count(
+            user_id, unread_only=unread_only, skip=skip, limit=limit
+        )
+
     async def get_unread_count(self, user_id: int) -> int:
         """Get count of unread notifications for a user.
 
@@ -88,7 +113,9 @@ class NotificationService:
         Returns:
             True if notification was marked as read
         """
-        return await self.repo.mark_as_read(notification_id, user_id)
+        marked = await self.repo.mark_as_read(notification_id, user_id)
+        invalidate_dashboard(user_id, self.session)
+        return marked
 
     async def mark_all_as_read(self, user_id: int) -> int:
         """Mark all notifications as read for a user.
@@ -99,7 +126,9 @@ class NotificationService:
         Returns:
             Number of notifications marked as read
         """
-        return await self.repo.mark_all_as_read(user_id)
+        count = await self.repo.mark_all_as_read(user_id)
+        invalidate_dashboard(user_id, self.session)
+        return count
 
     # Notification triggers - convenience methods for common notification types
 
@@ -3,14 +3,14 @@
 from dataclasses import dataclass
 from datetime import datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.models.competition import Competition, CompetitionStatus
 from src.domain.models.enrollment import Enrollment
 from src.domain.models.submission import Submission, SubmissionStatus
 from src.domain.models.user import User
-from src.domain.scoring.metrics import is_lower_better
+from src.domain.scoring.metrics import LOWER_IS_BETTER, is_lower_better
 from src.infrastructure.repositories.user import UserRepository
 
 
@@ -43,6 +43,16 @@ class UserProfile:
     participations: list[CompetitionParticipation]
 
 
+@dataclass
+class ProfileStats:
+    """Summary counts for a user's public profile."""
+
+    competitions_entered: int
+    total_submissions: int
+    best_rank: int | None
+    active_competitions: int
+
+
 class ProfileService:
     """Service for user profile operations."""
 
@@ -99,6 +109,101 @@ class ProfileService:
             participations=participations,
         )
 
+    async def get_stats(self, username: str) -> ProfileStats | None:
+        """Get profile stats for a user without loading their participations.
+
+        The counts and the best rank across competitions are computed by the
+        database in a single statement.
+
+        Args:
+            username: Username to look up
+
+        Returns:
+            ProfileStats if user exists, None otherwise
+        """
+        user = await self.user_repo.get_by_username(username)
+        if not user:
+            return None
+
+        enrolled_ids = select(Enrollment.competition_id).where(
+            Enrollment.user_id == user.id
+        )
+
+        competitions_entered = (
+            select(func.count(Enrollment.id))
+            .where(Enrollment.user_id == user.id)
+            .scalar_subquery()
+        )
+        active_competitions = (
+            select(func.count(Enrollment.id))
+            .join(Competition, Enrollment.competition_id == Competition.id)
+            .where(Enrollment.user_id == user.id)
+            .where(Competition.status == CompetitionStatus.ACTIVE)
+            .scalar_subquery()
+        )
+        total_submissions = (
+            select(func.count(Submission.id))
+            .where(Submission.user_id == user.id)
+            .where(Submission.competition_id.in_(enrolled_ids))
+            .scalar_subquery()
+        )
+
+        # Every participant's best score in the user's competitions, ranked
+        # per competition in the direction of its metric
+        lower_better = func.replace(
+            func.lower(Competition.evaluation_metric), "-", "_"
+        ).in_(LOWER_IS_BETTER)
+        best_scores = (
+            select(
+                Submission.competition_id,
+                Submission.user_id,
+                case(
+                    (lower_better, func.min(Submission.public_score)),
+                    else_=-func.max(Submission.public_score),
+                ).label("sort_score"),
+            )
+            .join(Competition, Submission.competition_id == Competition.id)
+            .where(Submission.competition_id.in_(enrolled_ids))
+            .where(Submission.status == SubmissionStatus.SCORED)
+            .group_by(
+                Submission.competition_id,
+                Submission.user_id,
+                Competition.evaluation_metric,
+            )
+            .subquery()
+        )
+        ranks = select(
+            best_scores.c.user_id,
+            func.row_number()
+            .over(
+                partition_by=best_scores.c.competition_id,
+                order_by=best_scores.c.sort_score,
+            )
+            .label("rank"),
+        ).subquery()
+        best_rank = (
+            select(func.min(ranks.c.rank))
+            .where(ranks.c.user_id == user.id)
+            .scalar_subquery()
+        )
+
+        result = await self.session.execute(
+            select(
+                competitions_entered,
+                total_submissions,
+                best_rank,
+                active_competitions,
+            )
+        )
+        row = result.one()
+
+        return ProfileStats(
+            competitions_entered=row[0],
+            total_submissions=row[1],
+            best_rank=row[2],
+            active_competitions=row[3],
+        )
+
     async def _get_participations(self, user_id: int) -> list[CompetitionParticipation]:
         """Get user's competition participations with stats.
 
@@ -221,10 +221,13 @@ class RuleService:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    async def get_rule(self, rule_id: int) -> CompetitionRule | None:
-        """Get a specific competition rule by ID."""
+    async def get_rule(self, competition_id: int, rule_id: int) -> CompetitionRule | None:
+        """Get a rule by ID, or None if it does not belong to the competition."""
         result = await self.db.execute(
-            select(CompetitionRule).where(CompetitionRule.id == rule_id)
+            select(CompetitionRule).where(
+                CompetitionRule.id == rule_id,
+                CompetitionRule.competition_id == competition_id,
+            )
         )
         return result.scalar_one_or_none()
 
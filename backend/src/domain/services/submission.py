@@ -2,24 +2,50 @@
 
 import logging
 import uuid
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from fastapi import UploadFile
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.common.cache import TTLCache
 from src.config import settings
 from src.domain.models.competition import Competition, CompetitionStatus
 from src.domain.models.submission import Submission, SubmissionStatus
 from src.domain.models.user import User
 from src.domain.scoring.scorer import create_scorer_for_competition
 from src.domain.scoring.validation import validate_submission
+from src.domain.services.dashboard import invalidate_dashboard
 from src.infrastructure.repositories.submission import SubmissionRepository
 from src.infrastructure.storage import get_storage_backend, StorageBackend
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class Leaderboard:
+    """A page of a competition's leaderboard."""
+
+    entries: list[dict]
+    is_team_competition: bool
+    # Every ranked participant, not just those on this page
+    total_participants: int
+
+
+# Leaderboards are read far more often than they change. Entries are held per
+# competition, keyed by limit, and dropped when this process scores a
+# submission; scores set by the scoring workers show up within the TTL.
+_leaderboard_cache: TTLCache[int, dict[int, Leaderboard]] = TTLCache(
+    maxsize=1_000, ttl=30
+)
+
+
+def invalidate_leaderboard(competition_id: int) -> None:
+    """Drop a competition's cached leaderboards after one of its scores changed."""
+    _leaderboard_cache.pop(competition_id)
+
+
 class SubmissionService:
     """Service for submission operations."""
 
@@ -40,7 +66,7 @@ class SubmissionService:
     ) -> Submission:
         """Submit a file for a competition."""
         # Check competition is active
-        if competition.status != CompetitionStatus.ACTIVE:
+        if competition.status is not CompetitionStatus.ACTIVE:
             raise ValueError("Competition is not accepting submissions")
 
         # Check submission deadline
@@ -60,7 +86,6 @@ class SubmissionService:
 
         # Read file content for validation
         content = await file.read()
-        await file.seek(0)  # Reset for saving
 
         # Pre-validate submission format
         validation = validate_submission(
@@ -86,6 +111,7 @@ class SubmissionService:
         )
 
         submission = await self.repo.create(submission)
+        invalidate_dashboard(user.id, self.session)
 
         # Score the submission (sync or async based on config)
         if settings.async_scoring_enabled:
@@ -125,9 +151,10 @@ class SubmissionService:
         unique_name = f"{uuid.uuid4()}.{ext}"
         storage_key = f"submissions/{competition_id}/{user_id}/{unique_name}"
 
-        # Read and save file
-        content = await file.read()
-        return await self.storage.save(storage_key, content)
+        # Stream the spooled upload from the start rather than reading it
+        # into memory a second time
+        await file.seek(0)
+        return await self.storage.save_file(storage_key, file.file)
 
     async def _score_submission(
         self,
@@ -161,6 +188,7 @@ class SubmissionService:
             submission.error_message = f"Scoring error: {str(e)}"
 
         await self.repo.update(submission)
+        invalidate_leaderboard(submission.competition_id)
 
         # Send notification
         await self._send_scoring_notification(submission, competition)
@@ -174,6 +202,7 @@ class SubmissionService:
         submission.private_score = round(random.uniform(0.5, 0.95), 4)
         submission.scored_at = datetime.now(timezone.utc)
         await self.repo.update(submission)
+        invalidate_leaderboard(submission.competition_id)
 
         # Send notification
         await self._send_scoring_notification(submission, competition)
@@ -187,14 +216,14 @@ class SubmissionService:
         try:
             notification_service = NotificationService(self.session)
 
-            if submission.status == SubmissionStatus.SCORED:
+            if submission.status is SubmissionStatus.SCORED:
                 await notification_service.notify_submission_scored(
                     user_id=submission.user_id,
                     competition_title=competition.title,
                     competition_slug=competition.slug,
                     score=submission.public_score,
                 )
-            elif submission.status == SubmissionStatus.FAILED:
+            elif submission.status is SubmissionStatus.FAILED:
                 await notification_service.notify_submission_failed(
                     user_id=submission.user_id,
                     competition_title=competition.title,
@@ -225,16 +254,29 @@ class SubmissionService:
 
     async def get_leaderboard(
         self, competition: Competition, limit: int = 100
-    ) -> tuple[list[dict], bool]:
+    ) -> Leaderboard:
         """Get competition leaderboard.
 
         Rankings are determined by:
         1. Best score (direction depends on metric - lower is better for RMSE/MAE)
         2. Tie-break: earliest submission time wins
 
-        Returns:
-            Tuple of (leaderboard entries, is_team_competition)
+        Results are cached briefly per competition and limit.
         """
+        by_limit = _leaderboard_cache.get(competition.id)
+        if by_limit is None:
+            by_limit = {}
+            _leaderboard_cache.set(competition.id, by_limit)
+        elif limit in by_limit:
+            return by_limit[limit]
+
+        by_limit[limit] = await self._compute_leaderboard(competition, limit)
+        return by_limit[limit]
+
+    async def _compute_leaderboard(
+        self, competition: Competition, limit: int
+    ) -> Leaderboard:
+        """Rank a competition's participants by their best scored submission."""
         from src.domain.scoring.metrics import is_lower_better
 
         lower_better = is_lower_better(competition.evaluation_metric)
@@ -247,13 +289,14 @@ class SubmissionService:
             best_score_agg = func.max(Submission.public_score)
 
         if is_team_competition:
-            return await self._get_team_leaderboard(
+            entries, total = await self._get_team_leaderboard(
                 competition, best_score_agg, lower_better, limit
-            ), True
+            )
         else:
-            return await self._get_user_leaderboard(
+            entries, total = await self._get_user_leaderboard(
                 competition, best_score_agg, lower_better, limit
-            ), False
+            )
+        return Leaderboard(entries, is_team_competition, total)
 
     async def _get_user_leaderboard(
         self,
@@ -261,8 +304,12 @@ class SubmissionService:
         best_score_agg,
         lower_better: bool,
         limit: int,
-    ) -> list[dict]:
-        """Get user-based leaderboard for solo competitions."""
+    ) -> tuple[list[dict], int]:
+        """Get user-based leaderboard for solo competitions.
+
+        Returns:
+            Tuple of (leaderboard entries, number of ranked users)
+        """
         # Query for best scores per user
         stmt = (
             select(
@@ -271,6 +318,8 @@ class SubmissionService:
                 func.count(Submission.id).label("submission_count"),
                 func.max(Submission.created_at).label("last_submission"),
                 func.min(Submission.created_at).label("first_submission"),
+                # Counts every group, before the limit applies
+                func.count().over().label("total_participants"),
             )
             .where(Submission.competition_id == competition.id)
             .where(Submission.status == SubmissionStatus.SCORED)
@@ -314,7 +363,8 @@ class SubmissionService:
                     "last_submission": row.last_submission,
                 })
 
-        return leaderboard
+        total = rows[0].total_participants if rows else 0
+        return leaderboard, total
 
     async def _get_team_leaderboard(
         self,
@@ -322,12 +372,15 @@ class SubmissionService:
         best_score_agg,
         lower_better: bool,
         limit: int,
-    ) -> list[dict]:
+    ) -> tuple[list[dict], int]:
         """Get team-based leaderboard for team competitions.
 
         For team competitions:
         - Individual users without a team are shown with their user info
         - Users on teams are grouped by team
+
+        Returns:
+            Tuple of (leaderboard entries, number of ranked teams and users)
         """
         from src.domain.models.team import Team
         from src.infrastructure.repositories.user import UserRepository
@@ -431,4 +484,4 @@ class SubmissionService:
                 "last_submission": entry["last_submission"],
             })
 
-        return leaderboard
+        return leaderboard, len(entries)
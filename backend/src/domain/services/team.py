@@ -2,7 +2,9 @@
 
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
+from functools import cached_property
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.models.team import (
@@ -38,6 +40,17 @@ class TeamInfo:
     created_at: datetime
 
 
+@dataclass
+class TeamSummary:
+    """Team listing entry."""
+
+    id: int
+    name: str
+    competition_id: int
+    member_count: int
+    created_at: datetime
+
+
 @dataclass
 class TeamMemberInfo:
     """Team member information."""
@@ -49,17 +62,51 @@ class TeamMemberInfo:
     joined_at: datetime
 
 
+@dataclass
+class InvitationInfo:
+    """Pending invitation with its team and inviter."""
+
+    id: int
+    team_id: int
+    team_name: str
+    competition_id: int
+    inviter_username: str
+    status: InvitationStatus
+    expires_at: datetime
+    created_at: datetime
+
+
 class TeamService:
     """Service for team operations."""
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
-        self.team_repo = TeamRepository(session)
-        self.invitation_repo = TeamInvitationRepository(session)
-        self.competition_repo = CompetitionRepository(session)
-        self.enrollment_repo = EnrollmentRepository(session)
-        self.user_repo = UserRepository(session)
-        self.notification_service = NotificationService(session)
+
+    # Collaborators are built on first use; most requests only need one or two
+
+    @cached_property
+    def team_repo(self) -> TeamRepository:
+        return TeamRepository(self.session)
+
+    @cached_property
+    def invitation_repo(self) -> TeamInvitationRepository:
+        return TeamInvitationRepository(self.session)
+
+    @cached_property
+    def competition_repo(self) -> CompetitionRepository:
+        return CompetitionRepository(self.session)
+
+    @cached_property
+    def enrollment_repo(self) -> EnrollmentRepository:
+        return EnrollmentRepository(self.session)
+
+    @cached_property
+    def user_repo(self) -> UserRepository:
+        return UserRepository(self.session)
+
+    @cached_property
+    def notification_service(self) -> NotificationService:
+        return NotificationService(self.session)
 
     async def create_team(
         self, name: str, competition_id: int, creator: User
@@ -126,48 +173,62 @@ class TeamService:
 
     async def get_team_info(self, team_id: int) -> TeamInfo | None:
         """Get detailed team information."""
-        team = await self.team_repo.get_by_id(team_id)
-        if not team:
+        rows = await self.team_repo.get_with_members(team_id)
+        return self._team_info(rows)
+
+    async def get_user_team_info(
+        self, user_id: int, competition_id: int
+    ) -> TeamInfo | None:
+        """Get detailed information on the team a user belongs to in a competition."""
+        rows = await self.team_repo.get_user_team_with_members(user_id, competition_id)
+        return self._team_info(rows)
+
+    @staticmethod
+    def _team_info(rows: list[Row]) -> TeamInfo | None:
+        """Assemble a TeamInfo from a team's member rows."""
+        if not rows:
             return None
 
-        competition = await self.competition_repo.get_by_id(team.competition_id)
-        members = await self.team_repo.get_team_members(team_id)
-
-        member_infos = []
-        for member in members:
-            user = await self.user_repo.get_by_id(member.user_id)
-            if user:
-                member_infos.append(
-                    TeamMemberInfo(
-                        user_id=user.id,
-                        username=user.username,
-                        display_name=user.display_name,
-                        role=member.role,
-                        joined_at=member.created_at,
-                    )
-                )
+        team = rows[0]
+        members = [
+            TeamMemberInfo(
+                user_id=row.user_id,
+                username=row.username,
+                display_name=row.display_name,
+                role=row.role,
+                joined_at=row.joined_at,
+            )
+            for row in rows
+            if row.user_id is not None
+        ]
 
         return TeamInfo(
             id=team.id,
             name=team.name,
             competition_id=team.competition_id,
             member_count=len(members),
-            max_size=competition.max_team_size if competition else 1,
-            members=member_infos,
+            max_size=team.max_team_size,
+            members=members,
             created_at=team.created_at,
         )
 
-    async def get_user_team(self, user_id: int, competition_id: int) -> Team | None:
-        """Get the team a user belongs to in a competition."""
-        return await self.team_repo.get_user_team(user_id, competition_id)
-
     async def list_teams(
         self, competition_id: int, skip: int = 0, limit: int = 100
-    ) -> list[Team]:
-        """List all teams in a competition."""
-        return await self.team_repo.get_by_competition(
+    ) -> list[TeamSummary]:
+        """List all teams in a competition with their member counts."""
+        rows = await self.team_repo.get_by_competition_with_member_counts(
             competition_id, skip=skip, limit=limit
         )
+        return [
+            TeamSummary(
+                id=row.id,
+                name=row.name,
+                competition_id=row.competition_id,
+                member_count=row.member_count,
+                created_at=row.created_at,
+            )
+            for row in rows
+        ]
 
     async def invite_member(
         self, team_id: int, invitee_username: str, inviter: User
@@ -191,7 +252,7 @@ class TeamService:
 
         # Check inviter is team leader
         inviter_member = await self.team_repo.get_member(team_id, inviter.id)
-        if not inviter_member or inviter_member.role != TeamRole.LEADER:
+        if not inviter_member or inviter_member.role is not TeamRole.LEADER:
             raise ValueError("Only team leaders can invite members")
 
         # Get invitee
@@ -266,7 +327,7 @@ class TeamService:
         if invitation.invitee_id != user.id:
             raise ValueError("This invitation is not for you")
 
-        if invitation.status != InvitationStatus.PENDING:
+        if invitation.status is not InvitationStatus.PENDING:
             raise ValueError("This invitation is no longer pending")
 
         # Handle timezone-aware and naive datetimes (SQLite returns naive)
@@ -308,7 +369,7 @@ class TeamService:
         # Notify team leader
         leader_member = next(
             (m for m in await self.team_repo.get_team_members(team.id)
-             if m.role == TeamRole.LEADER),
+             if m.role is TeamRole.LEADER),
             None,
         )
         if leader_member:
@@ -341,7 +402,7 @@ class TeamService:
         if invitation.invitee_id != user.id:
             raise ValueError("This invitation is not for you")
 
-        if invitation.status != InvitationStatus.PENDING:
+        if invitation.status is not InvitationStatus.PENDING:
             raise ValueError("This invitation is no longer pending")
 
         invitation.status = InvitationStatus.DECLINED
@@ -365,7 +426,7 @@ class TeamService:
         if not member:
             raise ValueError("You are not a member of this team")
 
-        if member.role == TeamRole.LEADER:
+        if member.role is TeamRole.LEADER:
             # If leader leaves, promote someone else or dissolve team
             members = await self.team_repo.get_team_members(team_id)
             other_members = [m for m in members if m.user_id != user.id]
@@ -399,7 +460,7 @@ class TeamService:
 
         # Check remover is leader
         remover_member = await self.team_repo.get_member(team_id, remover.id)
-        if not remover_member or remover_member.role != TeamRole.LEADER:
+        if not remover_member or remover_member.role is not TeamRole.LEADER:
             raise ValueError("Only team leaders can remove members")
 
         if member_user_id == remover.id:
@@ -422,9 +483,24 @@ class TeamService:
 
         await self.session.commit()
 
-    async def get_pending_invitations(self, user: User) -> list[TeamInvitation]:
-        """Get all pending invitations for a user."""
-        return await self.invitation_repo.get_pending_for_user(user.id)
+    async def get_pending_invitations_with_details(
+        self, user: User
+    ) -> list[InvitationInfo]:
+        """Get all pending invitations for a user, with team and inviter details."""
+        rows = await self.invitation_repo.get_pending_details_for_user(user.id)
+        return [
+            InvitationInfo(
+                id=row.id,
+                team_id=row.team_id,
+                team_name=row.team_name,
+                competition_id=row.competition_id,
+                inviter_username=row.inviter_username or "Unknown",
+                status=row.status,
+                expires_at=row.expires_at,
+                created_at=row.created_at,
+            )
+            for row in rows
+        ]
 
     async def transfer_leadership(
         self, team_id: int, new_leader_id: int, current_leader: User
@@ -445,7 +521,7 @@ class TeamService:
 
         # Check current user is leader
         current_member = await self.team_repo.get_member(team_id, current_leader.id)
-        if not current_member or current_member.role != TeamRole.LEADER:
+        if not current_member or current_member.role is not TeamRole.LEADER:
             raise ValueError("Only the team leader can transfer leadership")
 
         # Check new leader is a member
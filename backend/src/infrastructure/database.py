@@ -1,14 +1,38 @@
 """Database connection and session management."""
 
 from collections.abc import AsyncGenerator
+from contextvars import ContextVar
+from typing import Any
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.config import settings
 
+
+def _connect_args() -> dict[str, Any]:
+    """Driver arguments for the configured database connection."""
+    if not settings.db_pgbouncer:
+        return {}
+
+    # pgbouncer hands each transaction to any server connection, so asyncpg
+    # must not cache prepared statements or reuse their names
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+
+
 engine = create_async_engine(
     settings.database_url,
+    connect_args=_connect_args(),
     echo=settings.debug,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
     pool_pre_ping=True,
 )
 
@@ -18,9 +42,51 @@ async_session_factory = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Session shared by everything handling the current HTTP request
+_request_session: ContextVar[AsyncSession | None] = ContextVar(
+    "request_session", default=None
+)
+
+
+class DBSessionMiddleware:
+    """ASGI middleware that scopes one database session to each HTTP request.
+
+    The session only checks out a connection once it is first used, so
+    requests that never touch the database do not hold a pooled connection.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with async_session_factory() as session:
+            token = _request_session.set(session)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                _request_session.reset(token)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency that provides a database session."""
+    """Dependency that provides a database session.
+
+    Reuses the request's session when one is set up by DBSessionMiddleware,
+    otherwise opens a session for the caller.
+    """
+    session = _request_session.get()
+    if session is not None:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        return
+
     async with async_session_factory() as session:
         try:
             yield session
@@ -1,6 +1,9 @@
 """Competition repository."""
 
-from sqlalchemy import select
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Row, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.models.competition import Competition, CompetitionStatus
@@ -19,28 +22,71 @@ class CompetitionRepository(BaseRepository[Competition]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_active(self, *, skip: int = 0, limit: int = 100) -> list[Competition]:
-        """Get all active competitions."""
+    async def get_active(
+        self, *, skip: int = 0, limit: int = 100, before: int | None = None
+    ) -> list[Competition]:
+        """Get all active competitions, newest first.
+
+        Pass the last ID of the previous page as ``before`` to page by key
+        rather than offset.
+        """
         stmt = (
             select(Competition)
             .where(Competition.status == CompetitionStatus.ACTIVE)
             .where(Competition.is_public.is_(True))
+            .order_by(Competition.id.desc())
             .offset(skip)
             .limit(limit)
         )
+        if before is not None:
+            stmt = stmt.where(Competition.id < before)
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_ref_by_slug(self, slug: str) -> Row[tuple[int, str, int, int]] | None:
+        """Get the id, slug, sponsor_id and max_team_size of a competition without loading it."""
+        stmt = select(
+            Competition.id,
+            Competition.slug,
+            Competition.sponsor_id,
+            Competition.max_team_size,
+        ).where(Competition.slug == slug)
+        result = await self.session.execute(stmt)
+        return result.one_or_none()
+
+    async def get_active_version(self) -> tuple[int, datetime | None]:
+        """Get the count and latest update time of active competitions."""
+        stmt = (
+            select(func.count(Competition.id), func.max(Competition.updated_at))
+            .where(Competition.status == CompetitionStatus.ACTIVE)
+            .where(Competition.is_public.is_(True))
+        )
+        result = await self.session.execute(stmt)
+        count, last_updated = result.one()
+        return count, last_updated
+
     async def get_by_sponsor(
-        self, sponsor_id: int, *, skip: int = 0, limit: int = 100
+        self,
+        sponsor_id: int,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        before: int | None = None,
     ) -> list[Competition]:
-        """Get competitions by sponsor."""
+        """Get competitions by sponsor, newest first.
+
+        Pass the last ID of the previous page as ``before`` to page by key
+        rather than offset.
+        """
         stmt = (
             select(Competition)
             .where(Competition.sponsor_id == sponsor_id)
+            .order_by(Competition.id.desc())
             .offset(skip)
             .limit(limit)
         )
+        if before is not None:
+            stmt = stmt.where(Competition.id < before)
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
@@ -48,3 +94,34 @@ class CompetitionRepository(BaseRepository[Competition]):
         """Check if slug is already in use."""
         competition = await self.get_by_slug(slug)
         return competition is not None
+
+    async def update_by_id(
+        self, competition_id: int, values: dict[str, Any]
+    ) -> Competition | None:
+        """Update a competition in a single statement and return the new row."""
+        stmt = (
+            update(Competition)
+            .where(Competition.id == competition_id)
+            .values(**values)
+            .returning(Competition)
+        )
+        result = await self.session.execute(
+            select(Competition)
+            .from_statement(stmt)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def delete_by_id(self, competition_id: int) -> bool:
+        """Delete a competition in a single statement.
+
+        Returns:
+            True if a competition was deleted
+        """
+        stmt = (
+            delete(Competition)
+            .where(Competition.id == competition_id)
+            .returning(Competition.id)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() is not None
@@ -1,10 +1,11 @@
 """Discussion repository."""
 
-from sqlalchemy import select
+from sqlalchemy import exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.domain.models.discussion import DiscussionThread, DiscussionReply
+from src.domain.models.enrollment import Enrollment
 from src.infrastructure.repositories.base import BaseRepository
 
 
@@ -36,16 +37,78 @@ class DiscussionThreadRepository(BaseRepository[DiscussionThread]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
-    async def get_with_replies(self, thread_id: int) -> DiscussionThread | None:
-        """Get a thread with all its replies loaded."""
+    async def get_by_competition_with_reply_counts(
+        self,
+        competition_id: int,
+        *,
+        skip: int = 0,
+        limit: int = 50,
+    ) -> tuple[list[tuple[DiscussionThread, int]], int]:
+        """Get a page of threads with their reply counts and the thread total.
+
+        The total comes from a window function over the grouped threads, so
+        the page, reply counts and total share one query.
+        """
+        stmt = (
+            select(
+                DiscussionThread,
+                func.count(DiscussionReply.id).label("reply_count"),
+                func.count().over().label("total"),
+            )
+            .outerjoin(DiscussionReply)
+            .where(DiscussionThread.competition_id == competition_id)
+            .options(selectinload(DiscussionThread.author))
+            .group_by(DiscussionThread.id)
+            .order_by(
+                DiscussionThread.is_pinned.desc(),
+                DiscussionThread.created_at.desc(),
+            )
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        if rows:
+            total = rows[0].total
+        elif skip:
+            # Paged past the end, so no row carried the total
+            total = await self.count_by_competition(competition_id)
+        else:
+            total = 0
+        return [(thread, reply_count) for thread, reply_count, _ in rows], total
+
+    async def get_in_competition_with_enrollment(
+        self, competition_id: int, thread_id: int, user_id: int
+    ) -> tuple[DiscussionThread, bool] | None:
+        """Get a thread in a competition and whether a user is enrolled in it.
+
+        Returns None if the thread does not belong to the competition.
+        """
+        is_enrolled = exists().where(
+            Enrollment.user_id == user_id,
+            Enrollment.competition_id == competition_id,
+        )
+        stmt = select(DiscussionThread, is_enrolled.label("is_enrolled")).where(
+            DiscussionThread.id == thread_id,
+            DiscussionThread.competition_id == competition_id,
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        return None if row is None else (row[0], bool(row[1]))
+
+    async def get_with_replies(
+        self, competition_id: int, thread_id: int
+    ) -> DiscussionThread | None:
+        """Get a thread in a competition with all its replies loaded."""
         stmt = (
             select(DiscussionThread)
-            .where(DiscussionThread.id == thread_id)
+            .where(
+                DiscussionThread.id == thread_id,
+                DiscussionThread.competition_id == competition_id,
+            )
             .options(
                 selectinload(DiscussionThread.author),
-                selectinload(DiscussionThread.replies).selectinload(
-                    DiscussionReply.author
-                ),
+                selectinload(DiscussionThread.replies).selectinload(DiscussionReply.author),
             )
             .execution_options(populate_existing=True)
         )
@@ -47,6 +47,55 @@ class NotificationRepository(BaseRepository[Notification]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_by_user_with_unread_count(
+        self,
+        user_id: int,
+        unread_only: bool = False,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> tuple[list[Notification], int]:
+        """Get a page of notifications for a user plus their unread count.
+
+        The unread count comes from a filtered window function over all of
+        the user's matching notifications, so both share one query.
+
+        Args:
+            user_id: User ID
+            unread_only: If True, only return unread notifications
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (notifications newest first, unread count)
+        """
+        stmt = (
+            select(
+                Notification,
+                func.count()
+                .filter(Notification.is_read == False)  # noqa: E712
+                .over()
+                .label("unread_total"),
+            )
+            .where(Notification.user_id == user_id)
+            .order_by(Notification.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+
+        if unread_only:
+            stmt = stmt.where(Notification.is_read == False)  # noqa: E712
+
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        if rows:
+            unread_count = rows[0].unread_total
+        elif skip:
+            # Paged past the end, so no row carried the count
+            unread_count = await self.count_unread(user_id)
+        else:
+            unread_count = 0
+        return [notification for notification, _ in rows], unread_count
+
     async def count_unread(self, user_id: int) -> int:
         """Count unread notifications for a user.
 
@@ -2,10 +2,12 @@
 
 from datetime import datetime, timezone
 
-from sqlalchemy import func, select, delete
+from sqlalchemy import ColumnElement, Row, func, select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.domain.models.competition import Competition
 from src.domain.models.team import Team, TeamMember, TeamInvitation, InvitationStatus, TeamRole
+from src.domain.models.user import User
 from src.infrastructure.repositories.base import BaseRepository
 
 
@@ -27,18 +29,78 @@ class TeamRepository(BaseRepository[Team]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_by_competition(
+    async def get_by_competition_with_member_counts(
         self, competition_id: int, *, skip: int = 0, limit: int = 100
-    ) -> list[Team]:
-        """Get all teams for a competition."""
+    ) -> list[Row]:
+        """Get a page of a competition's teams with their member counts.
+
+        Only the team's own columns are selected, so none of its
+        relationships are loaded.
+        """
         stmt = (
-            select(Team)
+            select(
+                Team.id,
+                Team.name,
+                Team.competition_id,
+                Team.created_at,
+                func.count(TeamMember.id).label("member_count"),
+            )
+            .outerjoin(TeamMember, TeamMember.team_id == Team.id)
             .where(Team.competition_id == competition_id)
+            .group_by(Team.id)
+            .order_by(Team.id)
             .offset(skip)
             .limit(limit)
         )
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.all())
+
+    async def get_with_members(self, team_id: int) -> list[Row]:
+        """Get a team's columns, its competition's team size and its members.
+
+        Returns one row per member, ordered by join order, with the team's
+        fields repeated on each; a team without members yields a single row
+        whose member fields are None. No row means the team does not exist.
+        """
+        return await self._get_with_members(Team.id == team_id)
+
+    async def get_user_team_with_members(
+        self, user_id: int, competition_id: int
+    ) -> list[Row]:
+        """Like get_with_members, for the team a user belongs to in a competition."""
+        user_team_id = (
+            select(TeamMember.team_id)
+            .join(Team, Team.id == TeamMember.team_id)
+            .where(TeamMember.user_id == user_id)
+            .where(Team.competition_id == competition_id)
+            .correlate(None)
+            .scalar_subquery()
+        )
+        return await self._get_with_members(Team.id == user_team_id)
+
+    async def _get_with_members(self, team_filter: ColumnElement[bool]) -> list[Row]:
+        """Select the member rows of the team matching the filter."""
+        stmt = (
+            select(
+                Team.id,
+                Team.name,
+                Team.competition_id,
+                Team.created_at,
+                Competition.max_team_size,
+                TeamMember.user_id,
+                TeamMember.role,
+                TeamMember.created_at.label("joined_at"),
+                User.username,
+                User.display_name,
+            )
+            .join(Competition, Competition.id == Team.competition_id)
+            .outerjoin(TeamMember, TeamMember.team_id == Team.id)
+            .outerjoin(User, User.id == TeamMember.user_id)
+            .where(team_filter)
+            .order_by(TeamMember.id)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
 
     async def get_user_team(self, user_id: int, competition_id: int) -> Team | None:
         """Get the team a user belongs to in a specific competition."""
@@ -111,18 +173,33 @@ class TeamInvitationRepository(BaseRepository[TeamInvitation]):
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session, TeamInvitation)
 
-    async def get_pending_for_user(self, user_id: int) -> list[TeamInvitation]:
-        """Get all pending invitations for a user."""
+    async def get_pending_details_for_user(self, user_id: int) -> list[Row]:
+        """Get all pending invitations for a user with their team and inviter.
+
+        Each row carries the invitation's columns plus `team_name`,
+        `competition_id` and `inviter_username` (None if the inviter is gone).
+        """
         now = datetime.now(timezone.utc)
         stmt = (
-            select(TeamInvitation)
+            select(
+                TeamInvitation.id,
+                TeamInvitation.team_id,
+                Team.name.label("team_name"),
+                Team.competition_id,
+                User.username.label("inviter_username"),
+                TeamInvitation.status,
+                TeamInvitation.expires_at,
+                TeamInvitation.created_at,
+            )
+            .join(Team, Team.id == TeamInvitation.team_id)
+            .outerjoin(User, User.id == TeamInvitation.inviter_id)
             .where(TeamInvitation.invitee_id == user_id)
             .where(TeamInvitation.status == InvitationStatus.PENDING)
             .where(TeamInvitation.expires_at > now)
             .order_by(TeamInvitation.created_at.desc())
         )
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.all())
 
     async def get_pending_for_team(self, team_id: int) -> list[TeamInvitation]:
         """Get all pending invitations for a team."""
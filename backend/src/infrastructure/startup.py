@@ -49,7 +49,7 @@ async def bootstrap_admin_user(session: AsyncSession) -> None:
 
     if existing_user:
         # User exists - check if they're already admin
-        if existing_user.role == UserRole.ADMIN:
+        if existing_user.role is UserRole.ADMIN:
             logger.debug(f"Admin user already exists: {email}")
         else:
             # Promote to admin
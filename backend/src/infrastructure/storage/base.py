@@ -1,9 +1,24 @@
 """Base storage backend protocol."""
 
-from typing import Protocol, BinaryIO
+from collections.abc import AsyncGenerator
+from typing import Any, Protocol, BinaryIO
 from pathlib import Path
 
 
+async def start_stream(
+    chunks: AsyncGenerator[bytes, None],
+) -> AsyncGenerator[bytes, None]:
+    """Run a chunk generator up to its first, empty, chunk and return it.
+
+    Backends acquire their file or connection inside the generator and yield
+    an empty chunk once it is open. Starting it here reports a missing file
+    before any content is consumed, and means aclose() always runs the
+    generator's cleanup; closing a generator that never started skips it.
+    """
+    await anext(chunks)
+    return chunks
+
+
 class StorageBackend(Protocol):
     """Protocol defining the storage backend interface.
 
@@ -23,6 +38,21 @@ class StorageBackend(Protocol):
         """
         ...
 
+    async def save_file(self, key: str, fileobj: BinaryIO) -> str:
+        """Save the contents of a file object to storage.
+
+        The file is read in chunks from its current position, so large
+        uploads never need to be held in memory.
+
+        Args:
+            key: The storage key/path for the file
+            fileobj: A readable binary file object
+
+        Returns:
+            The storage URI/path where the file was saved
+        """
+        ...
+
     async def load(self, key: str) -> bytes:
         """Load content from storage.
 
@@ -37,6 +67,27 @@ class StorageBackend(Protocol):
         """
         ...
 
+    async def open_stream(
+        self, key: str, chunk_size: int = 1024 * 1024
+    ) -> AsyncGenerator[bytes, None]:
+        """Open a file for reading in chunks.
+
+        The file is opened eagerly, so a missing file is reported before any
+        chunk is consumed, e.g. before a streaming response has started.
+        Callers that stop early must aclose() the stream to release it.
+
+        Args:
+            key: The storage key/path for the file
+            chunk_size: Maximum size of each chunk in bytes
+
+        Returns:
+            An async generator over the file's content
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        ...
+
     async def delete(self, key: str) -> bool:
         """Delete a file from storage.
 
@@ -59,6 +110,20 @@ class StorageBackend(Protocol):
         """
         ...
 
+    async def get_size(self, key: str) -> int:
+        """Get the size of a file without reading it.
+
+        Args:
+            key: The storage key/path for the file
+
+        Returns:
+            File size in bytes
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        ...
+
     def get_url(self, key: str) -> str:
         """Get a URL/path for accessing the file.
 
@@ -72,3 +137,31 @@ class StorageBackend(Protocol):
             URL or path to access the file
         """
         ...
+
+    async def get_presigned_url(self, key: str, expires_in: int = 3600) -> str | None:
+        """Get a pre-signed URL granting temporary access to a file.
+
+        Args:
+            key: The storage key/path for the file
+            expires_in: URL expiration time in seconds
+
+        Returns:
+            Pre-signed URL, or None if the backend can't issue one
+        """
+        ...
+
+    async def get_presigned_post(
+        self, key: str, max_size: int, expires_in: int = 3600
+    ) -> dict[str, Any] | None:
+        """Get a pre-signed form for uploading a file straight to storage.
+
+        Args:
+            key: The storage key/path the upload is stored under
+            max_size: Largest accepted upload, in bytes
+            expires_in: Form expiration time in seconds
+
+        Returns:
+            Dict with the form "url" and the "fields" to submit with the file,
+            or None if the backend doesn't accept direct uploads
+        """
+        ...
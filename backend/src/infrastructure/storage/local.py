@@ -1,9 +1,17 @@
 """Local filesystem storage backend."""
 
-import aiofiles
+import shutil
+from collections.abc import AsyncGenerator
 from pathlib import Path
+from typing import Any, BinaryIO
+
+from fastapi.concurrency import run_in_threadpool
 
 from src.config import settings
+from src.infrastructure.storage.base import start_stream
+
+# Copy buffer size for streaming saves
+CHUNK_SIZE = 64 * 1024
 
 
 class LocalStorageBackend:
@@ -11,6 +19,8 @@ class LocalStorageBackend:
 
     Files are stored under a configurable base directory.
     Keys are treated as relative paths within that directory.
+    Each operation's blocking file I/O runs as a single call in a worker
+    thread, so the event loop never waits on the disk.
     """
 
     def __init__(self, base_dir: str | None = None):
@@ -37,13 +47,33 @@ class LocalStorageBackend:
         """
         full_path = self._get_full_path(key)
 
-        # Ensure parent directories exist
-        full_path.parent.mkdir(parents=True, exist_ok=True)
+        def write() -> None:
+            # Ensure parent directories exist
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            full_path.write_bytes(content)
+
+        await run_in_threadpool(write)
+        return str(full_path)
+
+    async def save_file(self, key: str, fileobj: BinaryIO) -> str:
+        """Stream a file object to the local filesystem.
+
+        Args:
+            key: Relative path within the base directory
+            fileobj: A readable binary file object
 
-        # Write file asynchronously
-        async with aiofiles.open(full_path, "wb") as f:
-            await f.write(content)
+        Returns:
+            The full path where the file was saved
+        """
+        full_path = self._get_full_path(key)
 
+        def copy() -> None:
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(full_path, "wb") as f:
+                shutil.copyfileobj(fileobj, f, CHUNK_SIZE)
+
+        # One worker-thread hop for the whole copy, rather than one per chunk
+        await run_in_threadpool(copy)
         return str(full_path)
 
     async def load(self, key: str) -> bytes:
@@ -58,13 +88,41 @@ class LocalStorageBackend:
         Raises:
             FileNotFoundError: If the file doesn't exist
         """
-        full_path = self._get_full_path(key)
+        try:
+            return await run_in_threadpool(self._get_full_path(key).read_bytes)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {key}")
 
-        if not full_path.exists():
+    async def open_stream(
+        self, key: str, chunk_size: int = 1024 * 1024
+    ) -> AsyncGenerator[bytes, None]:
+        """Open a file on the local filesystem for reading in chunks.
+
+        Args:
+            key: Relative path within the base directory
+            chunk_size: Maximum size of each chunk in bytes
+
+        Returns:
+            An async generator over the file's content
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        try:
+            return await start_stream(self._iter_file(self._get_full_path(key), chunk_size))
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {key}")
 
-        async with aiofiles.open(full_path, "rb") as f:
-            return await f.read()
+    @staticmethod
+    async def _iter_file(path: Path, chunk_size: int) -> AsyncGenerator[bytes, None]:
+        """Open a file and yield its chunks, reading each in a worker thread."""
+        f = await run_in_threadpool(open, path, "rb")
+        try:
+            yield b""
+            while chunk := await run_in_threadpool(f.read, chunk_size):
+                yield chunk
+        finally:
+            f.close()
 
     async def delete(self, key: str) -> bool:
         """Delete a file from local filesystem.
@@ -75,12 +133,11 @@ class LocalStorageBackend:
         Returns:
             True if deleted, False if file didn't exist
         """
-        full_path = self._get_full_path(key)
-
-        if full_path.exists():
-            full_path.unlink()
-            return True
-        return False
+        try:
+            await run_in_threadpool(self._get_full_path(key).unlink)
+        except FileNotFoundError:
+            return False
+        return True
 
     async def exists(self, key: str) -> bool:
         """Check if a file exists in local filesystem.
@@ -93,6 +150,24 @@ class LocalStorageBackend:
         """
         return self._get_full_path(key).exists()
 
+    async def get_size(self, key: str) -> int:
+        """Get the size of a file on the local filesystem.
+
+        Args:
+            key: Relative path within the base directory
+
+        Returns:
+            File size in bytes
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        try:
+            stat = await run_in_threadpool(self._get_full_path(key).stat)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {key}")
+        return stat.st_size
+
     def get_url(self, key: str) -> str:
         """Get the filesystem path for a file.
 
@@ -103,3 +178,21 @@ class LocalStorageBackend:
             Full filesystem path
         """
         return str(self._get_full_path(key))
+
+    async def get_presigned_url(self, key: str, expires_in: int = 3600) -> str | None:
+        """Local files have no pre-signed URLs; they are served by the app.
+
+        Returns:
+            Always None
+        """
+        return None
+
+    async def get_presigned_post(
+        self, key: str, max_size: int, expires_in: int = 3600
+    ) -> dict[str, Any] | None:
+        """Local storage only accepts uploads through the app.
+
+        Returns:
+            Always None
+        """
+        return None
@@ -1,9 +1,14 @@
 """S3/MinIO storage backend."""
 
+from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
+from typing import Any, BinaryIO
+
 import aioboto3
 from botocore.exceptions import ClientError
 
 from src.config import settings
+from src.infrastructure.storage.base import start_stream
 
 
 class S3StorageBackend:
@@ -68,6 +73,20 @@ class S3StorageBackend:
             )
         return f"s3://{self.bucket}/{key}"
 
+    async def save_file(self, key: str, fileobj: BinaryIO) -> str:
+        """Stream a file object to S3, using a multipart upload for large files.
+
+        Args:
+            key: Object key in the bucket
+            fileobj: A readable binary file object
+
+        Returns:
+            The S3 URI (s3://bucket/key)
+        """
+        async with self._session.client(**self._get_client_config()) as s3:
+            await s3.upload_fileobj(fileobj, self.bucket, key)
+        return f"s3://{self.bucket}/{key}"
+
     async def load(self, key: str) -> bytes:
         """Load content from S3.
 
@@ -90,6 +109,41 @@ class S3StorageBackend:
                     raise FileNotFoundError(f"Object not found: {key}")
                 raise
 
+    async def open_stream(
+        self, key: str, chunk_size: int = 1024 * 1024
+    ) -> AsyncGenerator[bytes, None]:
+        """Open an object in S3 for reading in chunks.
+
+        Args:
+            key: Object key in the bucket
+            chunk_size: Maximum size of each chunk in bytes
+
+        Returns:
+            An async generator over the object's content
+
+        Raises:
+            FileNotFoundError: If the object doesn't exist
+        """
+        return await start_stream(self._iter_object(key, chunk_size))
+
+    async def _iter_object(self, key: str, chunk_size: int) -> AsyncGenerator[bytes, None]:
+        """Fetch an object and yield its chunks, closing its client when done."""
+        # The client must stay open until the body has been read
+        async with AsyncExitStack() as stack:
+            s3 = await stack.enter_async_context(
+                self._session.client(**self._get_client_config())
+            )
+            try:
+                response = await s3.get_object(Bucket=self.bucket, Key=key)
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "NoSuchKey":
+                    raise FileNotFoundError(f"Object not found: {key}")
+                raise
+            body = await stack.enter_async_context(response["Body"])
+            yield b""
+            async for chunk in body.iter_chunks(chunk_size):
+                yield chunk
+
     async def delete(self, key: str) -> bool:
         """Delete an object from S3.
 
@@ -119,6 +173,27 @@ class S3StorageBackend:
             except ClientError:
                 return False
 
+    async def get_size(self, key: str) -> int:
+        """Get the size of an object without downloading it.
+
+        Args:
+            key: Object key in the bucket
+
+        Returns:
+            Object size in bytes
+
+        Raises:
+            FileNotFoundError: If the object doesn't exist
+        """
+        async with self._session.client(**self._get_client_config()) as s3:
+            try:
+                response = await s3.head_object(Bucket=self.bucket, Key=key)
+            except ClientError as e:
+                if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                    raise FileNotFoundError(f"Object not found: {key}")
+                raise
+        return response["ContentLength"]
+
     def get_url(self, key: str) -> str:
         """Get the S3 URI for an object.
 
@@ -147,3 +222,24 @@ class S3StorageBackend:
                 ExpiresIn=expires_in,
             )
             return url
+
+    async def get_presigned_post(
+        self, key: str, max_size: int, expires_in: int = 3600
+    ) -> dict[str, Any]:
+        """Generate a pre-signed POST form for uploading an object directly.
+
+        Args:
+            key: Object key the upload is stored under
+            max_size: Largest accepted upload, in bytes
+            expires_in: Form expiration time in seconds
+
+        Returns:
+            Dict with the form "url" and the "fields" to submit with the file
+        """
+        async with self._session.client(**self._get_client_config()) as s3:
+            return await s3.generate_presigned_post(
+                Bucket=self.bucket,
+                Key=key,
+                Conditions=[["content-length-range", 0, max_size]],
+                ExpiresIn=expires_in,
+            )
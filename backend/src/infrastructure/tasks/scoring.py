@@ -50,7 +50,7 @@ async def _score_submission_async(submission_id: int) -> dict:
             raise ValueError(f"Submission {submission_id} not found")
 
         # Check if already scored (idempotency)
-        if submission.status == SubmissionStatus.SCORED:
+        if submission.status is SubmissionStatus.SCORED:
             logger.info(f"Submission {submission_id} already scored, skipping")
             return {
                 "submission_id": submission_id,
@@ -152,14 +152,14 @@ async def _send_scoring_notification(session, submission, competition) -> None:
     try:
         notification_service = NotificationService(session)
 
-        if submission.status == SubmissionStatus.SCORED:
+        if submission.status is SubmissionStatus.SCORED:
             await notification_service.notify_submission_scored(
                 user_id=submission.user_id,
                 competition_title=competition.title,
                 competition_slug=competition.slug,
                 score=submission.public_score,
             )
-        elif submission.status == SubmissionStatus.FAILED:
+        elif submission.status is SubmissionStatus.FAILED:
             await notification_service.notify_submission_failed(
                 user_id=submission.user_id,
                 competition_title=competition.title,
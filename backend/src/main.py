@@ -2,13 +2,16 @@
 
 import logging
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.api.responses import ORJSONResponse
 from src.api.routes import admin, auth, competitions, dashboard, discussions, enrollments, health, notifications, profiles, submissions, teams, uploads
 from src.config import settings
-from src.infrastructure.database import async_session_factory
+from src.infrastructure.database import DBSessionMiddleware, async_session_factory
 from src.infrastructure.startup import run_startup_tasks
 
 logger = logging.getLogger(__name__)
@@ -39,6 +42,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -48,8 +52,17 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Link"],
 )
 
+# One database session per request, shared by all dependencies
+app.add_middleware(DBSessionMiddleware)
+
+if settings.profiling_enabled:
+    from src.api.profiling import ProfilingMiddleware
+
+    app.add_middleware(ProfilingMiddleware)
+
 # Include routers
 app.include_router(health.router, tags=["Health"])
 app.include_router(auth.router)
@@ -66,6 +79,25 @@ app.include_router(admin.router)
 app.include_router(uploads.router)
 
 
+@lru_cache(maxsize=1)
+def _openapi_document() -> bytes:
+    """Encode the OpenAPI schema once; routes are fixed after startup."""
+    return orjson.dumps(app.openapi())
+
+
+# FastAPI caches the schema dict but re-encodes it with the stdlib json module
+# on every request, so swap its route for one serving the encoded document.
+app.router.routes = [
+    route for route in app.router.routes if getattr(route, "path", None) != app.openapi_url
+]
+
+
+@app.get(app.openapi_url, include_in_schema=False)
+async def openapi_document() -> Response:
+    """OpenAPI schema for the docs pages and client generators."""
+    return Response(_openapi_document(), media_type="application/json")
+
+
 @app.get("/")
 async def root():
     """Root endpoint - API information."""
@@ -1,7 +1,8 @@
 """Pytest fixtures for testing."""
 
 import asyncio
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, Callable, Generator
+from contextlib import AbstractContextManager, contextmanager
 from typing import Any
 
 import pytest
@@ -28,6 +29,25 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_caches() -> Generator[None, None, None]:
+    """Reset in-process caches, since each test database reuses IDs and slugs."""
+    from src.api.dependencies import _competition_refs, _user_cache
+    from src.api.routes.competitions import _preview_cache
+    from src.api.routes.health import _readiness_cache
+    from src.domain.services.dashboard import _dashboard_cache, _stats_cache
+    from src.domain.services.submission import _leaderboard_cache
+
+    _user_cache.clear()
+    _competition_refs.clear()
+    _readiness_cache.clear()
+    _preview_cache.clear()
+    _dashboard_cache.clear()
+    _stats_cache.clear()
+    _leaderboard_cache.clear()
+    yield
+
+
 @pytest.fixture
 async def db_engine():
     """Create test database engine."""
@@ -56,16 +76,41 @@ async def db_engine():
 
 
 @pytest.fixture
-async def db_session(db_engine) -> AsyncGenerator[AsyncSession, None]:
+async def db_session(db_engine, monkeypatch) -> AsyncGenerator[AsyncSession, None]:
     """Create test database session."""
     async_session = sessionmaker(
         db_engine, class_=AsyncSession, expire_on_commit=False
     )
+    # Services that open their own sessions must use the test database too
+    monkeypatch.setattr("src.domain.services.dashboard.async_session_factory", async_session)
 
     async with async_session() as session:
         yield session
 
 
+@pytest.fixture
+def count_statements(
+    db_session: AsyncSession,
+) -> Callable[[], AbstractContextManager[list[str]]]:
+    """Record the SQL statements the test database executes inside a `with` block."""
+    engine = db_session.bind.sync_engine
+
+    @contextmanager
+    def recorder() -> Generator[list[str], None, None]:
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    return recorder
+
+
 @pytest.fixture
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """Create test HTTP client with database override."""
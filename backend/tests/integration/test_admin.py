@@ -356,6 +356,9 @@ class TestCompetitionManagement:
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
+        listed = next(c for c in data if c["id"] == comp.id)
+        assert listed["has_truth_set"] is False
+        assert listed["difficulty"] == comp.difficulty.value
 
     async def test_list_competitions_with_status_filter(
         self, client: AsyncClient, admin_auth_headers: dict
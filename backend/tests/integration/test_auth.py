@@ -2,6 +2,7 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class TestRegister:
@@ -131,6 +132,26 @@ class TestMe:
         assert data["email"] == sample_user_data["email"]
         assert data["username"] == sample_user_data["username"]
 
+    async def test_me_loads_only_the_user_row(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        count_statements,
+        auth_headers: dict,
+    ):
+        """Authenticating should not load any of the user's related rows."""
+        from src.api.dependencies import _user_cache
+
+        _user_cache.clear()
+        db_session.expunge_all()
+
+        with count_statements() as statements:
+            response = await client.get("/auth/me", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert len(statements) == 1
+        assert "FROM users" in statements[0]
+
     async def test_me_without_token_fails(self, client: AsyncClient):
         """Should reject request without token."""
         response = await client.get("/auth/me")
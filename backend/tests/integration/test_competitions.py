@@ -2,6 +2,7 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class TestListCompetitions:
@@ -43,6 +44,120 @@ class TestListCompetitions:
         assert len(data) == 1
         assert data[0]["title"] == sample_competition_data["title"]
 
+    async def test_list_mine_does_not_load_relationships(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        count_statements,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Listing should select competitions only, not their related rows."""
+        for _ in range(3):
+            await client.post(
+                "/competitions/",
+                json=sample_competition_data,
+                headers=sponsor_auth_headers,
+            )
+        db_session.expunge_all()
+
+        with count_statements() as statements:
+            response = await client.get("/competitions/mine", headers=sponsor_auth_headers)
+
+        assert response.status_code == 200
+        assert len(response.json()) == 3
+        competition_selects = [s for s in statements if "FROM competitions" in s]
+        assert len(competition_selects) == 1
+        assert not any("FROM submissions" in s or "FROM teams" in s for s in statements)
+
+    async def test_loading_competition_selects_one_row(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        count_statements,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Relationships should only load when a query asks for them."""
+        from sqlalchemy.exc import InvalidRequestError
+
+        from src.infrastructure.repositories.competition import CompetitionRepository
+
+        response = await client.post(
+            "/competitions/", json=sample_competition_data, headers=sponsor_auth_headers
+        )
+        db_session.expunge_all()
+
+        with count_statements() as statements:
+            competition = await CompetitionRepository(db_session).get_by_id(
+                response.json()["id"]
+            )
+
+        assert competition is not None
+        assert len(statements) == 1
+        with pytest.raises(InvalidRequestError):
+            competition.files
+
+
+class TestListPagination:
+    """Tests for keyset pagination of competition listings."""
+
+    async def _create_competitions(
+        self, client: AsyncClient, headers: dict, data: dict, count: int
+    ) -> None:
+        for _ in range(count):
+            await client.post("/competitions/", json=data, headers=headers)
+
+    async def test_pages_follow_link_header(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Following the Link header should page through newest first."""
+        await self._create_competitions(
+            client, sponsor_auth_headers, sample_competition_data, 3
+        )
+
+        first = await client.get(
+            "/competitions/mine", params={"limit": 2}, headers=sponsor_auth_headers
+        )
+        assert first.status_code == 200
+        next_url = first.headers["link"].split(">")[0].lstrip("<")
+
+        second = await client.get(next_url, headers=sponsor_auth_headers)
+        assert second.status_code == 200
+        assert "link" not in second.headers
+
+        ids = [c["id"] for c in first.json() + second.json()]
+        assert len(ids) == 3
+        assert ids == sorted(ids, reverse=True)
+
+    async def test_skip_is_deprecated(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Offset paging should still work but be marked deprecated."""
+        await self._create_competitions(
+            client, sponsor_auth_headers, sample_competition_data, 2
+        )
+
+        response = await client.get(
+            "/competitions/mine", params={"skip": 1}, headers=sponsor_auth_headers
+        )
+
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert response.headers["deprecation"] == "true"
+
+    async def test_skip_and_before_rejected(self, client: AsyncClient):
+        """Mixing offset and keyset pagination should fail."""
+        response = await client.get("/competitions/", params={"skip": 1, "before": 5})
+
+        assert response.status_code == 400
+
 
 class TestCreateCompetition:
     """Tests for creating competitions."""
@@ -199,3 +314,748 @@ class TestUpdateCompetition:
         )
 
         assert response.status_code == 403
+
+    async def test_update_without_auth_checked_before_lookup(self, client: AsyncClient):
+        """Unauthenticated requests should be rejected before the slug is resolved."""
+        response = await client.patch(
+            "/competitions/nonexistent",
+            json={"title": "Updated Title"},
+        )
+
+        assert response.status_code == 403
+
+
+class TestListCompetitionsCaching:
+    """Tests for HTTP caching of the public competition list."""
+
+    async def test_list_sets_cache_headers(self, client: AsyncClient):
+        """List response should be cacheable and carry an ETag."""
+        response = await client.get("/competitions/")
+
+        assert response.status_code == 200
+        assert "max-age=30" in response.headers["cache-control"]
+        assert response.headers["etag"]
+
+    async def test_list_not_modified(self, client: AsyncClient):
+        """Matching If-None-Match should return 304 without a body."""
+        etag = (await client.get("/competitions/")).headers["etag"]
+
+        response = await client.get("/competitions/", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    async def test_etag_changes_when_competition_activated(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Activating a competition should change the list ETag."""
+        etag = (await client.get("/competitions/")).headers["etag"]
+
+        create_response = await client.post(
+            "/competitions/",
+            json=sample_competition_data,
+            headers=sponsor_auth_headers,
+        )
+        await client.patch(
+            f"/competitions/{create_response.json()['slug']}",
+            json={"status": "active"},
+            headers=sponsor_auth_headers,
+        )
+
+        response = await client.get("/competitions/", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+
+class TestCompetitionSlugCache:
+    """Tests for cached slug resolution on competition sub-resources."""
+
+    async def test_renamed_slug_is_not_served_from_cache(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Renaming a competition should invalidate its old slug."""
+        create_response = await client.post(
+            "/competitions/",
+            json=sample_competition_data,
+            headers=sponsor_auth_headers,
+        )
+        old_slug = create_response.json()["slug"]
+        assert (await client.get(f"/competitions/{old_slug}/faqs")).status_code == 200
+
+        update_response = await client.patch(
+            f"/competitions/{old_slug}",
+            json={"title": "Renamed Competition"},
+            headers=sponsor_auth_headers,
+        )
+        new_slug = update_response.json()["slug"]
+
+        assert (await client.get(f"/competitions/{old_slug}/faqs")).status_code == 404
+        assert (await client.get(f"/competitions/{new_slug}/faqs")).status_code == 200
+
+    async def test_get_competition_warms_cache(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Viewing a competition should cache its reference for sub-resources."""
+        from src.api.dependencies import _competition_refs
+
+        create_response = await client.post(
+            "/competitions/",
+            json=sample_competition_data,
+            headers=sponsor_auth_headers,
+        )
+        competition = create_response.json()
+        _competition_refs.clear()
+
+        assert (await client.get(f"/competitions/{competition['slug']}")).status_code == 200
+
+        ref = _competition_refs.get(competition["slug"])
+        assert ref is not None
+        assert ref.id == competition["id"]
+        assert ref.sponsor_id == competition["sponsor_id"]
+
+    async def test_write_ignores_cached_ref_of_deleted_competition(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """A write should 404 once the competition is gone, even if its ref is cached."""
+        from sqlalchemy import delete
+
+        from src.domain.models.competition import Competition
+
+        create_response = await client.post(
+            "/competitions/",
+            json=sample_competition_data,
+            headers=sponsor_auth_headers,
+        )
+        slug = create_response.json()["slug"]
+        assert (await client.get(f"/competitions/{slug}/faqs")).status_code == 200
+
+        # Deleted through another worker, so this worker's cache still holds the ref
+        await db_session.execute(delete(Competition).where(Competition.slug == slug))
+        await db_session.commit()
+
+        response = await client.post(
+            f"/competitions/{slug}/faqs",
+            json={"question": "Is this still open?", "answer": "It should not be."},
+            headers=sponsor_auth_headers,
+        )
+
+        assert response.status_code == 404
+
+
+class TestDeleteCompetition:
+    """Tests for deleting competitions."""
+
+    async def test_delete_as_owner(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Owner should be able to delete competition."""
+        create_response = await client.post(
+            "/competitions/",
+            json=sample_competition_data,
+            headers=sponsor_auth_headers,
+        )
+        slug = create_response.json()["slug"]
+
+        response = await client.delete(f"/competitions/{slug}", headers=sponsor_auth_headers)
+
+        assert response.status_code == 204
+        assert (await client.get(f"/competitions/{slug}")).status_code == 404
+
+    async def test_delete_as_non_owner_fails(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Non-owner should not be able to delete competition."""
+        create_response = await client.post(
+            "/competitions/",
+            json=sample_competition_data,
+            headers=sponsor_auth_headers,
+        )
+        slug = create_response.json()["slug"]
+
+        response = await client.delete(f"/competitions/{slug}", headers=auth_headers)
+
+        assert response.status_code == 403
+        assert (await client.get(f"/competitions/{slug}")).status_code == 200
+
+
+class TestCompetitionFAQs:
+    """Tests for managing competition FAQs."""
+
+    async def _create_competition(
+        self, client: AsyncClient, headers: dict, data: dict
+    ) -> str:
+        response = await client.post("/competitions/", json=data, headers=headers)
+        return response.json()["slug"]
+
+    async def _create_faq(
+        self, client: AsyncClient, slug: str, headers: dict, question: str
+    ) -> dict:
+        response = await client.post(
+            f"/competitions/{slug}/faqs",
+            json={"question": question, "answer": "An answer."},
+            headers=headers,
+        )
+        assert response.status_code == 201
+        return response.json()
+
+    async def test_update_and_delete_faq(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Owner should be able to update and delete a FAQ."""
+        slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+        faq = await self._create_faq(client, slug, sponsor_auth_headers, "First question?")
+
+        response = await client.patch(
+            f"/competitions/{slug}/faqs/{faq['id']}",
+            json={"answer": "A better answer."},
+            headers=sponsor_auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["answer"] == "A better answer."
+        assert response.json()["question"] == "First question?"
+
+        response = await client.delete(
+            f"/competitions/{slug}/faqs/{faq['id']}", headers=sponsor_auth_headers
+        )
+        assert response.status_code == 204
+
+        response = await client.delete(
+            f"/competitions/{slug}/faqs/{faq['id']}", headers=sponsor_auth_headers
+        )
+        assert response.status_code == 404
+
+    async def test_faq_from_other_competition_not_found(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """A FAQ should only be reachable through its own competition."""
+        slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+        other_slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+        faq = await self._create_faq(client, slug, sponsor_auth_headers, "First question?")
+
+        response = await client.patch(
+            f"/competitions/{other_slug}/faqs/{faq['id']}",
+            json={"answer": "Hijacked answer."},
+            headers=sponsor_auth_headers,
+        )
+
+        assert response.status_code == 404
+
+    async def test_reorder_faqs(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Reordering should set display_order from the given ID order."""
+        slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+        first = await self._create_faq(client, slug, sponsor_auth_headers, "First question?")
+        second = await self._create_faq(client, slug, sponsor_auth_headers, "Second question?")
+
+        response = await client.post(
+            f"/competitions/{slug}/faqs/reorder",
+            json={"faq_ids": [second["id"], first["id"]]},
+            headers=sponsor_auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert [f["id"] for f in response.json()] == [second["id"], first["id"]]
+        assert [f["display_order"] for f in response.json()] == [0, 1]
+
+
+class TestCompetitionRules:
+    """Tests for managing competition rules."""
+
+    async def test_bulk_update_replaces_rules(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """A bulk update should replace the rules with the given list in order."""
+        response = await client.post(
+            "/competitions/", json=sample_competition_data, headers=sponsor_auth_headers
+        )
+        slug = response.json()["slug"]
+        rules = [
+            {"custom_title": "Be kind", "custom_text": "No harassment.", "display_order": 0},
+            {
+                "custom_title": "Share code",
+                "custom_text": "Publish winning code.",
+                "display_order": 1,
+            },
+        ]
+
+        for _ in range(2):
+            response = await client.put(
+                f"/competitions/{slug}/rules",
+                json={"rules": rules},
+                headers=sponsor_auth_headers,
+            )
+            assert response.status_code == 200
+
+        response = await client.get(f"/competitions/{slug}/rules")
+        assert [r["title"] for r in response.json()] == ["Be kind", "Share code"]
+        assert [r["rendered_text"] for r in response.json()] == [
+            "No harassment.",
+            "Publish winning code.",
+        ]
+
+
+class TestCompetitionThumbnail:
+    """Tests for uploading competition thumbnails."""
+
+    @pytest.fixture(autouse=True)
+    def upload_dir(self, tmp_path, monkeypatch):
+        """Store uploads in a temporary directory."""
+        from src.config import settings
+        from src.infrastructure.storage.factory import clear_storage_cache
+
+        monkeypatch.setattr(settings, "upload_dir", str(tmp_path))
+        clear_storage_cache()
+        yield tmp_path
+        clear_storage_cache()
+
+    async def _create_competition(
+        self, client: AsyncClient, headers: dict, data: dict
+    ) -> str:
+        response = await client.post("/competitions/", json=data, headers=headers)
+        return response.json()["slug"]
+
+    async def test_upload_png(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+        upload_dir,
+    ):
+        """A PNG upload should be stored and linked to the competition."""
+        slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+        content = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+        response = await client.post(
+            f"/competitions/{slug}/thumbnail",
+            files={"file": ("thumb.png", content, "image/png")},
+            headers=sponsor_auth_headers,
+        )
+
+        assert response.status_code == 200
+        saved = list(upload_dir.rglob("thumbnail.png"))
+        assert len(saved) == 1
+        assert saved[0].read_bytes() == content
+
+    async def test_oversized_upload_rejected(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+        upload_dir,
+    ):
+        """Uploads over 5MB should be rejected without being stored."""
+        slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+        content = b"\x89PNG\r\n\x1a\n" + b"\x00" * (5 * 1024 * 1024)
+
+        response = await client.post(
+            f"/competitions/{slug}/thumbnail",
+            files={"file": ("thumb.png", content, "image/png")},
+            headers=sponsor_auth_headers,
+        )
+
+        assert response.status_code == 400
+        assert "5MB" in response.json()["detail"]
+        assert not list(upload_dir.rglob("thumbnail.png"))
+
+    async def test_non_image_content_rejected(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """A file named like an image but without image magic bytes should fail."""
+        slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+
+        response = await client.post(
+            f"/competitions/{slug}/thumbnail",
+            files={"file": ("thumb.png", b"not an image", "image/png")},
+            headers=sponsor_auth_headers,
+        )
+
+        assert response.status_code == 400
+
+    async def test_unsupported_extension_rejected(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Files without an image extension should fail before upload handling."""
+        slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+
+        response = await client.post(
+            f"/competitions/{slug}/thumbnail",
+            files={"file": ("thumb.gif", b"GIF89a", "image/gif")},
+            headers=sponsor_auth_headers,
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("File must be an image")
+
+    async def test_connection_released_during_storage(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+        monkeypatch,
+    ):
+        """No transaction should be open while the file is written to storage."""
+        from src.infrastructure.storage.local import LocalStorageBackend
+
+        slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+        in_transaction = []
+        save_file = LocalStorageBackend.save_file
+
+        async def recording_save_file(self, key, fileobj):
+            in_transaction.append(db_session.in_transaction())
+            return await save_file(self, key, fileobj)
+
+        monkeypatch.setattr(LocalStorageBackend, "save_file", recording_save_file)
+
+        response = await client.post(
+            f"/competitions/{slug}/thumbnail",
+            files={"file": ("thumb.png", b"\x89PNG\r\n\x1a\n", "image/png")},
+            headers=sponsor_auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert in_transaction == [False]
+
+
+class TestCompetitionFiles:
+    """Tests for competition file endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def upload_dir(self, tmp_path, monkeypatch):
+        """Store uploads in a temporary directory."""
+        from src.config import settings
+        from src.infrastructure.storage.factory import clear_storage_cache
+
+        monkeypatch.setattr(settings, "upload_dir", str(tmp_path))
+        clear_storage_cache()
+        yield tmp_path
+        clear_storage_cache()
+
+    async def _create_competition(
+        self, client: AsyncClient, headers: dict, data: dict
+    ) -> str:
+        response = await client.post("/competitions/", json=data, headers=headers)
+        return response.json()["slug"]
+
+    async def test_file_from_other_competition_not_found(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """A file should only be reachable through its own competition."""
+        slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+        other_slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+        upload = await client.post(
+            f"/competitions/{slug}/files",
+            files={"file": ("train.csv", b"id,x\n1,2\n", "text/csv")},
+            headers=sponsor_auth_headers,
+        )
+        assert upload.status_code == 201
+        file_id = upload.json()["id"]
+
+        assert (await client.get(f"/competitions/{slug}/files/{file_id}")).status_code == 200
+        response = await client.delete(
+            f"/competitions/{other_slug}/files/{file_id}", headers=sponsor_auth_headers
+        )
+        assert response.status_code == 404
+        assert (await client.get(f"/competitions/{slug}/files/{file_id}")).status_code == 200
+
+    async def test_download_file(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Downloads should return the stored content with its recorded size."""
+        slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+        content = b"id,x\n" + b"1,2\n" * 1000
+        upload = await client.post(
+            f"/competitions/{slug}/files",
+            files={"file": ("train.csv", content, "text/csv")},
+            headers=sponsor_auth_headers,
+        )
+        file_id = upload.json()["id"]
+
+        response = await client.get(f"/competitions/{slug}/files/{file_id}")
+
+        assert response.status_code == 200
+        assert response.content == content
+        assert response.headers["content-length"] == str(len(content))
+        assert 'filename="train.csv"' in response.headers["content-disposition"]
+
+    async def test_download_missing_from_storage(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+        upload_dir,
+    ):
+        """A file record whose content is gone should return 404."""
+        slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+        upload = await client.post(
+            f"/competitions/{slug}/files",
+            files={"file": ("train.csv", b"id,x\n1,2\n", "text/csv")},
+            headers=sponsor_auth_headers,
+        )
+        for path in upload_dir.rglob("*train.csv"):
+            path.unlink()
+
+        response = await client.get(f"/competitions/{slug}/files/{upload.json()['id']}")
+
+        assert response.status_code == 404
+
+    async def test_preview_is_cached(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+        upload_dir,
+    ):
+        """Repeat previews of the same file should not reread it from storage."""
+        slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+        upload = await client.post(
+            f"/competitions/{slug}/files",
+            files={"file": ("train.csv", b"id,x\n1,2\n3,\n", "text/csv")},
+            headers=sponsor_auth_headers,
+        )
+        url = f"/competitions/{slug}/files/{upload.json()['id']}/preview"
+
+        first = await client.get(url)
+        for path in upload_dir.rglob("*train.csv"):
+            path.unlink()
+        second = await client.get(url)
+
+        assert first.status_code == 200
+        assert first.json() == {
+            "columns": ["id", "x"],
+            "data": {"id": ["1", "3"], "x": ["2", ""]},
+            "total_rows": 2,
+            "truncated": False,
+        }
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert (await client.get(url, params={"max_rows": 1})).status_code == 404
+
+    async def test_download_via_x_accel_redirect(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+        monkeypatch,
+    ):
+        """With a prefix configured, nginx should be told where to serve the file from."""
+        from src.config import settings
+
+        slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+        upload = await client.post(
+            f"/competitions/{slug}/files",
+            files={"file": ("train.csv", b"id,x\n1,2\n", "text/csv")},
+            headers=sponsor_auth_headers,
+        )
+        monkeypatch.setattr(settings, "x_accel_redirect_prefix", "/_internal/uploads/")
+
+        response = await client.get(f"/competitions/{slug}/files/{upload.json()['id']}")
+
+        assert response.status_code == 200
+        assert response.content == b""
+        redirect = response.headers["x-accel-redirect"]
+        assert redirect.startswith("/_internal/uploads/competition_files/")
+        assert redirect.endswith("_train.csv")
+        assert 'filename="train.csv"' in response.headers["content-disposition"]
+
+    async def test_download_all_files(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+        upload_dir,
+    ):
+        """The archive should contain every file still present in storage."""
+        import io
+        import zipfile
+
+        slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+        train = b"id,x\n" + b"1,2\n" * 50_000
+        for name, content in (("train.csv", train), ("test.csv", b"id\n1\n"), ("gone.csv", b"x")):
+            await client.post(
+                f"/competitions/{slug}/files",
+                files={"file": (name, content, "text/csv")},
+                headers=sponsor_auth_headers,
+            )
+        for path in upload_dir.rglob("*gone.csv"):
+            path.unlink()
+
+        response = await client.get(f"/competitions/{slug}/files/download-all")
+
+        assert response.status_code == 200
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            assert archive.testzip() is None
+            assert sorted(archive.namelist()) == ["test.csv", "train.csv"]
+            assert archive.read("train.csv") == train
+
+    async def test_direct_upload_disabled_by_default(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Without S3 direct uploads configured, init should be rejected."""
+        slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+
+        response = await client.post(
+            f"/competitions/{slug}/files/init",
+            json={"filename": "train.csv"},
+            headers=sponsor_auth_headers,
+        )
+
+        assert response.status_code == 400
+
+    async def test_direct_upload_to_s3(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+        monkeypatch,
+    ):
+        """Init should hand out a pre-signed form and commit record the object."""
+        from src.config import settings
+        from src.domain.services import competition_file
+
+        objects: dict[str, int] = {}
+
+        class FakeS3:
+            async def get_presigned_post(self, key, max_size, expires_in=3600):
+                return {"url": "https://s3.test/daggle", "fields": {"key": key}}
+
+            async def get_size(self, key):
+                if key not in objects:
+                    raise FileNotFoundError(key)
+                return objects[key]
+
+            def get_url(self, key):
+                return f"s3://daggle/{key}"
+
+        monkeypatch.setattr(settings, "storage_backend", "s3")
+        monkeypatch.setattr(settings, "s3_presigned_uploads", True)
+        monkeypatch.setattr(competition_file, "get_storage_backend", FakeS3)
+
+        slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+        init = await client.post(
+            f"/competitions/{slug}/files/init",
+            json={"filename": "train.csv"},
+            headers=sponsor_auth_headers,
+        )
+        assert init.status_code == 200
+        ticket = init.json()
+        assert ticket["upload_url"] == "https://s3.test/daggle"
+        storage_key = ticket["storage_key"]
+        assert ticket["upload_fields"]["key"] == storage_key
+
+        # Nothing uploaded yet
+        response = await client.post(
+            f"/competitions/{slug}/files/commit",
+            json={"storage_key": storage_key},
+            headers=sponsor_auth_headers,
+        )
+        assert response.status_code == 400
+
+        objects[storage_key] = 1234
+        response = await client.post(
+            f"/competitions/{slug}/files/commit",
+            json={"storage_key": storage_key, "display_name": "Training data"},
+            headers=sponsor_auth_headers,
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["filename"] == "train.csv"
+        assert data["display_name"] == "Training data"
+        assert data["file_size"] == 1234
+        assert data["file_path"] == f"s3://daggle/{storage_key}"
+
+        # Keys from another competition are refused
+        other_slug = await self._create_competition(
+            client, sponsor_auth_headers, sample_competition_data
+        )
+        response = await client.post(
+            f"/competitions/{other_slug}/files/commit",
+            json={"storage_key": storage_key},
+            headers=sponsor_auth_headers,
+        )
+        assert response.status_code == 400
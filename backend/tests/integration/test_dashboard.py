@@ -290,6 +290,64 @@ class TestDashboardService:
         assert stats.unread_notifications == 1
 
 
+    @pytest.mark.asyncio
+    async def test_dashboard_cached_until_invalidated(self, db_session, dashboard_user):
+        """Dashboards should be reused until the user's notifications change."""
+        from src.domain.services.dashboard import DashboardService
+        from src.domain.services.notification import NotificationService
+
+        service = DashboardService(db_session)
+        first = await service.get_dashboard(dashboard_user)
+
+        # Written behind the services' backs, so the cache does not know
+        db_session.add(
+            Notification(
+                user_id=dashboard_user.id,
+                type=NotificationType.SYSTEM,
+                title="Direct",
+                message="Inserted directly",
+            )
+        )
+        await db_session.commit()
+        cached = await service.get_dashboard(dashboard_user)
+        assert cached.notifications == first.notifications == []
+
+        await NotificationService(db_session).create(
+            user_id=dashboard_user.id,
+            notification_type=NotificationType.SYSTEM,
+            title="Via service",
+            message="Created through the service",
+        )
+        refreshed = await service.get_dashboard(dashboard_user)
+        assert len(refreshed.notifications) == 2
+        assert refreshed.stats.unread_notifications == 2
+
+    @pytest.mark.asyncio
+    async def test_dashboard_cached_before_commit_is_dropped(
+        self, db_session, dashboard_user
+    ):
+        """A dashboard cached between a write and its commit should not outlive the commit."""
+        from src.domain.services.dashboard import DashboardService, _dashboard_cache
+        from src.domain.services.notification import NotificationService
+
+        service = DashboardService(db_session)
+        stale = await service.get_dashboard(dashboard_user)
+
+        await NotificationService(db_session).create(
+            user_id=dashboard_user.id,
+            notification_type=NotificationType.SYSTEM,
+            title="Pending",
+            message="Not committed yet",
+        )
+        # As if a concurrent request read the old rows before the commit
+        _dashboard_cache.set(dashboard_user.id, stale)
+        await db_session.commit()
+
+        assert _dashboard_cache.get(dashboard_user.id) is None
+        refreshed = await service.get_dashboard(dashboard_user)
+        assert len(refreshed.notifications) == 1
+
+
 class TestDashboardAPI:
     """Tests for dashboard API endpoints."""
 
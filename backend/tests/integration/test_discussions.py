@@ -29,6 +29,55 @@ class TestListThreads:
         assert data["threads"] == []
         assert data["total"] == 0
 
+    async def test_list_includes_reply_counts(
+        self,
+        client: AsyncClient,
+        count_statements,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Should return reply counts and the total from a single thread query."""
+        create_response = await client.post(
+            "/competitions/",
+            json=sample_competition_data,
+            headers=sponsor_auth_headers,
+        )
+        slug = create_response.json()["slug"]
+
+        reply_counts = {}
+        for index, count in enumerate([0, 1, 3]):
+            thread_response = await client.post(
+                f"/competitions/{slug}/discussions",
+                json={"title": f"Thread {index}", "content": "Thread content."},
+                headers=sponsor_auth_headers,
+            )
+            thread_id = thread_response.json()["id"]
+            reply_counts[thread_id] = count
+            for _ in range(count):
+                await client.post(
+                    f"/competitions/{slug}/discussions/{thread_id}/replies",
+                    json={"content": "A reply."},
+                    headers=sponsor_auth_headers,
+                )
+
+        with count_statements() as statements:
+            response = await client.get(f"/competitions/{slug}/discussions")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert {t["id"]: t["reply_count"] for t in data["threads"]} == reply_counts
+        thread_selects = [s for s in statements if "discussion_threads" in s]
+        assert len(thread_selects) == 1
+
+        paged = await client.get(f"/competitions/{slug}/discussions?skip=1&limit=1")
+        assert paged.json()["total"] == 3
+        assert len(paged.json()["threads"]) == 1
+
+        past_end = await client.get(f"/competitions/{slug}/discussions?skip=10")
+        assert past_end.json()["total"] == 3
+        assert past_end.json()["threads"] == []
+
     async def test_list_nonexistent_competition_returns_404(
         self, client: AsyncClient
     ):
@@ -228,6 +277,58 @@ class TestGetThread:
         assert len(data["replies"]) == 1
         assert data["replies"][0]["content"] == "This is a reply!"
 
+    async def test_get_thread_loads_authors_in_bulk(
+        self,
+        client: AsyncClient,
+        count_statements,
+        sponsor_auth_headers: dict,
+        auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Should load the thread, replies and authors in a fixed number of queries."""
+        create_response = await client.post(
+            "/competitions/",
+            json=sample_competition_data,
+            headers=sponsor_auth_headers,
+        )
+        slug = create_response.json()["slug"]
+        await client.patch(
+            f"/competitions/{slug}",
+            json={"status": "active"},
+            headers=sponsor_auth_headers,
+        )
+        await client.post(f"/competitions/{slug}/enroll", headers=auth_headers)
+
+        thread_response = await client.post(
+            f"/competitions/{slug}/discussions",
+            json={"title": "Test thread", "content": "Thread content here."},
+            headers=sponsor_auth_headers,
+        )
+        thread_id = thread_response.json()["id"]
+        for headers in [auth_headers, sponsor_auth_headers, auth_headers]:
+            await client.post(
+                f"/competitions/{slug}/discussions/{thread_id}/replies",
+                json={"content": "A reply."},
+                headers=headers,
+            )
+
+        with count_statements() as statements:
+            response = await client.get(
+                f"/competitions/{slug}/discussions/{thread_id}"
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["replies"]) == 3
+        # Authors are shared per user, so each reply still gets its own
+        replies = data["replies"]
+        assert replies[0]["author"] == replies[2]["author"]
+        assert replies[1]["author"] == data["author"]
+        assert replies[0]["author"] != replies[1]["author"]
+        # Thread, its author, replies, reply authors
+        assert len(statements) <= 4
+        assert not any("FROM submissions" in s or "FROM teams" in s for s in statements)
+
     async def test_get_nonexistent_thread_returns_404(
         self,
         client: AsyncClient,
@@ -247,6 +348,45 @@ class TestGetThread:
 
         assert response.status_code == 404
 
+    async def test_get_thread_from_other_competition_returns_404(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """Should return 404 for a thread that belongs to another competition."""
+        first = await client.post(
+            "/competitions/",
+            json=sample_competition_data,
+            headers=sponsor_auth_headers,
+        )
+        second = await client.post(
+            "/competitions/",
+            json={**sample_competition_data, "title": "Another Competition"},
+            headers=sponsor_auth_headers,
+        )
+        first_slug = first.json()["slug"]
+        second_slug = second.json()["slug"]
+
+        thread_response = await client.post(
+            f"/competitions/{first_slug}/discussions",
+            json={"title": "Test thread", "content": "Thread content here."},
+            headers=sponsor_auth_headers,
+        )
+        thread_id = thread_response.json()["id"]
+
+        response = await client.get(
+            f"/competitions/{second_slug}/discussions/{thread_id}"
+        )
+        assert response.status_code == 404
+
+        response = await client.post(
+            f"/competitions/{second_slug}/discussions/{thread_id}/replies",
+            json={"content": "Wrong competition."},
+            headers=sponsor_auth_headers,
+        )
+        assert response.status_code == 404
+
 
 class TestCreateReply:
     """Tests for creating replies."""
@@ -298,6 +438,46 @@ class TestCreateReply:
         assert data["content"] == "Great question! Here's my answer."
         assert data["thread_id"] == thread_id
 
+    async def test_create_reply_checks_enrollment_with_thread_lookup(
+        self,
+        client: AsyncClient,
+        count_statements,
+        sponsor_auth_headers: dict,
+        auth_headers: dict,
+        sample_competition_data: dict,
+    ):
+        """The poster's enrollment should be read in the same query as the thread."""
+        create_response = await client.post(
+            "/competitions/",
+            json=sample_competition_data,
+            headers=sponsor_auth_headers,
+        )
+        slug = create_response.json()["slug"]
+        await client.patch(
+            f"/competitions/{slug}",
+            json={"status": "active"},
+            headers=sponsor_auth_headers,
+        )
+        await client.post(f"/competitions/{slug}/enroll", headers=auth_headers)
+        thread_response = await client.post(
+            f"/competitions/{slug}/discussions",
+            json={"title": "Test thread", "content": "Thread content here."},
+            headers=sponsor_auth_headers,
+        )
+        thread_id = thread_response.json()["id"]
+
+        with count_statements() as statements:
+            response = await client.post(
+                f"/competitions/{slug}/discussions/{thread_id}/replies",
+                json={"content": "A reply."},
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 201
+        enrollment_queries = [s for s in statements if "enrollments.user_id = " in s]
+        assert len(enrollment_queries) == 1
+        assert "FROM discussion_threads" in enrollment_queries[0]
+
     async def test_create_reply_on_locked_thread_fails(
         self,
         client: AsyncClient,
@@ -0,0 +1,29 @@
+"""Integration tests for health check endpoints."""
+
+from httpx import AsyncClient
+
+
+class TestReadiness:
+    """Tests for the readiness probe."""
+
+    async def test_ready_when_database_connected(self, client: AsyncClient):
+        """Should report the database as connected."""
+        response = await client.get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok", "database": "connected"}
+
+    async def test_repeated_probes_reuse_healthy_result(
+        self,
+        client: AsyncClient,
+        count_statements,
+    ):
+        """Probes within the cache window should not query the database."""
+        await client.get("/health/ready")
+
+        with count_statements() as statements:
+            for _ in range(3):
+                response = await client.get("/health/ready")
+                assert response.json()["status"] == "ok"
+
+        assert statements == []
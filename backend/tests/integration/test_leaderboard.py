@@ -3,6 +3,8 @@
 import pytest
 from httpx import AsyncClient
 
+from src.api.schemas.submission import LeaderboardEntry
+
 
 class TestGetLeaderboard:
     """Tests for getting competition leaderboard."""
@@ -161,6 +163,10 @@ class TestLeaderboardRanking:
         assert entries[0]["rank"] == 1
         assert entries[1]["username"] == "user2"
         assert entries[1]["rank"] == 2
+        # Entries are served as the service built them, so check the shape
+        for entry in entries:
+            assert list(entry) == list(LeaderboardEntry.model_fields)
+            LeaderboardEntry.model_validate(entry)
 
     async def test_ranking_lower_is_better(
         self,
@@ -332,3 +338,225 @@ class TestLeaderboardRanking:
         # Early user should rank first due to tiebreak
         assert entries[0]["username"] == "early_user"
         assert entries[1]["username"] == "late_user"
+
+    async def test_leaderboard_cached_until_invalidated(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+        db_session,
+    ):
+        """Leaderboards are served from cache until a score changes."""
+        from src.domain.models.submission import Submission, SubmissionStatus
+        from src.domain.models.user import User
+        from src.domain.services.submission import invalidate_leaderboard
+        from src.common.security import hash_password
+
+        create_response = await client.post(
+            "/competitions/",
+            json=sample_competition_data,
+            headers=sponsor_auth_headers,
+        )
+        slug = create_response.json()["slug"]
+        comp_id = create_response.json()["id"]
+
+        response = await client.get(f"/competitions/{slug}/leaderboard")
+        assert response.json()["entries"] == []
+
+        user = User(
+            email="scorer@test.com",
+            username="scorer",
+            hashed_password=hash_password("pass"),
+            display_name="Scorer",
+        )
+        db_session.add(user)
+        await db_session.flush()
+        db_session.add(
+            Submission(
+                competition_id=comp_id,
+                user_id=user.id,
+                file_path="/fake/scorer.csv",
+                file_name="scorer.csv",
+                status=SubmissionStatus.SCORED,
+                public_score=0.7,
+            )
+        )
+        await db_session.commit()
+
+        response = await client.get(f"/competitions/{slug}/leaderboard")
+        assert response.json()["entries"] == []
+
+        invalidate_leaderboard(comp_id)
+
+        response = await client.get(f"/competitions/{slug}/leaderboard")
+        entries = response.json()["entries"]
+        assert [entry["username"] for entry in entries] == ["scorer"]
+
+    async def test_scoring_against_truth_set_invalidates_leaderboard(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+        db_session,
+        tmp_path,
+        monkeypatch,
+    ):
+        """A submission scored against a truth set shows up on a cached leaderboard."""
+        from src.config import settings
+        from src.domain.models.submission import Submission, SubmissionStatus
+        from src.domain.services.submission import SubmissionService
+        from src.infrastructure.repositories.competition import CompetitionRepository
+        from src.infrastructure.storage.factory import clear_storage_cache
+
+        monkeypatch.setattr(settings, "upload_dir", str(tmp_path))
+        clear_storage_cache()
+
+        create_response = await client.post(
+            "/competitions/",
+            json=sample_competition_data,
+            headers=sponsor_auth_headers,
+        )
+        slug = create_response.json()["slug"]
+        comp_id = create_response.json()["id"]
+        truth_set = await client.post(
+            f"/competitions/{slug}/truth-set",
+            files={"file": ("truth.csv", b"id,target\n1,0\n2,1\n3,0\n4,1\n", "text/csv")},
+            headers=sponsor_auth_headers,
+        )
+        clear_storage_cache()
+        assert truth_set.status_code == 200
+        user_id = (await client.get("/auth/me", headers=auth_headers)).json()["id"]
+
+        response = await client.get(f"/competitions/{slug}/leaderboard")
+        assert response.json()["entries"] == []
+
+        competition = await CompetitionRepository(db_session).get_by_id(comp_id)
+        submission = Submission(
+            competition_id=comp_id,
+            user_id=user_id,
+            file_path="/fake/preds.csv",
+            file_name="preds.csv",
+            status=SubmissionStatus.PENDING,
+        )
+        db_session.add(submission)
+        await db_session.flush()
+        await SubmissionService(db_session)._score_submission(
+            submission, competition, b"id,prediction\n1,0.1\n2,0.9\n3,0.2\n4,0.8\n"
+        )
+        await db_session.commit()
+        assert submission.status is SubmissionStatus.SCORED
+
+        response = await client.get(f"/competitions/{slug}/leaderboard")
+        entries = response.json()["entries"]
+        assert [(entry["user_id"], entry["best_score"]) for entry in entries] == [(user_id, 1.0)]
+
+    async def test_leaderboard_ndjson(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+        db_session,
+    ):
+        """Clients asking for NDJSON get one entry per line."""
+        import json
+
+        from src.domain.models.submission import Submission, SubmissionStatus
+        from src.domain.models.user import User
+        from src.common.security import hash_password
+
+        create_response = await client.post(
+            "/competitions/",
+            json=sample_competition_data,
+            headers=sponsor_auth_headers,
+        )
+        slug = create_response.json()["slug"]
+        comp_id = create_response.json()["id"]
+
+        users = [
+            User(
+                email=f"ndjson{i}@test.com",
+                username=f"ndjson{i}",
+                hashed_password=hash_password("pass"),
+                display_name=f"NDJSON {i}",
+            )
+            for i in range(2)
+        ]
+        db_session.add_all(users)
+        await db_session.flush()
+        db_session.add_all(
+            Submission(
+                competition_id=comp_id,
+                user_id=user.id,
+                file_path=f"/fake/{user.username}.csv",
+                file_name=f"{user.username}.csv",
+                status=SubmissionStatus.SCORED,
+                public_score=score,
+            )
+            for user, score in zip(users, [0.6, 0.9])
+        )
+        await db_session.commit()
+
+        response = await client.get(
+            f"/competitions/{slug}/leaderboard",
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [(e["rank"], e["username"]) for e in lines] == [
+            (1, "ndjson1"),
+            (2, "ndjson0"),
+        ]
+        assert lines == (await client.get(f"/competitions/{slug}/leaderboard")).json()["entries"]
+
+    async def test_total_participants_beyond_limit(
+        self,
+        client: AsyncClient,
+        sponsor_auth_headers: dict,
+        sample_competition_data: dict,
+        db_session,
+    ):
+        """total_participants counts everyone ranked, not just the returned page."""
+        from src.domain.models.submission import Submission, SubmissionStatus
+        from src.domain.models.user import User
+        from src.common.security import hash_password
+
+        create_response = await client.post(
+            "/competitions/",
+            json=sample_competition_data,
+            headers=sponsor_auth_headers,
+        )
+        slug = create_response.json()["slug"]
+        comp_id = create_response.json()["id"]
+
+        users = [
+            User(
+                email=f"ranked{i}@test.com",
+                username=f"ranked{i}",
+                hashed_password=hash_password("pass"),
+                display_name=f"Ranked {i}",
+            )
+            for i in range(3)
+        ]
+        db_session.add_all(users)
+        await db_session.flush()
+        db_session.add_all(
+            Submission(
+                competition_id=comp_id,
+                user_id=user.id,
+                file_path=f"/fake/{user.username}.csv",
+                file_name=f"{user.username}.csv",
+                status=SubmissionStatus.SCORED,
+                public_score=0.5 + i / 10,
+            )
+            for i, user in enumerate(users)
+        )
+        await db_session.commit()
+
+        response = await client.get(f"/competitions/{slug}/leaderboard?limit=2")
+
+        data = response.json()
+        assert len(data["entries"]) == 2
+        assert data["total_participants"] == 3
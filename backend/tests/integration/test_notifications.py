@@ -171,6 +171,35 @@ class TestNotificationService:
         count = await service.get_unread_count(sample_user.id)
         assert count == 3
 
+    @pytest.mark.asyncio
+    async def test_get_notifications_with_unread_count(self, db_session, sample_user):
+        """A page of notifications should carry the user's total unread count."""
+        from src.domain.services.notification import NotificationService
+
+        service = NotificationService(db_session)
+
+        for i in range(5):
+            await service.create(
+                user_id=sample_user.id,
+                notification_type=NotificationType.SYSTEM,
+                title=f"Notification {i}",
+                message=f"Message {i}",
+            )
+        notifications = await service.get_user_notifications(sample_user.id)
+        await service.mark_as_read(notifications[0].id, sample_user.id)
+
+        page, unread_count = await service.get_user_notifications_with_unread_count(
+            sample_user.id, limit=2
+        )
+        assert len(page) == 2
+        assert unread_count == 4
+
+        page, unread_count = await service.get_user_notifications_with_unread_count(
+            sample_user.id, skip=10
+        )
+        assert page == []
+        assert unread_count == 4
+
     @pytest.mark.asyncio
     async def test_mark_as_read(self, db_session, sample_user):
         """Test marking a notification as read."""
@@ -283,6 +312,11 @@ class TestNotificationAPI:
         assert "unread_count" in data
         assert len(data["notifications"]) == 3
         assert data["unread_count"] == 3
+        first = data["notifications"][0]
+        assert first["type"] == NotificationType.SYSTEM.value
+        assert first["link"] is None
+        assert first["is_read"] is False
+        assert first["read_at"] is None
 
     @pytest.mark.asyncio
     async def test_get_unread_count_endpoint(self, client, auth_headers, db_session):
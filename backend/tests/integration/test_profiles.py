@@ -292,6 +292,80 @@ class TestProfileService:
         assert profile.best_rank == 1
 
 
+    @pytest.mark.asyncio
+    async def test_get_stats_matches_profile(
+        self, db_session, sample_user, sponsor_user, sample_competition
+    ):
+        """Stats computed in SQL should agree with the full profile."""
+        from src.domain.services.profile import ProfileService
+
+        now = datetime.now(timezone.utc)
+        rmse_competition = Competition(
+            title="RMSE Competition",
+            slug="rmse-comp",
+            description="Lower scores win",
+            short_description="RMSE test comp",
+            difficulty=Difficulty.BEGINNER,
+            evaluation_metric="rmse",
+            start_date=now - timedelta(days=30),
+            end_date=now - timedelta(days=1),
+            status=CompetitionStatus.COMPLETED,
+            daily_submission_limit=5,
+            sponsor_id=sponsor_user.id,
+        )
+        other_user = User(
+            email="statsother@example.com",
+            username="statsother",
+            hashed_password=hash_password("password123"),
+            display_name="Stats Other",
+            role=UserRole.PARTICIPANT,
+        )
+        db_session.add_all([rmse_competition, other_user])
+        await db_session.commit()
+
+        for user in [sample_user, other_user]:
+            for comp in [sample_competition, rmse_competition]:
+                db_session.add(Enrollment(user_id=user.id, competition_id=comp.id))
+
+        # sample_user is second on AUC but first on RMSE
+        scores = [
+            (sample_user, sample_competition, 0.70),
+            (sample_user, sample_competition, 0.75),
+            (other_user, sample_competition, 0.90),
+            (sample_user, rmse_competition, 1.5),
+            (other_user, rmse_competition, 2.5),
+        ]
+        for user, comp, score in scores:
+            db_session.add(
+                Submission(
+                    user_id=user.id,
+                    competition_id=comp.id,
+                    file_path="test/file.csv",
+                    file_name="file.csv",
+                    status=SubmissionStatus.SCORED,
+                    public_score=score,
+                    private_score=score,
+                    scored_at=now,
+                )
+            )
+        await db_session.commit()
+
+        service = ProfileService(db_session)
+        for user, best_rank in [(sample_user, 1), (other_user, 1)]:
+            profile = await service.get_profile(user.username)
+            stats = await service.get_stats(user.username)
+
+            assert stats.competitions_entered == profile.competitions_entered == 2
+            assert stats.total_submissions == profile.total_submissions
+            assert stats.best_rank == profile.best_rank == best_rank
+            assert stats.active_competitions == 1
+
+        stats = await service.get_stats(sample_user.username)
+        assert stats.total_submissions == 3
+
+        assert await service.get_stats("nobody") is None
+
+
 class TestProfileAPI:
     """Tests for profile API endpoints."""
 
@@ -1,5 +1,6 @@
 """Integration tests for storage backends."""
 
+import io
 import os
 import tempfile
 from pathlib import Path
@@ -122,6 +123,68 @@ class TestLocalStorageBackend:
         assert len(loaded) == len(content)
         assert loaded == content
 
+    @pytest.mark.asyncio
+    async def test_save_file_streams_from_position(self, storage, temp_dir):
+        """Test saving a file object copies from its current position."""
+        content = b"header" + b"y" * (200 * 1024)
+        fileobj = io.BytesIO(content)
+        fileobj.seek(6)
+        key = "test/streamed.bin"
+
+        path = await storage.save_file(key, fileobj)
+
+        assert path == str(Path(temp_dir) / key)
+        loaded = await storage.load(key)
+        assert loaded == content[6:]
+
+
+    @pytest.mark.asyncio
+    async def test_open_stream_yields_chunks(self, storage):
+        """Test reading a file back in chunks."""
+        content = bytes(range(256)) * 10
+        key = "test/chunked.bin"
+        await storage.save(key, content)
+
+        chunks = [chunk async for chunk in await storage.open_stream(key, chunk_size=1000)]
+
+        assert [len(c) for c in chunks] == [1000, 1000, 560]
+        assert b"".join(chunks) == content
+
+    @pytest.mark.asyncio
+    async def test_open_stream_closed_before_reading(self, storage, monkeypatch):
+        """Closing a stream that was never read should still close the file."""
+        import builtins
+
+        from src.infrastructure.storage import local
+
+        opened = []
+
+        def recording_open(*args, **kwargs):
+            f = builtins.open(*args, **kwargs)
+            opened.append(f)
+            return f
+
+        monkeypatch.setattr(local, "open", recording_open, raising=False)
+        await storage.save("test/unread.bin", b"content")
+
+        stream = await storage.open_stream("test/unread.bin")
+        await stream.aclose()
+
+        assert len(opened) == 1
+        assert opened[0].closed
+
+    @pytest.mark.asyncio
+    async def test_no_presigned_url(self, storage):
+        """Local files are served by the app, so there is no pre-signed URL."""
+        await storage.save("test/file.txt", b"content")
+
+        assert await storage.get_presigned_url("test/file.txt") is None
+
+    @pytest.mark.asyncio
+    async def test_open_stream_nonexistent_raises(self, storage):
+        """Test that opening a missing file fails before iteration."""
+        with pytest.raises(FileNotFoundError):
+            await storage.open_stream("nonexistent/file.txt")
 
 class TestStorageFactory:
     """Tests for the storage factory."""
@@ -82,6 +82,13 @@ class TestTeamService:
         await db_session.refresh(competition)
         return competition
 
+    @pytest.fixture
+    async def team_enrollments(self, db_session, team_leader, team_member_user, team_competition):
+        """Enroll the team leader and member in the team competition."""
+        for user in [team_leader, team_member_user]:
+            db_session.add(Enrollment(user_id=user.id, competition_id=team_competition.id))
+        await db_session.commit()
+
     @pytest.fixture
     async def solo_competition(self, db_session, sponsor_user):
         """Create a competition that doesn't allow teams."""
@@ -251,6 +258,109 @@ class TestTeamService:
         team_info = await service.get_team_info(team.id)
         assert team_info.member_count == 2
 
+    @pytest.mark.asyncio
+    async def test_pending_invitations_with_details(
+        self,
+        db_session,
+        count_statements,
+        team_leader,
+        team_member_user,
+        team_competition,
+        team_enrollments,
+    ):
+        """Pending invitations come back with team and inviter in one query."""
+        from src.domain.services.team import TeamService
+
+        service = TeamService(db_session)
+        team = await service.create_team(
+            "Test Team", team_competition.id, team_leader
+        )
+        invitation = await service.invite_member(
+            team.id, team_member_user.username, team_leader
+        )
+
+        with count_statements() as statements:
+            invitations = await service.get_pending_invitations_with_details(
+                team_member_user
+            )
+
+        assert len(statements) == 1
+        assert len(invitations) == 1
+        assert invitations[0].id == invitation.id
+        assert invitations[0].team_name == "Test Team"
+        assert invitations[0].competition_id == team_competition.id
+        assert invitations[0].inviter_username == team_leader.username
+
+    @pytest.mark.asyncio
+    async def test_list_teams_counts_members_in_one_query(
+        self,
+        db_session,
+        count_statements,
+        team_leader,
+        team_member_user,
+        team_competition,
+        team_enrollments,
+    ):
+        """Listing teams counts members in SQL instead of loading them."""
+        from src.domain.services.team import TeamService
+
+        service = TeamService(db_session)
+        team = await service.create_team("Test Team", team_competition.id, team_leader)
+        db_session.add(
+            TeamMember(team_id=team.id, user_id=team_member_user.id, role=TeamRole.MEMBER)
+        )
+        await db_session.commit()
+
+        with count_statements() as statements:
+            teams = await service.list_teams(team_competition.id)
+
+        assert len(statements) == 1
+        assert [(team.name, team.member_count) for team in teams] == [("Test Team", 2)]
+
+    @pytest.mark.asyncio
+    async def test_get_team_info_in_one_query(
+        self,
+        db_session,
+        count_statements,
+        team_leader,
+        team_member_user,
+        team_competition,
+        team_enrollments,
+    ):
+        """Team details and members come back in a single query."""
+        from src.domain.services.team import TeamService
+
+        service = TeamService(db_session)
+        team = await service.create_team("Test Team", team_competition.id, team_leader)
+        db_session.add(
+            TeamMember(team_id=team.id, user_id=team_member_user.id, role=TeamRole.MEMBER)
+        )
+        await db_session.commit()
+
+        with count_statements() as statements:
+            team_info = await service.get_team_info(team.id)
+
+        assert len(statements) == 1
+        assert team_info.member_count == 2
+        assert team_info.max_size == team_competition.max_team_size
+        assert [(m.username, m.role) for m in team_info.members] == [
+            (team_leader.username, TeamRole.LEADER),
+            (team_member_user.username, TeamRole.MEMBER),
+        ]
+        assert await service.get_team_info(team.id + 1000) is None
+
+        with count_statements() as statements:
+            my_team = await service.get_user_team_info(
+                team_member_user.id, team_competition.id
+            )
+
+        assert len(statements) == 1
+        assert my_team == team_info
+        assert (
+            await service.get_user_team_info(team_member_user.id, team_competition.id + 1000)
+            is None
+        )
+
     @pytest.mark.asyncio
     async def test_decline_invitation(
         self, db_session, team_leader, team_member_user, team_competition
@@ -517,6 +627,15 @@ class TestTeamAPI:
         assert len(teams) >= 1
         assert any(t["name"] == "Listed Team" for t in teams)
 
+        # Team size changes show up despite the cached competition lookup
+        await client.patch(
+            f"/competitions/{comp_slug}",
+            json={"max_team_size": 6},
+            headers=sponsor_auth_headers,
+        )
+        list_response = await client.get(f"/competitions/{comp_slug}/teams")
+        assert {t["max_size"] for t in list_response.json()} == {6}
+
     @pytest.mark.asyncio
     async def test_get_my_team_endpoint(
         self, client, team_auth_headers, sponsor_auth_headers
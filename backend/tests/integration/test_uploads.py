@@ -0,0 +1,87 @@
+"""Integration tests for serving uploaded files."""
+
+import pytest
+from httpx import AsyncClient
+
+
+class TestServeUpload:
+    """Tests for the uploads route."""
+
+    @pytest.fixture(autouse=True)
+    def upload_dir(self, tmp_path, monkeypatch):
+        """Serve uploads from a temporary directory."""
+        from src.config import settings
+
+        root = tmp_path / "uploads"
+        (root / "thumbnails" / "1").mkdir(parents=True)
+        (root / "thumbnails" / "1" / "thumbnail.png").write_bytes(b"\x89PNG")
+        (tmp_path / "uploads-private").mkdir()
+        (tmp_path / "uploads-private" / "secret.csv").write_bytes(b"secret")
+        monkeypatch.setattr(settings, "upload_dir", str(root))
+        return root
+
+    async def test_serves_file(self, client: AsyncClient):
+        """Files under the uploads directory are served with their media type."""
+        response = await client.get("/uploads/thumbnails/1/thumbnail.png")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["content-length"] == "4"
+        assert response.content == b"\x89PNG"
+
+    async def test_revalidation(self, client: AsyncClient, upload_dir):
+        """A matching If-None-Match gets 304 until the file is replaced."""
+        response = await client.get("/uploads/thumbnails/1/thumbnail.png")
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "public, no-cache"
+
+        cached = await client.get(
+            "/uploads/thumbnails/1/thumbnail.png", headers={"If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        (upload_dir / "thumbnails" / "1" / "thumbnail.png").write_bytes(b"\x89PNG new")
+        replaced = await client.get(
+            "/uploads/thumbnails/1/thumbnail.png", headers={"If-None-Match": etag}
+        )
+        assert replaced.status_code == 200
+        assert replaced.headers["etag"] != etag
+
+    async def test_serves_large_file(self, client: AsyncClient, upload_dir):
+        """Files spanning several send chunks arrive intact."""
+        from src.api.routes.uploads import SEND_CHUNK_SIZE
+
+        content = bytes(range(256)) * (SEND_CHUNK_SIZE // 128)
+        (upload_dir / "data.csv").write_bytes(content)
+
+        response = await client.get("/uploads/data.csv")
+
+        assert response.status_code == 200
+        assert response.content == content
+
+    async def test_missing_file(self, client: AsyncClient):
+        """Missing files and directories are not found."""
+        assert (await client.get("/uploads/thumbnails/2/thumbnail.png")).status_code == 404
+        assert (await client.get("/uploads/thumbnails/1")).status_code == 404
+
+    async def test_escaping_upload_dir_denied(self, client: AsyncClient):
+        """Paths resolving outside the uploads directory are rejected."""
+        response = await client.get("/uploads/%2e%2e/uploads-private/secret.csv")
+
+        assert response.status_code == 403
+
+    async def test_internal_redirect(self, client: AsyncClient, monkeypatch):
+        """With X-Accel-Redirect configured, nginx is told which file to send."""
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "x_accel_redirect_prefix", "/_internal/uploads/")
+
+        response = await client.get("/uploads/thumbnails/1/thumbnail.png")
+
+        assert response.status_code == 200
+        assert (
+            response.headers["x-accel-redirect"]
+            == "/_internal/uploads/thumbnails/1/thumbnail.png"
+        )
+        assert response.content == b""
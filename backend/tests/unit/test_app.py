@@ -0,0 +1,36 @@
+"""Unit tests for application setup."""
+
+from httpx import AsyncClient
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.main import app
+
+
+class TestMiddlewareStack:
+    """Tests for the registered middleware."""
+
+    def test_no_base_http_middleware(self):
+        """Middleware should be pure ASGI; BaseHTTPMiddleware adds a task per request."""
+        for middleware in app.user_middleware:
+            assert not issubclass(middleware.cls, BaseHTTPMiddleware), middleware.cls
+
+
+class TestRoutes:
+    """Tests for the registered routes."""
+
+    def test_health_routes_registered_once(self):
+        """Each probe path should be served by exactly one route."""
+        for path in ("/health/live", "/health/ready"):
+            assert len([r for r in app.routes if getattr(r, "path", None) == path]) == 1
+
+    def test_openapi_route_registered_once(self):
+        """The cached OpenAPI document should replace FastAPI's own route."""
+        assert len([r for r in app.routes if getattr(r, "path", None) == app.openapi_url]) == 1
+
+    async def test_openapi_document(self, client: AsyncClient):
+        """The served document should be the schema FastAPI generates."""
+        response = await client.get(app.openapi_url)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == app.openapi()
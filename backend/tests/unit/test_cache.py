@@ -0,0 +1,50 @@
+"""Unit tests for the in-process TTL cache."""
+
+import time
+
+from src.common.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_returns_stored_value(self):
+        """Stored values should be returned until they expire."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_expired_entries_are_evicted(self):
+        """Entries past their time-to-live should not be returned."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1, ttl=0.01)
+
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_oldest_entry_dropped_when_full(self):
+        """The oldest entry should be evicted once maxsize is reached."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_pop_and_clear(self):
+        """Entries can be removed individually or all at once."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.pop("a")
+        assert cache.get("a") is None
+
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,171 @@
+"""Unit tests for the competition file service."""
+
+import asyncio
+import io
+import zipfile
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import UploadFile
+
+from src.domain.services.competition_file import ArchiveMember, CompetitionFileService
+from src.infrastructure.storage.base import start_stream
+
+
+class _SlowStorage:
+    """Storage stub whose opens take a while, recording how many overlap."""
+
+    def __init__(self, contents: dict[str, bytes]) -> None:
+        self.contents = contents
+        self.open_now = 0
+        self.max_open = 0
+
+    async def open_stream(self, key, chunk_size=1024 * 1024):
+        self.open_now += 1
+        self.max_open = max(self.max_open, self.open_now)
+        try:
+            await asyncio.sleep(0.01)
+            if key not in self.contents:
+                raise FileNotFoundError(key)
+        finally:
+            self.open_now -= 1
+        return self._iter(self.contents[key])
+
+    @staticmethod
+    async def _iter(content):
+        yield content
+
+
+class _TrackingStorage:
+    """Storage stub recording which streams have been opened and closed."""
+
+    def __init__(self) -> None:
+        self.opened: list[str] = []
+        self.closed: list[str] = []
+
+    async def open_stream(self, key, chunk_size=1024 * 1024):
+        return await start_stream(self._iter(key))
+
+    async def _iter(self, key):
+        self.opened.append(key)
+        try:
+            yield b""
+            yield key.encode() * 1000
+        finally:
+            self.closed.append(key)
+
+
+def _file(name: str) -> ArchiveMember:
+    return ArchiveMember(
+        filename=name,
+        file_path=f"competition_files/1/{name}",
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+class TestStreamArchive:
+    """Tests for streaming competition files as a zip archive."""
+
+    async def test_members_opened_ahead(self):
+        """Storage opens should overlap and missing files be skipped."""
+        names = [f"file{i}.csv" for i in range(6)]
+        storage = _SlowStorage(
+            {f"competition_files/1/{name}": name.encode() for name in names[1:]}
+        )
+        service = CompetitionFileService(session=None)
+        service.storage = storage
+
+        files = [_file(name) for name in names]
+        data = b"".join([chunk async for chunk in service.stream_archive(files)])
+
+        assert storage.max_open > 1
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            assert archive.namelist() == names[1:]
+            assert archive.read("file3.csv") == b"file3.csv"
+
+    async def test_precompressed_members_stored(self):
+        """Already-compressed formats should be stored, others deflated."""
+        contents = {
+            "competition_files/1/data.parquet": b"PAR1" * 100,
+            "competition_files/1/train.csv": b"id,x\n" * 100,
+        }
+        service = CompetitionFileService(session=None)
+        service.storage = _SlowStorage(contents)
+
+        files = [_file("data.parquet"), _file("train.csv")]
+        data = b"".join([chunk async for chunk in service.stream_archive(files)])
+
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            assert archive.getinfo("data.parquet").compress_type == zipfile.ZIP_STORED
+            assert archive.getinfo("train.csv").compress_type == zipfile.ZIP_DEFLATED
+            assert archive.read("data.parquet") == b"PAR1" * 100
+
+
+    async def test_abandoned_archive_closes_streams(self):
+        """Streams opened ahead should be closed when the client goes away."""
+        storage = _TrackingStorage()
+        service = CompetitionFileService(session=None)
+        service.storage = storage
+
+        archive = service.stream_archive([_file(f"file{i}.csv") for i in range(6)])
+        await anext(archive)
+        await archive.aclose()
+
+        assert len(storage.opened) > 1
+        assert sorted(storage.closed) == sorted(storage.opened)
+
+
+class _RecordingStorage:
+    """Storage stub that only accepts streamed saves."""
+
+    def __init__(self) -> None:
+        self.saved: dict[str, bytes] = {}
+
+    async def save_file(self, key, fileobj):
+        self.saved[key] = fileobj.read()
+        return f"/data/{key}"
+
+
+class _Session:
+    """Session stub that accepts a new record without a database."""
+
+    def add(self, obj):
+        self.obj = obj
+
+    async def commit(self):
+        pass
+
+    async def refresh(self, obj):
+        pass
+
+
+class TestUpload:
+    """Tests for uploading competition files."""
+
+    async def test_upload_streams_to_storage(self):
+        """Uploads should be saved from the spooled file, not read into memory."""
+        service = CompetitionFileService(session=_Session())
+        service.storage = _RecordingStorage()
+        upload = UploadFile(io.BytesIO(b"id,x\n1,2\n"), filename="train.csv")
+
+        competition_file = await service.upload(competition_id=1, file=upload)
+
+        [(key, content)] = service.storage.saved.items()
+        assert key.startswith("competition_files/1/") and key.endswith("_train.csv")
+        assert content == b"id,x\n1,2\n"
+        assert competition_file.file_size == len(content)
+
+    async def test_oversized_upload_rejected(self):
+        """Uploads over the size limit should be rejected before storage."""
+        service = CompetitionFileService(session=_Session())
+        service.storage = _RecordingStorage()
+        upload = UploadFile(
+            io.BytesIO(b""),
+            filename="big.csv",
+            size=CompetitionFileService.MAX_FILE_SIZE + 1,
+        )
+
+        with pytest.raises(ValueError, match="exceeds"):
+            await service.upload(competition_id=1, file=upload)
+
+        assert service.storage.saved == {}
@@ -0,0 +1,102 @@
+"""Unit tests for competition response schemas."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from src.api.schemas.competition import CompetitionListResponse, CompetitionResponse
+from src.config import settings
+from src.domain.models.competition import CompetitionStatus, Difficulty
+
+
+def _competition(**overrides) -> SimpleNamespace:
+    now = datetime.now(timezone.utc)
+    values = {
+        "id": 1,
+        "title": "Test Competition",
+        "slug": "test-competition",
+        "description": "A test competition description.",
+        "short_description": "A short description.",
+        "sponsor_id": 2,
+        "status": CompetitionStatus.ACTIVE,
+        "start_date": now,
+        "end_date": now,
+        "difficulty": Difficulty.BEGINNER,
+        "max_team_size": 1,
+        "daily_submission_limit": 5,
+        "evaluation_metric": "accuracy",
+        "evaluation_description": None,
+        "is_public": True,
+        "solution_path": None,
+        "thumbnail_path": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestCompetitionResponse:
+    """Tests for building responses from competition models."""
+
+    def test_derives_fields_from_paths(self):
+        """Storage paths should become a truth-set flag and a thumbnail URL."""
+        competition = _competition(
+            solution_path="/data/solution.csv",
+            thumbnail_path=f"{settings.upload_dir}/thumbnails/1/thumbnail.png",
+        )
+
+        response = CompetitionResponse.model_validate(competition)
+
+        assert response.has_truth_set is True
+        assert response.thumbnail_url == "/api/uploads/thumbnails/1/thumbnail.png"
+
+    def test_thumbnail_outside_upload_dir(self):
+        """Paths that only share a name prefix with the uploads directory have no URL."""
+        competition = _competition(
+            thumbnail_path=f"{settings.upload_dir.rstrip('/')}-old/thumbnails/1/thumbnail.png",
+        )
+
+        response = CompetitionResponse.model_validate(competition)
+
+        assert response.thumbnail_url is None
+
+    def test_missing_paths(self):
+        """Competitions without uploads should have no truth set or thumbnail."""
+        response = CompetitionResponse.model_validate(_competition())
+
+        assert response.has_truth_set is False
+        assert response.thumbnail_url is None
+
+    def test_serializes_field_names(self):
+        """Derived fields should be serialized under their own names."""
+        data = CompetitionListResponse.model_validate(_competition()).model_dump(by_alias=True)
+
+        assert "thumbnail_url" in data
+        assert "thumbnail_path" not in data
+
+    def test_from_competition_matches_validation(self):
+        """Building without validation should serialize like a validated response."""
+        competition = _competition(
+            solution_path="/data/solution.csv",
+            thumbnail_path=f"{settings.upload_dir}/thumbnails/1/thumbnail.png",
+        )
+
+        built = CompetitionResponse.from_competition(competition).model_dump(mode="json")
+        validated = CompetitionResponse.model_validate(competition).model_dump(mode="json")
+
+        assert built == validated
+
+
+class TestCompetitionListResponse:
+    """Tests for building list items from competition models."""
+
+    def test_from_competition_matches_validation(self):
+        """Building without validation should serialize like a validated item."""
+        competition = _competition(
+            thumbnail_path=f"{settings.upload_dir}/thumbnails/1/thumbnail.png",
+        )
+
+        built = CompetitionListResponse.from_competition(competition).model_dump(mode="json")
+        validated = CompetitionListResponse.model_validate(competition).model_dump(mode="json")
+
+        assert built == validated
@@ -0,0 +1,55 @@
+"""Unit tests for competition service helpers."""
+
+import io
+
+import pytest
+
+from src.domain.services.competition import _is_supported_image, _validate_truth_set
+
+
+class TestValidateTruthSet:
+    """Tests for streaming truth set validation."""
+
+    def test_counts_data_rows(self):
+        """Valid CSV should return the number of non-blank data rows."""
+        fileobj = io.BytesIO(b"id,target\n1,0\n\n2,1\n")
+
+        assert _validate_truth_set(fileobj) == 2
+        assert not fileobj.closed
+
+    def test_missing_columns(self):
+        """CSV without id and target columns should be rejected."""
+        with pytest.raises(ValueError, match="must have 'id' and 'target'"):
+            _validate_truth_set(io.BytesIO(b"id,label\n1,0\n"))
+
+    def test_no_rows(self):
+        """CSV with only a header should be rejected."""
+        with pytest.raises(ValueError, match="no data rows"):
+            _validate_truth_set(io.BytesIO(b"id,target\n"))
+
+    def test_invalid_utf8_after_header(self):
+        """Invalid UTF-8 anywhere in the file should be rejected."""
+        fileobj = io.BytesIO(b"id,target\n" + b"1,0\n" * 10_000 + b"2,\xff\n")
+
+        with pytest.raises(ValueError, match="UTF-8"):
+            _validate_truth_set(fileobj)
+
+
+class TestIsSupportedImage:
+    """Tests for thumbnail magic-byte sniffing."""
+
+    @pytest.mark.parametrize(
+        "header",
+        [
+            b"\x89PNG\r\n\x1a\n\x00\x00\x00\r",
+            b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01",
+            b"RIFF\x24\x00\x00\x00WEBP",
+        ],
+    )
+    def test_accepts_supported_formats(self, header: bytes):
+        """PNG, JPEG, and WebP headers should be accepted."""
+        assert _is_supported_image(header) is True
+
+    def test_rejects_other_content(self):
+        """Non-image content with an image extension should be rejected."""
+        assert _is_supported_image(b"<html><body>") is False
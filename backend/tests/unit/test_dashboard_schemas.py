@@ -0,0 +1,74 @@
+"""Unit tests for dashboard response schemas."""
+
+from datetime import datetime, timezone
+
+from src.api.schemas.dashboard import DashboardResponse
+from src.domain.models.competition import CompetitionStatus
+from src.domain.models.submission import SubmissionStatus
+from src.domain.services.dashboard import (
+    DashboardData,
+    DashboardNotification,
+    DashboardStats,
+    EnrolledCompetition,
+    RecentSubmission,
+)
+
+
+class TestDashboardResponse:
+    """Tests for building the dashboard response from service data."""
+
+    def test_from_data_matches_validation(self):
+        """Building without validation should serialize like a validated response."""
+        now = datetime.now(timezone.utc)
+        dashboard = DashboardData(
+            user_id=1,
+            username="user",
+            display_name="User",
+            active_competitions=[
+                EnrolledCompetition(
+                    id=2,
+                    title="Competition",
+                    slug="competition",
+                    status=CompetitionStatus.ACTIVE,
+                    end_date=now,
+                    days_remaining=3,
+                    user_submission_count=4,
+                    user_best_score=0.9,
+                    user_rank=1,
+                    total_participants=5,
+                )
+            ],
+            recent_submissions=[
+                RecentSubmission(
+                    id=3,
+                    competition_id=2,
+                    competition_title="Competition",
+                    competition_slug="competition",
+                    status=SubmissionStatus.SCORED,
+                    public_score=0.9,
+                    submitted_at=now,
+                )
+            ],
+            notifications=[
+                DashboardNotification(
+                    id=4,
+                    type="system",
+                    title="Hello",
+                    message="Welcome",
+                    link=None,
+                    is_read=False,
+                    created_at=now,
+                )
+            ],
+            stats=DashboardStats(
+                total_competitions=1,
+                active_competitions=1,
+                total_submissions=1,
+                unread_notifications=1,
+            ),
+        )
+
+        built = DashboardResponse.from_data(dashboard).model_dump(mode="json")
+        validated = DashboardResponse.model_validate(dashboard).model_dump(mode="json")
+
+        assert built == validated
@@ -0,0 +1,57 @@
+"""Unit tests for the data dictionary service."""
+
+from types import SimpleNamespace
+
+from src.domain.services.data_dictionary import DataDictionaryService
+
+
+class _Storage:
+    """Storage stub serving fixed file contents."""
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    async def load(self, key):
+        return self.content
+
+
+def _service(content: bytes) -> DataDictionaryService:
+    service = DataDictionaryService(session=None)
+    service.storage = _Storage(content)
+    return service
+
+
+def _file() -> SimpleNamespace:
+    return SimpleNamespace(filename="train.csv", file_path="/data/competition_files/1/train.csv")
+
+
+class TestCsvPreview:
+    """Tests for previewing CSV files."""
+
+    async def test_values_grouped_by_column(self):
+        """Each column should carry its values in row order."""
+        service = _service(b"id,target\n1,0\n2,1\n\n3,0\n")
+
+        result = await service.get_csv_preview(_file(), max_rows=2)
+
+        assert result.columns == ["id", "target"]
+        assert result.data == {"id": ["1", "2"], "target": ["0", "1"]}
+        assert result.total_rows == 3
+        assert result.truncated is True
+
+    async def test_ragged_rows(self):
+        """Short rows are padded and extra fields dropped."""
+        service = _service(b"id,target\n1\n2,1,extra\n")
+
+        result = await service.get_csv_preview(_file())
+
+        assert result.data == {"id": ["1", "2"], "target": ["", "1"]}
+        assert result.truncated is False
+
+    async def test_empty_file(self):
+        """A file with no header has no columns or rows."""
+        result = await _service(b"").get_csv_preview(_file())
+
+        assert result.columns == []
+        assert result.data == {}
+        assert result.total_rows == 0
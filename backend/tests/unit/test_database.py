@@ -0,0 +1,59 @@
+"""Unit tests for request-scoped database sessions."""
+
+from src.config import settings
+from src.infrastructure.database import DBSessionMiddleware, _connect_args, get_db
+
+
+async def _first_session():
+    gen = get_db()
+    session = await anext(gen)
+    await gen.aclose()
+    return session
+
+
+class TestDBSessionMiddleware:
+    """Tests for sharing one session per request."""
+
+    async def test_get_db_shares_request_session(self):
+        """get_db should yield the same session within one request."""
+        sessions = []
+
+        async def app(scope, receive, send):
+            sessions.append(await _first_session())
+            sessions.append(await _first_session())
+
+        await DBSessionMiddleware(app)({"type": "http"}, None, None)
+
+        assert sessions[0] is sessions[1]
+
+    async def test_sessions_differ_between_requests(self):
+        """Each request should get its own session."""
+        sessions = []
+
+        async def app(scope, receive, send):
+            sessions.append(await _first_session())
+
+        middleware = DBSessionMiddleware(app)
+        await middleware({"type": "http"}, None, None)
+        await middleware({"type": "http"}, None, None)
+
+        assert sessions[0] is not sessions[1]
+
+
+class TestConnectArgs:
+    """Tests for driver arguments."""
+
+    def test_direct_connection_uses_driver_defaults(self):
+        """Without pgbouncer, asyncpg's statement caches stay enabled."""
+        assert _connect_args() == {}
+
+    def test_pgbouncer_disables_statement_caches(self, monkeypatch):
+        """Behind pgbouncer, prepared statements are neither cached nor name-reused."""
+        monkeypatch.setattr(settings, "db_pgbouncer", True)
+
+        args = _connect_args()
+
+        assert args["statement_cache_size"] == 0
+        assert args["prepared_statement_cache_size"] == 0
+        name_func = args["prepared_statement_name_func"]
+        assert name_func() != name_func()
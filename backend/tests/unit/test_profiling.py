@@ -0,0 +1,66 @@
+"""Unit tests for the request profiling middleware."""
+
+import pytest
+
+from src.api.profiling import ProfilingMiddleware
+
+
+async def _call(middleware, query_string=b"", headers=()):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": query_string,
+        "headers": list(headers),
+    }
+    await middleware(scope, None, send)
+    return messages
+
+
+async def _app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+class TestProfilingMiddleware:
+    """Tests for gating request profiling."""
+
+    async def test_passes_through_without_profile_param(self):
+        """Requests without ?profile should be handled normally."""
+        messages = await _call(ProfilingMiddleware(_app))
+
+        assert messages[-1]["body"] == b"ok"
+
+    async def test_ignores_profile_param_without_token(self):
+        """Anonymous requests should not be able to trigger profiling."""
+        messages = await _call(ProfilingMiddleware(_app), query_string=b"profile=1")
+
+        assert messages[-1]["body"] == b"ok"
+
+    async def test_ignores_profile_param_with_invalid_token(self):
+        """A malformed bearer token should not trigger profiling."""
+        messages = await _call(
+            ProfilingMiddleware(_app),
+            query_string=b"profile=1",
+            headers=[(b"authorization", b"Bearer not-a-token")],
+        )
+
+        assert messages[-1]["body"] == b"ok"
+
+    async def test_admin_gets_profile_report(self, monkeypatch):
+        """An admin request with ?profile=1 should return the HTML report."""
+        pytest.importorskip("pyinstrument")
+
+        async def is_admin(self, scope):
+            return True
+
+        monkeypatch.setattr(ProfilingMiddleware, "_is_admin", is_admin)
+        messages = await _call(ProfilingMiddleware(_app), query_string=b"profile=1")
+
+        assert b"text/html" in dict(messages[0]["headers"])[b"content-type"]
+        assert messages[-1]["body"] != b"ok"
@@ -0,0 +1,34 @@
+"""Unit tests for the shared response classes."""
+
+from datetime import datetime, timedelta, timezone
+
+import orjson
+
+from src.api.responses import ORJSONResponse
+from src.api.schemas.submission import SubmissionListResponse
+from src.domain.models.submission import SubmissionStatus
+
+
+class TestORJSONResponse:
+    """Tests for rendering python-mode dumps."""
+
+    def test_matches_pydantic_json(self):
+        """Rendering model_dump() should give the same JSON as mode="json"."""
+        for created_at in (
+            datetime(2026, 1, 1, tzinfo=timezone.utc),
+            datetime(2026, 1, 1, 1, 2, 3, 4500, tzinfo=timezone.utc),
+            datetime(2026, 1, 1, tzinfo=timezone(timedelta(hours=2))),
+            datetime(2026, 1, 1, 5, 6, 7, 8),
+        ):
+            item = SubmissionListResponse(
+                id=1,
+                file_name="submission.csv",
+                status=SubmissionStatus.SCORED,
+                public_score=0.5,
+                created_at=created_at,
+            )
+
+            body = ORJSONResponse(item.model_dump()).body
+
+            assert body == orjson.dumps(item.model_dump(mode="json"))
+            assert body == item.model_dump_json().encode()
@@ -0,0 +1,60 @@
+"""Unit tests for rule response schemas."""
+
+from datetime import datetime, timezone
+
+from src.api.schemas.rules import CompetitionRuleResponse
+from src.domain.models.competition_rule import CompetitionRule
+from src.domain.models.rule_template import RuleTemplate
+
+
+def _rule(**overrides) -> CompetitionRule:
+    now = datetime.now(timezone.utc)
+    values = {
+        "id": 1,
+        "competition_id": 2,
+        "rule_template_id": None,
+        "is_enabled": True,
+        "parameter_value": None,
+        "custom_title": None,
+        "custom_text": None,
+        "display_order": 0,
+        "created_at": now,
+        "updated_at": now,
+    }
+    values.update(overrides)
+    return CompetitionRule(**values)
+
+
+class TestCompetitionRuleResponse:
+    """Tests for building responses from competition rules."""
+
+    def test_from_rule_with_template(self):
+        """Template rules should render their parameter and nest the template."""
+        template = RuleTemplate(
+            id=3,
+            category="Teams",
+            title="Team Size Limit",
+            template_text="Teams may have a maximum of {n} members",
+            has_parameter=True,
+            parameter_type="number",
+            parameter_label="Max members",
+            display_order=1,
+        )
+        rule = _rule(rule_template_id=3, parameter_value="4", template=template)
+
+        data = CompetitionRuleResponse.from_rule(rule).model_dump(mode="json")
+
+        assert data == CompetitionRuleResponse.model_validate(data).model_dump(mode="json")
+        assert data["title"] == "Team Size Limit"
+        assert data["rendered_text"] == "Teams may have a maximum of 4 members"
+        assert data["template"]["id"] == 3
+
+    def test_from_rule_custom(self):
+        """Custom rules have no template."""
+        rule = _rule(custom_title="Be kind", custom_text="No harassment.")
+
+        data = CompetitionRuleResponse.from_rule(rule).model_dump(mode="json")
+
+        assert data["title"] == "Be kind"
+        assert data["rendered_text"] == "No harassment."
+        assert data["template"] is None
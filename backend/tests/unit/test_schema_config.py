@@ -0,0 +1,35 @@
+"""Unit tests for configuration shared by all API schemas."""
+
+import importlib
+import inspect
+import pkgutil
+
+import pytest
+from pydantic import BaseModel
+
+import src.api.schemas
+
+
+def _schema_classes() -> list[type[BaseModel]]:
+    classes = []
+    for module_info in pkgutil.iter_modules(src.api.schemas.__path__):
+        module = importlib.import_module(f"src.api.schemas.{module_info.name}")
+        for _, obj in inspect.getmembers(module, inspect.isclass):
+            if issubclass(obj, BaseModel) and obj.__module__ == module.__name__:
+                classes.append(obj)
+    return classes
+
+
+@pytest.mark.parametrize("schema", _schema_classes(), ids=lambda schema: schema.__name__)
+def test_schema_skips_redundant_validation(schema: type[BaseModel]):
+    """Schemas are built per request and never mutated, so validation runs once.
+
+    Responses nest instances built with model_construct; they are only passed
+    through untouched while revalidate_instances stays at "never".
+    """
+    config = schema.model_config
+
+    assert config.get("defer_build") is True
+    assert config.get("revalidate_instances", "never") == "never"
+    assert not config.get("validate_default", False)
+    assert not config.get("validate_assignment", False)
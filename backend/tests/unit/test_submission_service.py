@@ -0,0 +1,35 @@
+"""Unit tests for the submission service."""
+
+import io
+
+from fastapi import UploadFile
+
+from src.domain.services.submission import SubmissionService
+
+
+class _RecordingStorage:
+    """Storage stub that only accepts streamed saves."""
+
+    def __init__(self) -> None:
+        self.saved: dict[str, bytes] = {}
+
+    async def save_file(self, key, fileobj):
+        self.saved[key] = fileobj.read()
+        return f"/data/{key}"
+
+
+class TestSaveFile:
+    """Tests for saving submission files."""
+
+    async def test_saved_from_start_of_spooled_upload(self):
+        """A partly read upload should still be streamed to storage in full."""
+        service = SubmissionService(session=None, storage=_RecordingStorage())
+        upload = UploadFile(io.BytesIO(b"id,prediction\n1,0.5\n"), filename="sub.csv")
+        await upload.read()
+
+        path = await service._save_file(competition_id=1, user_id=2, file=upload)
+
+        [(key, content)] = service.storage.saved.items()
+        assert key.startswith("submissions/1/2/") and key.endswith(".csv")
+        assert path == f"/data/{key}"
+        assert content == b"id,prediction\n1,0.5\n"
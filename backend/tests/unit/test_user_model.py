@@ -0,0 +1,22 @@
+"""Unit tests for the user model."""
+
+import src.domain.models  # noqa: F401  (configure all mappers)
+from src.domain.models.user import User, UserRole
+
+
+class TestUserIsAdmin:
+    """Tests for the cached is_admin flag."""
+
+    def test_reflects_role(self):
+        """is_admin should be true only for admins."""
+        assert User(role=UserRole.ADMIN).is_admin is True
+        assert User(role=UserRole.SPONSOR).is_admin is False
+
+    def test_reset_when_role_changes(self):
+        """Changing the role should recompute is_admin."""
+        user = User(role=UserRole.PARTICIPANT)
+        assert user.is_admin is False
+
+        user.role = UserRole.ADMIN
+
+        assert user.is_admin is True
@@ -0,0 +1,25 @@
+"""Unit tests for common utilities."""
+
+import pytest
+
+from src.common.utils import slugify
+
+
+class TestSlugify:
+    """Tests for slug generation."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("My Competition Name", "my-competition-name"),
+            ("Test #1: Special Characters!", "test-1-special-characters"),
+            ("  snake_case\tand\nspaces  ", "snake-case-and-spaces"),
+            ("already--hyphenated---title", "already-hyphenated-title"),
+            ("Café Crème Prédiction", "cafe-creme-prediction"),
+            ("Ünïcödé — dashes", "unicode-dashes"),
+            ("!!!", ""),
+        ],
+    )
+    def test_slugify(self, text: str, expected: str):
+        """Titles should become lowercase, hyphen-separated ASCII slugs."""
+        assert slugify(text) == expected
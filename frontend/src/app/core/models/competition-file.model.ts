@@ -36,7 +36,8 @@ export interface ColumnInfo {
 
 export interface FilePreview {
   columns: string[];
-  rows: Record<string, string>[];
+  /** Values grouped by column: data[column][i] is row i's value. */
+  data: Record<string, string[]>;
   total_rows: number;
   truncated: boolean;
 }
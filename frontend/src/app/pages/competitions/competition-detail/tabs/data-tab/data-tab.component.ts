@@ -156,10 +156,10 @@ import { AuthService } from '../../../../../core/services/auth.service';
                                 </tr>
                               </thead>
                               <tbody>
-                                @for (row of preview.rows; track $index) {
+                                @for (i of previewRowIndexes; track i) {
                                   <tr>
                                     @for (col of preview.columns; track col) {
-                                      <td>{{ row[col] }}</td>
+                                      <td>{{ preview.data[col][i] }}</td>
                                     }
                                   </tr>
                                 }
@@ -168,7 +168,7 @@ import { AuthService } from '../../../../../core/services/auth.service';
                           </div>
                           <div class="preview-footer">
                             <span class="row-count">
-                              Showing {{ preview.rows.length }} of {{ preview.total_rows | number }} rows
+                              Showing {{ previewRowIndexes.length }} of {{ preview.total_rows | number }} rows
                               @if (preview.truncated) {
                                 <span class="truncated-badge">Truncated</span>
                               }
@@ -917,6 +917,7 @@ export class DataTabComponent implements OnInit {
   downloading = false;
 
   preview: FilePreview | null = null;
+  previewRowIndexes: number[] = [];
   previewLoading = false;
 
   dictionary: DataDictionaryEntry[] = [];
@@ -969,6 +970,9 @@ export class DataTabComponent implements OnInit {
     this.fileService.getPreview(this.slug, file.id).subscribe({
       next: (preview) => {
         this.preview = preview;
+        const firstColumn = preview.columns[0];
+        const rowCount = firstColumn ? preview.data[firstColumn].length : 0;
+        this.previewRowIndexes = Array.from({ length: rowCount }, (_, i) => i);
         this.previewLoading = false;
       },
       error: () => {